@@ -3,6 +3,7 @@
 import sys
 
 from tarantool.connection import Connection
+from tarantool.async_connection import AsyncConnection
 from tarantool.mesh_connection import MeshConnection
 from tarantool.const import (
     SOCKET_TIMEOUT,
@@ -27,6 +28,8 @@ from tarantool.schema import (
     SchemaError
 )
 
+from tarantool.schema_cache import SchemaRegistry
+
 from tarantool.utils import (
     ENCODING_DEFAULT,
 )
@@ -106,6 +109,37 @@ def connect(host="localhost", port=33013, user=None, password=None,
                       ssl_ciphers=ssl_ciphers)
 
 
+async def connect_async(host="localhost", port=33013, user=None, password=None,
+                        encoding=ENCODING_DEFAULT, transport=DEFAULT_TRANSPORT,
+                        ssl_key_file=DEFAULT_SSL_KEY_FILE,
+                        ssl_cert_file=DEFAULT_SSL_CERT_FILE,
+                        ssl_ca_file=DEFAULT_SSL_CA_FILE,
+                        ssl_ciphers=DEFAULT_SSL_CIPHERS):
+    """
+    Create an asyncio connection to the Tarantool server. Parameters
+    are the same as for :func:`~tarantool.connect`.
+
+    :rtype: :class:`~tarantool.AsyncConnection`
+
+    :raise: :meth:`~tarantool.AsyncConnection.connect` exceptions
+    """
+
+    conn = AsyncConnection(host, port,
+                           user=user,
+                           password=password,
+                           socket_timeout=SOCKET_TIMEOUT,
+                           reconnect_max_attempts=RECONNECT_MAX_ATTEMPTS,
+                           reconnect_delay=RECONNECT_DELAY,
+                           encoding=encoding,
+                           transport=transport,
+                           ssl_key_file=ssl_key_file,
+                           ssl_cert_file=ssl_cert_file,
+                           ssl_ca_file=ssl_ca_file,
+                           ssl_ciphers=ssl_ciphers)
+    await conn.connect()
+    return conn
+
+
 def connectmesh(addrs=({'host': 'localhost', 'port': 3301},), user=None,
                 password=None, encoding=ENCODING_DEFAULT):
     """
@@ -138,7 +172,8 @@ def connectmesh(addrs=({'host': 'localhost', 'port': 3301},), user=None,
                           encoding=encoding)
 
 
-__all__ = ['connect', 'Connection', 'connectmesh', 'MeshConnection', 'Schema',
+__all__ = ['connect', 'Connection', 'connect_async', 'AsyncConnection',
+           'connectmesh', 'MeshConnection', 'Schema', 'SchemaRegistry',
            'Error', 'DatabaseError', 'NetworkError', 'NetworkWarning',
            'SchemaError', 'dbapi', 'Datetime', 'Interval', 'IntervalAdjust',
            'ConnectionPool', 'Mode', 'BoxError',]
@@ -0,0 +1,1488 @@
+"""
+This module provides asyncio API for interaction with a Tarantool
+server.
+"""
+
+import asyncio
+import errno
+import itertools
+import socket
+import threading
+import time
+from typing import Union
+
+import msgpack
+
+from tarantool.connection import Connection
+from tarantool.response import (
+    unpacker_factory as default_unpacker_factory,
+    unpack_response,
+)
+from tarantool.request import (
+    packer_factory as default_packer_factory,
+    Request,
+    RequestAuthenticate,
+    RequestPing,
+    RequestProtocolVersion,
+)
+from tarantool.const import (
+    CONNECTION_TIMEOUT,
+    SOCKET_TIMEOUT,
+    RECONNECT_MAX_ATTEMPTS,
+    RECONNECT_DELAY,
+    DEFAULT_TRANSPORT,
+    SSL_TRANSPORT,
+    DEFAULT_SSL_KEY_FILE,
+    DEFAULT_SSL_CERT_FILE,
+    DEFAULT_SSL_CA_FILE,
+    DEFAULT_SSL_CIPHERS,
+    DEFAULT_SSL_PASSWORD,
+    DEFAULT_SSL_PASSWORD_FILE,
+    IPROTO_GREETING_SIZE,
+    IPROTO_CHUNK,
+    IPROTO_SYNC,
+    CONNECTOR_IPROTO_VERSION,
+    CONNECTOR_FEATURES,
+    IPROTO_FEATURE_STREAMS,
+    IPROTO_FEATURE_TRANSACTIONS,
+    IPROTO_FEATURE_ERROR_EXTENSION,
+    IPROTO_FEATURE_WATCHERS,
+    SPACE_SPACE,
+    SPACE_INDEX,
+    SPACE_VSPACE,
+    SPACE_VINDEX,
+    INDEX_SPACE_PRIMARY,
+    INDEX_SPACE_NAME,
+)
+from tarantool.error import (
+    NetworkError,
+    SslError,
+    DatabaseError,
+    ConfigurationError,
+    SchemaError,
+    NetworkWarning,
+    SchemaCacheWarning,
+    CrudModuleError,
+    CrudModuleManyError,
+    SchemaReloadException,
+    ER_NO_SUCH_PROC,
+    ER_ACCESS_DENIED,
+    warn
+)
+from tarantool.schema import (
+    Schema,
+    SchemaSpace,
+    SchemaIndex,
+    index_not_found,
+    space_not_found,
+    to_unicode,
+)
+from tarantool.schema_cache import SchemaCache
+from tarantool.utils import (
+    greeting_decode,
+    ENCODING_DEFAULT,
+)
+from tarantool.crud import (
+    CrudResult,
+    CrudError,
+)
+
+
+class AsyncConnection(object):
+    """
+    Represents an asyncio connection to a Tarantool server.
+
+    Requests of many coroutines are multiplexed on a single socket:
+    responses are matched to requests by IPROTO_SYNC. Methods have
+    the same semantics as :class:`~tarantool.Connection` ones, but
+    they are coroutines.
+
+    .. code-block:: python
+
+        >>> conn = await tarantool.connect_async('localhost', 3301)
+        >>> await asyncio.gather(conn.select('demo', 'AAAA'),
+        ...                      conn.call('box.info'))
+        >>> await conn.close()
+
+    Space and index names are resolved with the schema cache. If
+    a name is missing in the cache, the whole schema is fetched
+    again.
+    """
+
+    def __init__(self, host, port,
+                 user=None,
+                 password=None,
+                 socket_timeout=SOCKET_TIMEOUT,
+                 reconnect_max_attempts=RECONNECT_MAX_ATTEMPTS,
+                 reconnect_delay=RECONNECT_DELAY,
+                 encoding=ENCODING_DEFAULT,
+                 use_list=True,
+                 call_16=False,
+                 connection_timeout=CONNECTION_TIMEOUT,
+                 transport=DEFAULT_TRANSPORT,
+                 ssl_key_file=DEFAULT_SSL_KEY_FILE,
+                 ssl_cert_file=DEFAULT_SSL_CERT_FILE,
+                 ssl_ca_file=DEFAULT_SSL_CA_FILE,
+                 ssl_ciphers=DEFAULT_SSL_CIPHERS,
+                 ssl_password=DEFAULT_SSL_PASSWORD,
+                 ssl_password_file=DEFAULT_SSL_PASSWORD_FILE,
+                 packer_factory=default_packer_factory,
+                 unpacker_factory=default_unpacker_factory,
+                 auth_type=None,
+                 fetch_schema=True,
+                 lazy_responses=False,
+                 raw_responses=False,
+                 named_rows=False,
+                 schema_cache_dir=None):
+        """
+        Parameters have the same meaning as for
+        :class:`~tarantool.Connection`. The connection is not
+        established on initialization: await
+        :meth:`~tarantool.AsyncConnection.connect` or use
+        :func:`~tarantool.connect_async`.
+
+        :param socket_timeout: Timeout to wait for a response, in
+            seconds.
+        :type socket_timeout: :obj:`float` or :obj:`None`, optional
+
+        :raise: :exc:`~tarantool.error.ConfigurationError`
+        """
+
+        if msgpack.version >= (1, 0, 0) and encoding not in (None, 'utf-8'):
+            raise ConfigurationError("msgpack>=1.0.0 only supports None and " +
+                                     "'utf-8' encoding option values")
+        if fetch_schema not in (True, False, 'lazy'):
+            raise ConfigurationError("fetch_schema must be True, False " +
+                                     "or 'lazy'")
+
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.socket_timeout = socket_timeout
+        self.reconnect_delay = reconnect_delay
+        self.reconnect_max_attempts = reconnect_max_attempts
+        self.fetch_schema = fetch_schema
+        self.lazy_responses = lazy_responses
+        self.raw_responses = raw_responses
+        self.named_rows = named_rows
+        self.schema_cache = SchemaCache(schema_cache_dir) \
+            if schema_cache_dir is not None else None
+        self._server_schema_version = None
+        self._raw_syncs = set()
+        self.schema = None
+        self.schema_version = 0
+        self.connected = False
+        self.error = True
+        self.encoding = encoding
+        self.use_list = use_list
+        self.call_16 = call_16
+        self.connection_timeout = connection_timeout
+        self.transport = transport
+        self.ssl_key_file = ssl_key_file
+        self.ssl_cert_file = ssl_cert_file
+        self.ssl_ca_file = ssl_ca_file
+        self.ssl_ciphers = ssl_ciphers
+        self.ssl_password = ssl_password
+        self.ssl_password_file = ssl_password_file
+        self._protocol_version = None
+        self._features = {
+            IPROTO_FEATURE_STREAMS: False,
+            IPROTO_FEATURE_TRANSACTIONS: False,
+            IPROTO_FEATURE_ERROR_EXTENSION: False,
+            IPROTO_FEATURE_WATCHERS: False,
+        }
+        self._packer_factory_impl = packer_factory
+        self._unpacker_factory_impl = unpacker_factory
+        self._packers = threading.local()
+        self._unpacker = None
+        self._unpacker_options = None
+        self._client_auth_type = auth_type
+        self._server_auth_type = None
+        self._sync_counter = itertools.count(1)
+        self._reader = None
+        self._writer = None
+        self._read_task = None
+        self._waiters = {}
+        self._connect_lock = None
+        self._schema_lock = None
+
+    # Request builders and helpers do not perform any I/O, share them
+    # with the blocking connection.
+    _ssl_context = Connection._ssl_context
+    _ssl_load_cert_chain = Connection._ssl_load_cert_chain
+    _get_auth_type = Connection._get_auth_type
+    _schemaful_connection_check = Connection._schemaful_connection_check
+    _ops_process = Connection._ops_process
+    _request_call = Connection._request_call
+    _request_eval = Connection._request_eval
+    _request_replace = Connection._request_replace
+    _request_insert = Connection._request_insert
+    _request_delete = Connection._request_delete
+    _request_upsert = Connection._request_upsert
+    _request_update = Connection._request_update
+    _request_select = Connection._request_select
+    _request_select_stream = Connection._request_select_stream
+    _request_execute_columns = Connection._request_execute_columns
+    _request_execute = Connection._request_execute
+    _request_packer = Connection._request_packer
+    _response_unpacker = Connection._response_unpacker
+    generate_sync = Connection.generate_sync
+    _request_buffers = Connection._request_buffers
+    crud_unflatten_rows = Connection.crud_unflatten_rows
+
+    def _packer_factory(self):
+        return self._packer_factory_impl(self)
+
+    def _unpacker_factory(self):
+        return self._unpacker_factory_impl(self)
+
+    async def close(self):
+        """
+        Close a connection to the server. The method is idempotent.
+        Requests which wait for responses fail with
+        :exc:`~tarantool.error.NetworkError`.
+        """
+
+        writer, self._writer = self._writer, None
+        read_task, self._read_task = self._read_task, None
+        self._reader = None
+        self.connected = False
+
+        if read_task is not None:
+            read_task.cancel()
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+        self._fail_waiters(NetworkError(socket.error(
+            errno.ECONNRESET, "Lost connection to server during query")))
+
+    def is_closed(self):
+        """
+        Returns ``True`` if connection is closed. ``False`` otherwise.
+
+        :rtype: :obj:`bool`
+        """
+
+        return self._writer is None
+
+    async def connect(self):
+        """
+        Create a connection to the host and port specified on
+        initialization: process the greeting, negotiate the protocol
+        version, authenticate and load the schema.
+
+        :raise: :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`,
+            :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.DatabaseError`
+        """
+
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+            self._schema_lock = asyncio.Lock()
+
+        try:
+            await self._connect_basic()
+            await self._handshake()
+            if self.fetch_schema:
+                self.schema = Schema(self)
+                if self.fetch_schema != 'lazy':
+                    await self._load_schema()
+            else:
+                self.schema = None
+        except SslError as e:
+            await self.close()
+            raise e
+        except Exception as e:
+            await self.close()
+            raise NetworkError(e)
+
+    async def _connect_basic(self):
+        """
+        Open a stream to the host and port specified on initialization.
+
+        :raise: :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+
+        :meta private:
+        """
+
+        ssl_context = None
+        if self.transport == SSL_TRANSPORT:
+            ssl_context = self._ssl_context()
+
+        if self._writer is not None:
+            await self.close()
+
+        try:
+            if self.host is None:
+                coro = asyncio.open_unix_connection(self.port, ssl=ssl_context)
+            else:
+                coro = asyncio.open_connection(self.host, self.port,
+                                               ssl=ssl_context)
+            reader, writer = await asyncio.wait_for(coro,
+                                                    self.connection_timeout)
+        except asyncio.TimeoutError:
+            raise NetworkError(socket.timeout('timed out'))
+        except socket.error as e:
+            raise NetworkError(e)
+
+        if self.host is not None:
+            sock = writer.get_extra_info('socket')
+            if sock is not None:
+                sock.setsockopt(socket.SOL_TCP, socket.TCP_NODELAY, 1)
+
+        self._reader = reader
+        self._writer = writer
+        self.connected = True
+
+    async def _handshake(self):
+        """
+        Process greeting with Tarantool server, start reading responses
+        and authenticate.
+
+        :raise: :exc:`~ValueError`,
+            :exc:`~tarantool.error.NetworkError`
+
+        :meta private:
+        """
+
+        greeting_buf = await self._reader.readexactly(IPROTO_GREETING_SIZE)
+        greeting = greeting_decode(greeting_buf)
+        if greeting.protocol != "Binary":
+            raise NetworkError("Unsupported protocol: " + greeting.protocol)
+        self.version_id = greeting.version_id
+        self.uuid = greeting.uuid
+        self._salt = greeting.salt
+
+        self._read_task = asyncio.ensure_future(self._read_loop(self._reader))
+
+        await self._check_features()
+        if self.user:
+            await self.authenticate(self.user, self.password)
+
+    async def _check_features(self):
+        """
+        Execute an ID request. Refer to
+        :meth:`~tarantool.Connection._check_features`.
+
+        :meta private:
+        """
+
+        try:
+            request = RequestProtocolVersion(self,
+                                             CONNECTOR_IPROTO_VERSION,
+                                             CONNECTOR_FEATURES)
+            response = await self._send_request_wo_reconnect(request)
+            server_protocol_version = response.protocol_version
+            server_features = response.features
+            server_auth_type = response.auth_type
+            server_schema_version = response.schema_version
+        except DatabaseError as exc:
+            ER_UNKNOWN_REQUEST_TYPE = 48
+            if exc.code == ER_UNKNOWN_REQUEST_TYPE:
+                server_protocol_version = None
+                server_features = []
+                server_auth_type = None
+                server_schema_version = None
+            else:
+                raise exc
+
+        if server_protocol_version is not None:
+            self._protocol_version = min(server_protocol_version,
+                                         CONNECTOR_IPROTO_VERSION)
+
+        # Intercept lists of features
+        features_list = [val for val in CONNECTOR_FEATURES if val in server_features]
+        for val in features_list:
+            self._features[val] = True
+
+        self._server_auth_type = server_auth_type
+        self._server_schema_version = server_schema_version
+
+    async def authenticate(self, user, password):
+        """
+        Execute an AUTHENTICATE request. Refer to
+        :meth:`~tarantool.Connection.authenticate`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        self.user = user
+        self.password = password
+        if self._writer is None:
+            return await self._opt_reconnect()
+
+        request = RequestAuthenticate(self,
+                                      salt=self._salt,
+                                      user=self.user,
+                                      password=self.password,
+                                      auth_type=self._get_auth_type())
+        auth_response = await self._send_request_wo_reconnect(request)
+        if auth_response.return_code == 0 and self.schema is not None:
+            if self.fetch_schema == 'lazy':
+                self.schema = Schema(self)
+            else:
+                await self._load_schema()
+        return auth_response
+
+    async def _read_loop(self, reader):
+        """
+        Read responses and dispatch them to waiters by IPROTO_SYNC
+        until the stream is closed.
+
+        :param reader: Stream the task was started for.
+        :type reader: :class:`asyncio.StreamReader`
+
+        :meta private:
+        """
+
+        try:
+            while True:
+                length = msgpack.unpackb(await reader.readexactly(5))
+                self._process_response(await reader.readexactly(length))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if reader is self._reader:
+                self.connected = False
+            if isinstance(e, NetworkError):
+                error = e
+            else:
+                error = NetworkError(socket.error(
+                    errno.ECONNRESET, "Lost connection to server during query"))
+            self._fail_waiters(error)
+
+    def _process_response(self, packet):
+        """
+        Resolve the future of a request with a received response.
+
+        :param packet: Response packet.
+        :type packet: :obj:`bytes`
+
+        :meta private:
+        """
+
+        message = unpack_response(self, packet)
+        sync = message[0].get(IPROTO_SYNC, 0)
+        waiter = self._waiters.get(sync)
+        if waiter is None:
+            # The request has been abandoned on timeout.
+            return
+        future, request, on_push, on_push_ctx = waiter
+
+        try:
+            response = request.response_class(
+                self, message, space_no=request.space_no)
+        except SchemaReloadException as e:
+            self._pop_waiter(sync)
+            if self.schema is not None:
+                # Used spaces are fetched again on the next lookup.
+                self.schema_version = e.schema_version
+                self._server_schema_version = None
+                self.schema.invalidate()
+            self._write_request(request, future, on_push, on_push_ctx)
+            return
+        except Exception as e:
+            self._pop_waiter(sync)
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        if response._code == IPROTO_CHUNK:
+            if on_push is not None:
+                try:
+                    on_push(response._data, on_push_ctx)
+                except Exception as e:
+                    self._pop_waiter(sync)
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        self._pop_waiter(sync)
+        if not future.done():
+            future.set_result(response)
+
+    def _pop_waiter(self, sync):
+        """
+        Forget a request waiting for a response.
+
+        :param sync: Request IPROTO_SYNC.
+        :type sync: :obj:`int`
+
+        :meta private:
+        """
+
+        # A response to a raw request may never come.
+        self._raw_syncs.discard(sync)
+        return self._waiters.pop(sync, None)
+
+    def _fail_waiters(self, error):
+        """
+        Fail all requests waiting for responses.
+
+        :param error: Error to set.
+        :type error: :exc:`~tarantool.error.NetworkError`
+
+        :meta private:
+        """
+
+        waiters, self._waiters = self._waiters, {}
+        for sync, (future, _, _, _) in waiters.items():
+            self._raw_syncs.discard(sync)
+            if not future.done():
+                future.set_exception(error)
+
+    def _write_request(self, request, future, on_push=None, on_push_ctx=None):
+        """
+        Register a request waiter and write the request to the stream.
+
+        :meta private:
+        """
+
+        buffers = self._request_buffers(request)
+        self._waiters[request.sync] = (future, request, on_push, on_push_ctx)
+        self._writer.writelines(buffers)
+
+    async def _send_request_wo_reconnect(self, request, on_push=None, on_push_ctx=None):
+        """
+        Send a request and wait for the response without trying to
+        reconnect.
+
+        :param request: Request to send.
+        :type request: :class:`~tarantool.request.Request`
+
+        :param on_push: Сallback for processing out-of-band messages.
+        :type on_push: :obj:`function`, optional
+
+        :param on_push_ctx: Сontext for working with on_push callback.
+        :type on_push_ctx: optional
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :raise: :exc:`~AssertionError`,
+            :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.NetworkError`
+
+        :meta private:
+        """
+
+        assert isinstance(request, Request)
+
+        if self._writer is None or not self.connected:
+            raise NetworkError(socket.error(
+                errno.ECONNRESET, "Lost connection to server during query"))
+
+        future = asyncio.get_event_loop().create_future()
+        self._write_request(request, future, on_push, on_push_ctx)
+        try:
+            await self._writer.drain()
+        except (socket.error, RuntimeError):
+            self._pop_waiter(request.sync)
+            self.connected = False
+            raise NetworkError(socket.error(
+                errno.ECONNRESET, "Lost connection to server during query"))
+
+        try:
+            return await asyncio.wait_for(future, self.socket_timeout)
+        except asyncio.TimeoutError:
+            for sync, waiter in list(self._waiters.items()):
+                if waiter[0] is future:
+                    self._pop_waiter(sync)
+            raise NetworkError(socket.timeout('timed out'))
+
+    async def _opt_reconnect(self):
+        """
+        Reconnect, if the connection is lost.
+
+        :raise: :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+
+        :meta private:
+        """
+
+        if self._connect_lock is None:
+            return await self.connect()
+
+        async with self._connect_lock:
+            if self._writer is not None and self.connected:
+                return
+
+            attempt = 0
+            while True:
+                try:
+                    await self.connect()
+                    return
+                except SslError:
+                    raise
+                except NetworkError as e:
+                    if attempt == self.reconnect_max_attempts:
+                        raise e
+                warn("Reconnecting, attempt %d of %d" %
+                     (attempt, self.reconnect_max_attempts), NetworkWarning)
+                attempt += 1
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def _send_request(self, request, on_push=None, on_push_ctx=None):
+        """
+        Send a request to the server, reconnect if required.
+        Refer to :meth:`~tarantool.AsyncConnection._send_request_wo_reconnect`.
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :meta private:
+        """
+
+        await self._opt_reconnect()
+        try:
+            response = await self._send_request_wo_reconnect(
+                request, on_push, on_push_ctx)
+        except NetworkError as e:
+            # The server may have already executed a non-idempotent
+            # request, so only idempotent ones are sent again.
+            if not request.idempotent or e.errno != errno.ECONNRESET:
+                raise
+
+            await self._opt_reconnect()
+            response = await self._send_request_wo_reconnect(
+                request, on_push, on_push_ctx)
+
+        if response._space_no is not None and self.schema is not None:
+            space = self.schema.schema.get(response._space_no)
+            if space is None or space.stale:
+                # Load the space schema to build rows and columns of
+                # a response to a request sent again after a schema
+                # reload: the response can not fetch it itself.
+                try:
+                    await self._get_space(response._space_no)
+                except SchemaError:
+                    pass
+        return response
+
+    async def _load_schema(self):
+        """
+        Fetch space and index schema. Refer to
+        :meth:`~tarantool.Connection.load_schema`.
+
+        :raise: :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        schema = Schema(self)
+
+        if self.schema_cache is not None and self.uuid is not None:
+            await self._load_schema_cached(schema)
+            self.schema = schema
+            return
+
+        space_rows = await self._fetch_system_space(SPACE_VSPACE, SPACE_SPACE)
+        for row in space_rows:
+            SchemaSpace(row, schema.schema)
+
+        index_rows = await self._fetch_system_space(SPACE_VINDEX, SPACE_INDEX)
+        for row in index_rows:
+            SchemaIndex(row, schema.schema[row[0]])
+
+        self.schema = schema
+
+    async def _load_schema_cached(self, schema):
+        """
+        Take the schema from the schema cache or fetch it and write to
+        the cache. Refer to :meth:`~tarantool.Connection.load_schema`.
+
+        :param schema: Empty schema to load.
+        :type schema: :class:`~tarantool.schema.Schema`
+
+        :meta private:
+        """
+
+        version = self._server_schema_version
+        cached = None
+        if version:
+            cached = self.schema_cache.read(self.uuid, self.user, version)
+        if cached is not None:
+            schema.load_encoded(*cached)
+            self.schema_version = version
+            return
+
+        spaces = await self._fetch_system_space(SPACE_VSPACE, SPACE_SPACE,
+                                                raw=True)
+        indexes = await self._fetch_system_space(SPACE_VINDEX, SPACE_INDEX,
+                                                 raw=True)
+        schema.load_encoded(spaces.raw_data, indexes.raw_data)
+        version = spaces.schema_version
+        if not version or version != indexes.schema_version:
+            # The schema has changed between the requests.
+            return
+        self.schema_version = version
+        try:
+            self.schema_cache.write(self.uuid, self.user, version,
+                                    spaces.raw_data, indexes.raw_data)
+        except OSError as e:
+            warn("Failed to write schema cache: %s" % e, SchemaCacheWarning)
+
+    async def _fetch_space(self, space_object, space):
+        """
+        Fetch a space schema together with its indexes. Refer to
+        :meth:`~tarantool.schema.Schema.reload_space`.
+
+        :param space_object: Stale space schema or ``None``, if the
+            space is not loaded.
+        :type space_object: :class:`~tarantool.schema.SchemaSpace` or
+            :obj:`None`
+
+        :param space: Space name or space id to fetch.
+        :type space: :obj:`str` or :obj:`int`
+
+        :raise: :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        index = INDEX_SPACE_NAME if isinstance(space, str) \
+            else INDEX_SPACE_PRIMARY
+        space_rows = await self._fetch_system_space(
+            SPACE_VSPACE, SPACE_SPACE, space, index=index)
+        if space_object is not None:
+            space_object.flush()
+        if len(space_rows) == 0:
+            if self.schema.lazy:
+                self.schema.missing.add(space)
+            return
+        if self.schema.lazy:
+            self.schema.track_version(space_rows)
+
+        space_object = SchemaSpace(space_rows[0], self.schema.schema)
+        index_rows = await self._fetch_system_space(
+            SPACE_VINDEX, SPACE_INDEX, space_object.sid)
+        for row in index_rows:
+            SchemaIndex(row, space_object)
+
+    async def _fetch_system_space(self, view_space, space, key=(), index=0,
+                                  raw=False):
+        """
+        Select tuples from a system space view. Fallback to the system
+        space itself for old Tarantool versions.
+
+        :param key: Key to select, all tuples are selected by default.
+
+        :param index: Index id.
+        :type index: :obj:`int`, optional
+
+        :param raw: If ``True``, leave the tuples encoded.
+        :type raw: :obj:`bool`, optional
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :meta private:
+        """
+
+        try:
+            return await self._send_request_wo_reconnect(
+                self._request_select(view_space, key, index=index, raw=raw))
+        except DatabaseError as e:
+            # if space can't be found, then user is using old version of
+            # tarantool, try again with '_space' or '_index'
+            if e.args[0] != 36:
+                raise
+        return await self._send_request_wo_reconnect(
+            self._request_select(space, key, index=index, raw=raw))
+
+    async def _get_space(self, space):
+        """
+        Get space schema from the cache. Reload the schema on a miss,
+        fetch a stale space again.
+
+        :param space: Space name or space id.
+        :type space: :obj:`str` or :obj:`int`
+
+        :rtype: :class:`~tarantool.schema.SchemaSpace`
+
+        :raise: :exc:`~tarantool.error.SchemaError`
+
+        :meta private:
+        """
+
+        space = to_unicode(space)
+
+        cached = self.schema.schema.get(space)
+        if cached is None and space in self.schema.missing:
+            raise space_not_found(space)
+        if cached is None or cached.stale:
+            async with self._schema_lock:
+                cached = self.schema.schema.get(space)
+                if cached is None and not self.schema.lazy:
+                    await self._load_schema()
+                elif cached is None or cached.stale:
+                    await self._fetch_space(cached, space)
+
+        try:
+            return self.schema.schema[space]
+        except KeyError:
+            raise space_not_found(space)
+
+    def _row_class(self, space_no):
+        """
+        Get the row class of a space from the loaded schema, refer to
+        :paramref:`~tarantool.Connection.params.named_rows`. Schema
+        requests are asynchronous, so a missing space is loaded by
+        :meth:`~tarantool.AsyncConnection._send_request` instead.
+
+        :param space_no: Space id.
+        :type space_no: :obj:`int`
+
+        :rtype: :obj:`type` or :obj:`None`
+
+        :meta private:
+        """
+
+        space = self.schema.schema.get(space_no)
+        if space is None or space.stale:
+            return None
+        return space.row_class
+
+    def _response_space(self, space_no):
+        """
+        Get the schema of a space which tuples are returned in
+        a response from the loaded schema. Schema requests are
+        asynchronous, so a missing space is loaded by
+        :meth:`~tarantool.AsyncConnection._send_request` instead.
+
+        :param space_no: Space id.
+        :type space_no: :obj:`int`
+
+        :rtype: :class:`~tarantool.schema.SchemaSpace`
+
+        :raise: :exc:`~tarantool.error.SchemaError`
+
+        :meta private:
+        """
+
+        space = self.schema.schema.get(space_no)
+        if space is None or space.stale:
+            raise SchemaError('Schema of space %s is not loaded, it has '
+                              'changed after the request' % space_no)
+        return space
+
+    async def _resolve(self, space_name, index=0):
+        """
+        Resolve space and index names to ids.
+
+        :param space_name: Space name or space id.
+        :type space_name: :obj:`str` or :obj:`int`
+
+        :param index: Index name or index id.
+        :type index: :obj:`str` or :obj:`int`, optional
+
+        :return: Space id and index id.
+        :rtype: :obj:`tuple`
+
+        :raise: :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NotSupportedError`
+
+        :meta private:
+        """
+
+        self._schemaful_connection_check()
+
+        space = await self._get_space(space_name)
+
+        if isinstance(index, str):
+            index = to_unicode(index)
+            if (space.sid, index) in self.schema.missing:
+                raise index_not_found(space, index)
+            if index not in space.indexes:
+                async with self._schema_lock:
+                    if index not in space.indexes:
+                        if self.schema.lazy:
+                            await self._fetch_space(space, space.sid)
+                        else:
+                            await self._load_schema()
+                space = await self._get_space(space.sid)
+            try:
+                index = space.indexes[index].iid
+            except KeyError:
+                if self.schema.lazy:
+                    self.schema.missing.add((space.sid, index))
+                raise index_not_found(space, index)
+
+        return space.sid, index
+
+    async def _resolve_ops(self, space_id, op_list):
+        """
+        Resolve field names in update operations to field ids.
+
+        :param space_id: Space id.
+        :type space_id: :obj:`int`
+
+        :param op_list: Update operations.
+        :type op_list: :obj:`list`
+
+        :rtype: :obj:`list`
+
+        :raise: :exc:`~tarantool.error.SchemaError`
+
+        :meta private:
+        """
+
+        space = await self._get_space(space_id)
+
+        new_ops = []
+        for op in op_list:
+            if isinstance(op[1], str):
+                op = list(op)
+                field = to_unicode(op[1])
+                try:
+                    op[1] = space.format[field]['id']
+                except KeyError:
+                    errmsg = "There's no field with name '{0}' in space '{1}'".format(
+                        field, space.name)
+                    raise SchemaError(errmsg)
+            new_ops.append(op)
+        return new_ops
+
+    async def call(self, func_name, *args, on_push=None, on_push_ctx=None, raw=None):
+        """
+        Execute a CALL request. Refer to
+        :meth:`~tarantool.Connection.call`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_call(func_name, *args, raw=raw)
+        return await self._send_request(request, on_push, on_push_ctx)
+
+    async def eval(self, expr, *args, on_push=None, on_push_ctx=None, raw=None):
+        """
+        Execute an EVAL request. Refer to
+        :meth:`~tarantool.Connection.eval`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_eval(expr, *args, raw=raw)
+        return await self._send_request(request, on_push, on_push_ctx)
+
+    async def replace(self, space_name, values, on_push=None, on_push_ctx=None):
+        """
+        Execute a REPLACE request. Refer to
+        :meth:`~tarantool.Connection.replace`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        await self._opt_reconnect()
+        space_name, _ = await self._resolve(space_name)
+        request = self._request_replace(space_name, values)
+        return await self._send_request(request, on_push, on_push_ctx)
+
+    async def insert(self, space_name, values, on_push=None, on_push_ctx=None):
+        """
+        Execute an INSERT request. Refer to
+        :meth:`~tarantool.Connection.insert`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        await self._opt_reconnect()
+        space_name, _ = await self._resolve(space_name)
+        request = self._request_insert(space_name, values)
+        return await self._send_request(request, on_push, on_push_ctx)
+
+    async def delete(self, space_name, key, *, index=0, on_push=None, on_push_ctx=None):
+        """
+        Execute a DELETE request. Refer to
+        :meth:`~tarantool.Connection.delete`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        await self._opt_reconnect()
+        space_name, index = await self._resolve(space_name, index)
+        request = self._request_delete(space_name, key, index=index)
+        return await self._send_request(request, on_push, on_push_ctx)
+
+    async def upsert(self, space_name, tuple_value, op_list, *, index=0, on_push=None, on_push_ctx=None):
+        """
+        Execute an UPSERT request. Refer to
+        :meth:`~tarantool.Connection.upsert`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        await self._opt_reconnect()
+        space_name, index = await self._resolve(space_name, index)
+        op_list = await self._resolve_ops(space_name, op_list)
+        request = self._request_upsert(space_name, tuple_value, op_list,
+                                       index=index)
+        return await self._send_request(request, on_push, on_push_ctx)
+
+    async def update(self, space_name, key, op_list, *, index=0, on_push=None, on_push_ctx=None):
+        """
+        Execute an UPDATE request. Refer to
+        :meth:`~tarantool.Connection.update`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        await self._opt_reconnect()
+        space_name, index = await self._resolve(space_name, index)
+        op_list = await self._resolve_ops(space_name, op_list)
+        request = self._request_update(space_name, key, op_list, index=index)
+        return await self._send_request(request, on_push, on_push_ctx)
+
+    async def ping(self, notime=False):
+        """
+        Execute a PING request. Refer to
+        :meth:`~tarantool.Connection.ping`.
+
+        :rtype: :obj:`float` or :obj:`str`
+        """
+
+        request = RequestPing(self)
+        t0 = time.time()
+        await self._send_request(request)
+        t1 = time.time()
+
+        if notime:
+            return "Success"
+        return t1 - t0
+
+    async def select(self, space_name, key=None, *, offset=0, limit=0xffffffff, index=0, iterator=None, on_push=None, on_push_ctx=None, raw=None):
+        """
+        Execute a SELECT request. Refer to
+        :meth:`~tarantool.Connection.select`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        await self._opt_reconnect()
+        space_name, index = await self._resolve(space_name, index)
+        request = self._request_select(space_name, key, offset=offset,
+                                       limit=limit, index=index,
+                                       iterator=iterator, raw=raw)
+        return await self._send_request(request, on_push, on_push_ctx)
+
+    async def select_stream(self, space_name, key=None, *, offset=0, limit=0xffffffff, index=0, iterator=None, on_push=None, on_push_ctx=None):
+        """
+        Execute a SELECT request with a streaming response. Refer to
+        :meth:`~tarantool.Connection.select_stream`.
+
+        :rtype: :class:`~tarantool.response.StreamResponse`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        await self._opt_reconnect()
+        space_name, index = await self._resolve(space_name, index)
+        request = self._request_select_stream(space_name, key, offset=offset,
+                                              limit=limit, index=index,
+                                              iterator=iterator)
+        return await self._send_request(request, on_push, on_push_ctx)
+
+    async def execute(self, query, params=None, *, raw=None):
+        """
+        Execute an SQL request. Refer to
+        :meth:`~tarantool.Connection.execute`.
+
+        :rtype: :class:`~tarantool.response.Response`
+        """
+
+        request = self._request_execute(query, params, raw=raw)
+        return await self._send_request(request)
+
+    async def select_columns(self, space_name, key=None, *, offset=0, limit=0xffffffff, index=0, iterator=None, fields=None, string_dtype=object):
+        """
+        Execute a SELECT request and decode the result into NumPy
+        arrays. Refer to :meth:`~tarantool.Connection.select_columns`.
+
+        :rtype: :obj:`dict`
+        """
+
+        await self._opt_reconnect()
+        space_name, index = await self._resolve(space_name, index)
+        request = self._request_select_stream(space_name, key, offset=offset,
+                                              limit=limit, index=index,
+                                              iterator=iterator)
+        response = await self._send_request(request)
+        return response.to_columns(fields, string_dtype)
+
+    async def execute_columns(self, query, params=None, *, fields=None, string_dtype=object):
+        """
+        Execute an SQL request and decode the result into NumPy arrays.
+        Refer to :meth:`~tarantool.Connection.execute_columns`.
+
+        :rtype: :obj:`dict`
+        """
+
+        request = self._request_execute_columns(query, params)
+        response = await self._send_request(request)
+        return response.to_columns(fields, string_dtype)
+
+    async def _call_crud(self, *args):
+        """
+        Call a crud function. Refer to
+        :func:`~tarantool.crud.call_crud`.
+
+        :meta private:
+        """
+
+        try:
+            return await self.call(*args, raw=False)
+        except DatabaseError as e:
+            if e.code == ER_NO_SUCH_PROC or e.code == ER_ACCESS_DENIED:
+                exc_msg = ". Ensure that you're calling crud.router and user has sufficient grants"
+                raise DatabaseError(e.code, e.message + exc_msg, extra_info=e.extra_info) from e
+            raise
+
+    async def _crud_single(self, *args):
+        """
+        Call a crud function returning a single result.
+
+        :rtype: :class:`~tarantool.crud.CrudResult`
+
+        :raise: :exc:`~tarantool.error.CrudModuleError`,
+            :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        crud_resp = await self._call_crud(*args)
+
+        if crud_resp[1] is not None:
+            raise CrudModuleError(None, CrudError(crud_resp[1]))
+
+        return CrudResult(crud_resp[0])
+
+    async def _crud_many(self, *args):
+        """
+        Call a crud batch function.
+
+        :rtype: :class:`~tarantool.crud.CrudResult`
+
+        :raise: :exc:`~tarantool.error.CrudModuleManyError`,
+            :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        crud_resp = await self._call_crud(*args)
+
+        res = None
+        if crud_resp[0] is not None:
+            res = CrudResult(crud_resp[0])
+
+        if crud_resp[1] is not None:
+            errs = list()
+            for err in crud_resp[1]:
+                errs.append(CrudError(err))
+            raise CrudModuleManyError(res, errs)
+
+        return res
+
+    async def _crud_value(self, *args):
+        """
+        Call a crud function which returns an error only on failure.
+
+        :raise: :exc:`~tarantool.error.CrudModuleError`,
+            :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        crud_resp = await self._call_crud(*args)
+
+        # In absence of an error, crud does not give
+        # variable err as nil (as in most cases).
+        if len(crud_resp) != 1:
+            raise CrudModuleError(None, CrudError(crud_resp[1]))
+
+        return crud_resp[0]
+
+    async def crud_insert(self, space_name: str, values: Union[tuple, list], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_insert`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, (tuple, list))
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.insert", space_name, values, opts)
+
+    async def crud_insert_object(self, space_name: str, values: dict, opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_insert_object`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, dict)
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.insert_object", space_name, values, opts)
+
+    async def crud_insert_many(self, space_name: str, values: Union[tuple, list], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_insert_many`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, (tuple, list))
+        assert isinstance(opts, dict)
+
+        return await self._crud_many("crud.insert_many", space_name, values, opts)
+
+    async def crud_insert_object_many(self, space_name: str, values: Union[tuple, list], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_insert_object_many`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, (tuple, list))
+        assert isinstance(opts, dict)
+
+        return await self._crud_many("crud.insert_object_many", space_name, values, opts)
+
+    async def crud_get(self, space_name: str, key: int, opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_get`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.get", space_name, key, opts)
+
+    async def crud_update(self, space_name: str, key: int, operations: list=[], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_update`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(operations, list)
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.update", space_name, key, operations, opts)
+
+    async def crud_delete(self, space_name: str, key: int, opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_delete`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.delete", space_name, key, opts)
+
+    async def crud_replace(self, space_name: str, values: Union[tuple, list], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_replace`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, (tuple, list))
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.replace", space_name, values, opts)
+
+    async def crud_replace_object(self, space_name: str, values: dict, opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_replace_object`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, dict)
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.replace_object", space_name, values, opts)
+
+    async def crud_replace_many(self, space_name: str, values: Union[tuple, list], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_replace_many`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, (tuple, list))
+        assert isinstance(opts, dict)
+
+        return await self._crud_many("crud.replace_many", space_name, values, opts)
+
+    async def crud_replace_object_many(self, space_name: str, values: Union[tuple, list], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_replace_object_many`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, (tuple, list))
+        assert isinstance(opts, dict)
+
+        return await self._crud_many("crud.replace_object_many", space_name, values, opts)
+
+    async def crud_upsert(self, space_name: str, values: Union[tuple, list], operations: list=[], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_upsert`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, (tuple, list))
+        assert isinstance(operations, list)
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.upsert", space_name, values, operations, opts)
+
+    async def crud_upsert_object(self, space_name: str, values: dict, operations: list=[], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_upsert_object`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values, dict)
+        assert isinstance(operations, list)
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.upsert_object", space_name, values, operations, opts)
+
+    async def crud_upsert_many(self, space_name: str, values_operation: Union[tuple, list], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_upsert_many`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values_operation, (tuple, list))
+        assert isinstance(opts, dict)
+
+        return await self._crud_many("crud.upsert_many", space_name, values_operation, opts)
+
+    async def crud_upsert_object_many(self, space_name: str, values_operation: Union[tuple, list], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_upsert_object_many`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(values_operation, (tuple, list))
+        assert isinstance(opts, dict)
+
+        return await self._crud_many("crud.upsert_object_many", space_name, values_operation, opts)
+
+    async def crud_select(self, space_name: str, conditions: list=[], opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_select`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(conditions, (tuple, list))
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.select", space_name, conditions, opts)
+
+    async def crud_min(self, space_name: str, index_name: str, opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_min`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.min", space_name, index_name, opts)
+
+    async def crud_max(self, space_name: str, index_name: str, opts: dict={}) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_max`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(opts, dict)
+
+        return await self._crud_single("crud.max", space_name, index_name, opts)
+
+    async def crud_truncate(self, space_name: str, opts: dict={}) -> bool:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_truncate`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(opts, dict)
+
+        return await self._crud_value("crud.truncate", space_name, opts)
+
+    async def crud_len(self, space_name: str, opts: dict={}) -> int:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_len`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(opts, dict)
+
+        return await self._crud_value("crud.len", space_name, opts)
+
+    async def crud_storage_info(self, opts: dict={}) -> dict:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_storage_info`.
+        """
+
+        assert isinstance(opts, dict)
+
+        return await self._crud_value("crud.storage_info", opts)
+
+    async def crud_count(self, space_name: str, conditions: list=[], opts: dict={}) -> int:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_count`.
+        """
+
+        assert isinstance(space_name, str)
+        assert isinstance(conditions, (tuple, list))
+        assert isinstance(opts, dict)
+
+        crud_resp = await self._call_crud("crud.count", space_name, conditions, opts)
+
+        if crud_resp[1] is not None:
+            raise CrudModuleError(None, CrudError(crud_resp[1]))
+
+        return crud_resp[0]
+
+    async def crud_stats(self, space_name: str=None) -> CrudResult:
+        """
+        Refer to :meth:`~tarantool.Connection.crud_stats`.
+        """
+
+        if space_name is not None:
+            assert isinstance(space_name, str)
+
+        crud_resp = await self._call_crud("crud.stats", space_name)
+
+        res = None
+        if len(crud_resp.data[0]) > 0:
+            res = CrudResult(crud_resp.data[0])
+
+        return res
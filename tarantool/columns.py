@@ -0,0 +1,450 @@
+"""
+Columnar decoding of response data into NumPy arrays. Field types are
+taken from the space format or from SQL response metadata, rows are
+decoded straight into typed column buffers without building a list per
+row.
+"""
+
+from array import array
+import struct
+
+import numpy
+import pandas
+
+from tarantool.const import (
+    IPROTO_DATA,
+    IPROTO_METADATA,
+    IPROTO_FIELD_NAME,
+    IPROTO_FIELD_TYPE,
+)
+from tarantool.schema import to_unicode
+from tarantool.msgpack_ext.datetime import EXT_ID as DATETIME_EXT_ID
+from tarantool.msgpack_ext.types.datetime import NSEC_IN_SEC
+
+TYPES = {
+    'unsigned': ('Q', 'uint64'),
+    'integer': ('q', 'int64'),
+    'double': ('d', 'float64'),
+    'number': ('d', 'float64'),
+    'boolean': ('B', 'bool'),
+    'datetime': ('q', 'datetime64[ns]'),
+}
+"""
+:mod:`array` type codes and NumPy dtypes of Tarantool field types.
+Fields of other types are decoded to arrays of objects.
+"""
+
+# MP_EXT header of an encoded datetime: fixext 8 or fixext 16.
+_DATETIME_FIXEXT8 = 0xd7
+_DATETIME_FIXEXT16 = 0xd8
+_MP_NIL = 0xc0
+
+_datetime_seconds = struct.Struct('<q')
+_datetime_seconds_nsec = struct.Struct('<qi')
+
+
+class Column(object):
+    """
+    Buffer for the values of a single field.
+
+    :meta private:
+    """
+
+    def __init__(self, name, field_type, string_dtype=object):
+        """
+        :param name: Column name.
+        :type name: :obj:`str`
+
+        :param field_type: Tarantool field type.
+        :type field_type: :obj:`str`
+
+        :param string_dtype: NumPy dtype of ``string`` columns.
+        """
+
+        self.name = name
+        self.field_type = to_unicode(field_type or '').lower()
+        self.string_dtype = string_dtype
+        self.typecode, self.dtype = TYPES.get(self.field_type, (None, object))
+        self.values = array(self.typecode) if self.typecode else []
+        self.nulls = []
+
+    def append_null(self, row):
+        """
+        Add a missing value.
+
+        :param row: Row number.
+        :type row: :obj:`int`
+        """
+
+        if self.typecode is not None:
+            self.values.append(0)
+            self.nulls.append(row)
+        else:
+            self.values.append(None)
+
+    def to_objects(self):
+        """
+        Switch to an object column, if a value does not fit the field
+        type buffer (e.g. ``integer`` above the int64 range).
+        """
+
+        if self.typecode is not None:
+            values = self.values.tolist()
+            for row in self.nulls:
+                values[row] = None
+            self.values = values
+            self.typecode, self.dtype = None, object
+            self.nulls = []
+
+    def to_numpy(self):
+        """
+        Build a NumPy array. Columns with missing values of numeric,
+        boolean and datetime types are returned as masked arrays.
+
+        :rtype: :class:`numpy.ndarray` or :class:`numpy.ma.MaskedArray`
+        """
+
+        if self.typecode is None:
+            if self.field_type == 'string' and self.string_dtype is not object:
+                return numpy.array(self.values, dtype=self.string_dtype)
+            result = numpy.empty(len(self.values), dtype=object)
+            result[:] = self.values
+            return result
+
+        # Type codes and dtypes have the same item size: the buffer is
+        # reused without a copy.
+        result = numpy.frombuffer(self.values, dtype=self.typecode)
+        result = result.view(self.dtype)
+        if self.nulls:
+            mask = numpy.zeros(len(result), dtype=bool)
+            mask[self.nulls] = True
+            result = numpy.ma.MaskedArray(result, mask=mask)
+        return result
+
+
+def read_datetime(body, pos):
+    """
+    Decode an encoded datetime to nanoseconds since Epoch without
+    building a :class:`~tarantool.Datetime`.
+
+    :param body: Encoded data.
+    :type body: :obj:`bytes`
+
+    :param pos: Position of the encoded value.
+    :type pos: :obj:`int`
+
+    :return: UTC nanoseconds or ``None`` if the value is not a datetime.
+    :rtype: :obj:`int` or :obj:`None`
+
+    :meta private:
+    """
+
+    head = body[pos]
+    if body[pos + 1] != DATETIME_EXT_ID:
+        return None
+    if head == _DATETIME_FIXEXT8:
+        return _datetime_seconds.unpack_from(body, pos + 2)[0] * NSEC_IN_SEC
+    if head == _DATETIME_FIXEXT16:
+        seconds, nsec = _datetime_seconds_nsec.unpack_from(body, pos + 2)
+        return seconds * NSEC_IN_SEC + nsec
+    return None
+
+
+def find_body_key(unpacker, key):
+    """
+    Position an unpacker fed with an encoded response body at the value
+    of a body key.
+
+    :return: ``True`` if the key is found.
+    :rtype: :obj:`bool`
+
+    :meta private:
+    """
+
+    for _ in range(unpacker.read_map_header()):
+        if unpacker.unpack() == key:
+            return True
+        unpacker.skip()
+    return False
+
+
+def sql_fields(conn, body):
+    """
+    Get column names and types from the metadata of an encoded SQL
+    response body.
+
+    :rtype: :obj:`list`
+
+    :meta private:
+    """
+
+    unpacker = conn._unpacker_factory()
+    unpacker.feed(body)
+    if not find_body_key(unpacker, IPROTO_METADATA):
+        return []
+    return metadata_fields(unpacker.unpack())
+
+
+def metadata_fields(metadata):
+    """
+    Get column names and types from decoded SQL response metadata.
+
+    :param metadata: IPROTO_METADATA of a response.
+    :type metadata: :obj:`list`
+
+    :rtype: :obj:`list`
+
+    :meta private:
+    """
+
+    return [(to_unicode(field[IPROTO_FIELD_NAME]),
+             to_unicode(field.get(IPROTO_FIELD_TYPE)))
+            for field in metadata or ()]
+
+
+def space_fields(space):
+    """
+    Get field names and types from the space format.
+
+    :param space: Space schema.
+    :type space: :class:`~tarantool.schema.SchemaSpace`
+
+    :rtype: :obj:`list`
+
+    :meta private:
+    """
+
+    fields = [part for key, part in space.format.items()
+              if isinstance(key, int)]
+    fields.sort(key=lambda part: part['id'])
+    return [(part['name'], part.get('type')) for part in fields]
+
+
+def data_array(conn, body):
+    """
+    Find the encoded IPROTO_DATA array in an encoded response body.
+
+    :param conn: Request sender.
+    :type conn: :class:`~tarantool.Connection`
+
+    :param body: Encoded response body.
+    :type body: :obj:`bytes`
+
+    :return: Encoded data without a copy or ``None``, if the body has
+        no data.
+    :rtype: :obj:`memoryview` or :obj:`None`
+
+    :meta private:
+    """
+
+    unpacker = conn._unpacker_factory()
+    unpacker.feed(body)
+    if not find_body_key(unpacker, IPROTO_DATA):
+        return None
+    start = unpacker.tell()
+    unpacker.skip()
+    return memoryview(body)[start:unpacker.tell()]
+
+
+def make_columns(fields, names=None, string_dtype=object):
+    """
+    Build column buffers for tuple fields.
+
+    :param fields: ``(name, type)`` pairs in the order of tuple fields.
+    :type fields: :obj:`list`
+
+    :param names: Names or numbers of fields to decode. All fields are
+        decoded, if not set.
+    :type names: :obj:`list`, optional
+
+    :param string_dtype: NumPy dtype of ``string`` columns, for
+        example ``'U32'``.
+
+    :return: Column per field, ``None`` for skipped fields.
+    :rtype: :obj:`list`
+
+    :raise: :exc:`~ValueError`
+
+    :meta private:
+    """
+
+    if not fields:
+        raise ValueError('Field names and types are unknown')
+
+    columns = [Column(name, field_type, string_dtype)
+               for name, field_type in fields]
+    if names is None:
+        return columns
+
+    wanted = set()
+    for name in names:
+        for field_no, column in enumerate(columns):
+            if name in (field_no, column.name):
+                wanted.add(field_no)
+                break
+        else:
+            raise ValueError('Unknown field %r' % (name,))
+    return [column if field_no in wanted else None
+            for field_no, column in enumerate(columns)]
+
+
+def decode_columns(conn, data, fields, names=None, string_dtype=object):
+    """
+    Decode encoded response data into columns.
+
+    :param conn: Request sender.
+    :type conn: :class:`~tarantool.Connection`
+
+    :param data: Encoded IPROTO_DATA array, see
+        :func:`~tarantool.columns.data_array`.
+    :type data: :obj:`bytes` or :obj:`memoryview` or :obj:`None`
+
+    :param fields: Refer to
+        :paramref:`~tarantool.columns.make_columns.params.fields`.
+
+    :param names: Refer to
+        :paramref:`~tarantool.columns.make_columns.params.names`.
+
+    :param string_dtype: Refer to
+        :paramref:`~tarantool.columns.make_columns.params.string_dtype`.
+
+    :return: Column name to array mapping in the field order.
+    :rtype: :obj:`dict`
+
+    :raise: :exc:`~ValueError`
+
+    :meta private:
+    """
+
+    columns = make_columns(fields, names, string_dtype)
+
+    count = 0
+    unpacker = conn._unpacker_factory()
+    if data is not None:
+        unpacker.feed(data)
+        count = unpacker.read_array_header()
+
+    unpack = unpacker.unpack
+    skip = unpacker.skip
+    tell = unpacker.tell
+    width = len(columns)
+    appends = [column.values.append if column is not None else None
+               for column in columns]
+    datetimes = [column is not None and column.field_type == 'datetime'
+                 for column in columns]
+
+    for row in range(count):
+        size = unpacker.read_array_header()
+        for field_no in range(size):
+            append = appends[field_no] if field_no < width else None
+            if append is None:
+                skip()
+                continue
+
+            if datetimes[field_no]:
+                pos = tell()
+                skip()
+                if data[pos] == _MP_NIL:
+                    columns[field_no].append_null(row)
+                    continue
+                value = read_datetime(data, pos)
+                if value is None:
+                    raise ValueError('Field %r is not a datetime'
+                                     % (columns[field_no].name,))
+                append(value)
+                continue
+
+            value = unpack()
+            if value is None:
+                columns[field_no].append_null(row)
+                continue
+            try:
+                append(value)
+            except (TypeError, OverflowError):
+                columns[field_no].to_objects()
+                append = appends[field_no] = columns[field_no].values.append
+                append(value)
+
+        # Trailing nullable fields may be omitted.
+        for field_no in range(size, width):
+            if columns[field_no] is not None:
+                columns[field_no].append_null(row)
+
+    return {column.name: column.to_numpy()
+            for column in columns if column is not None}
+
+
+def rows_to_columns(rows, fields, names=None, string_dtype=object):
+    """
+    Split already decoded rows into columns.
+
+    :param rows: Decoded rows.
+    :type rows: :obj:`list`
+
+    :param fields: Refer to
+        :paramref:`~tarantool.columns.make_columns.params.fields`.
+
+    :param names: Refer to
+        :paramref:`~tarantool.columns.make_columns.params.names`.
+
+    :param string_dtype: Refer to
+        :paramref:`~tarantool.columns.make_columns.params.string_dtype`.
+
+    :return: Column name to array mapping in the field order.
+    :rtype: :obj:`dict`
+
+    :raise: :exc:`~ValueError`
+
+    :meta private:
+    """
+
+    columns = make_columns(fields, names, string_dtype)
+    selected = [(field_no, column) for field_no, column in enumerate(columns)
+                if column is not None]
+
+    for row_no, row in enumerate(rows):
+        size = len(row)
+        for field_no, column in selected:
+            value = row[field_no] if field_no < size else None
+            if value is None:
+                column.append_null(row_no)
+                continue
+            if column.field_type == 'datetime' and column.typecode is not None:
+                value = getattr(value, 'value', value)
+            try:
+                column.values.append(value)
+            except (TypeError, OverflowError):
+                column.to_objects()
+                column.values.append(value)
+
+    return {column.name: column.to_numpy() for _, column in selected}
+
+
+def build_dataframe(columns):
+    """
+    Build a :class:`pandas.DataFrame` from columns. Numeric and boolean
+    columns with missing values become pandas nullable arrays, missing
+    floats and datetimes become ``NaN`` and ``NaT``.
+
+    :param columns: Column name to array mapping.
+    :type columns: :obj:`dict`
+
+    :rtype: :class:`pandas.DataFrame`
+
+    :meta private:
+    """
+
+    frame = {}
+    for name, column in columns.items():
+        if isinstance(column, numpy.ma.MaskedArray):
+            kind = column.dtype.kind
+            if kind in 'iu':
+                column = pandas.arrays.IntegerArray(column.data, column.mask)
+            elif kind == 'b':
+                column = pandas.arrays.BooleanArray(column.data, column.mask)
+            elif kind == 'f':
+                column = column.filled(numpy.nan)
+            elif kind == 'M':
+                column = column.filled(numpy.datetime64('NaT'))
+        frame[name] = column
+    return pandas.DataFrame(frame, copy=False)
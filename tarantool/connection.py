@@ -3,10 +3,10 @@
 This module provides API for interaction with a Tarantool server.
 """
 
-import os
 import time
 import errno
 import socket
+import struct
 try:
     import ssl
     is_ssl_supported = True
@@ -14,16 +14,18 @@ except ImportError:
     is_ssl_supported = False
 import sys
 import abc
-
-import ctypes
-import ctypes.util
-from ctypes import c_ssize_t
+import itertools
+import threading
+import concurrent.futures
 
 import msgpack
 
 from tarantool.response import (
     unpacker_factory as default_unpacker_factory,
     Response,
+    StreamResponse,
+    StreamResponseExecute,
+    unpack_response,
 )
 from tarantool.request import (
     packer_factory as default_packer_factory,
@@ -45,11 +47,21 @@ from tarantool.request import (
     RequestProtocolVersion,
 )
 from tarantool.space import Space
+from tarantool.pipeline import Pipeline
+from tarantool.prepared import (
+    PreparedDelete,
+    PreparedInsert,
+    PreparedReplace,
+    PreparedSelect,
+)
+from tarantool.scan import Scan
 from tarantool.const import (
     CONNECTION_TIMEOUT,
     SOCKET_TIMEOUT,
     RECONNECT_MAX_ATTEMPTS,
     RECONNECT_DELAY,
+    RECV_BUFFER_SIZE,
+    IOV_MAX,
     DEFAULT_TRANSPORT,
     SSL_TRANSPORT,
     DEFAULT_SSL_KEY_FILE,
@@ -71,9 +83,15 @@ from tarantool.const import (
     IPROTO_FEATURE_WATCHERS,
     IPROTO_AUTH_TYPE,
     IPROTO_CHUNK,
+    IPROTO_SYNC,
+    IPROTO_REQUEST_TYPE,
     AUTH_TYPE_CHAP_SHA1,
     AUTH_TYPE_PAP_SHA256,
     AUTH_TYPES,
+    SPACE_SPACE,
+    SPACE_INDEX,
+    SPACE_VSPACE,
+    SPACE_VINDEX,
 )
 from tarantool.error import (
     Error,
@@ -84,6 +102,7 @@ from tarantool.error import (
     ConfigurationError,
     SchemaError,
     NetworkWarning,
+    SchemaCacheWarning,
     OperationalError,
     DataError,
     IntegrityError,
@@ -97,6 +116,7 @@ from tarantool.error import (
     warn
 )
 from tarantool.schema import Schema
+from tarantool.schema_cache import SchemaCache
 from tarantool.utils import (
     greeting_decode,
     version_id,
@@ -580,7 +600,12 @@ class Connection(ConnectionInterface):
                  packer_factory=default_packer_factory,
                  unpacker_factory=default_unpacker_factory,
                  auth_type=None,
-                 fetch_schema=True):
+                 fetch_schema=True,
+                 lazy_responses=False,
+                 raw_responses=False,
+                 named_rows=False,
+                 schema_cache_dir=None,
+                 schema_registry=None):
         """
         :param host: Server hostname or IP address. Use ``None`` for
             Unix sockets.
@@ -747,7 +772,61 @@ class Connection(ConnectionInterface):
             :meth:`~tarantool.Connection.update`,
             :meth:`~tarantool.Connection.select`,
             :meth:`~tarantool.Connection.space`.
-        :type fetch_schema: :obj:`bool`, optional
+            If ``'lazy'``, schema is not loaded on connect: spaces and
+            indexes are fetched on first use, one by one, and names
+            which are not found are cached as missing until the server
+            schema changes. It makes the connection setup cheaper for
+            short-lived clients which use a few spaces.
+        :type fetch_schema: :obj:`bool` or :obj:`str`, optional
+
+        :param lazy_responses: If ``True``, the body of a successful
+            response is kept encoded and decoded on first access to
+            its data. Single rows accessed by index and the number of
+            rows are decoded without decoding the whole data. Refer to
+            :class:`~tarantool.response.Response`.
+        :type lazy_responses: :obj:`bool`, optional
+
+        :param raw_responses: Default ``raw`` option of
+            :meth:`~tarantool.Connection.select`,
+            :meth:`~tarantool.Connection.call`,
+            :meth:`~tarantool.Connection.eval` and
+            :meth:`~tarantool.Connection.execute`: if ``True``, their
+            response data is left MsgPack encoded, so it could be
+            forwarded without decoding and encoding again.
+        :type raw_responses: :obj:`bool`, optional
+
+        :param named_rows: If ``True``, tuples of a space returned by
+            :meth:`~tarantool.Connection.select`,
+            :meth:`~tarantool.Connection.insert` and other space
+            requests are decoded into row objects with access to fields
+            by name, built from the space format. Row classes are
+            cached in the schema and rebuilt after a schema reload.
+            Requires a loaded schema, refer to
+            :class:`~tarantool.rows.Row`.
+        :type named_rows: :obj:`bool`, optional
+
+        :param schema_cache_dir: Directory to cache the schema in. If
+            set, the schema loaded on connect is written to a file per
+            instance and user, and the next connections take it from
+            the file instead of fetching, while the server schema
+            version reported in reply to the ID request matches the
+            cached one. Files are replaced atomically, so the directory
+            may be shared by processes. Refer to
+            :class:`~tarantool.schema_cache.SchemaCache`.
+        :type schema_cache_dir: :obj:`str`, optional
+
+        :param schema_registry: Registry to share the schema loaded on
+            connect with other connections to instances of the same
+            replicaset. A connection takes the schema registered for
+            the replicaset, the user and the server schema version
+            instead of fetching it, and a schema fetched after a server
+            schema change is fetched by a single connection. The
+            replicaset UUID is requested with `box.info`_ once per
+            instance; the schema is not shared, if it is not allowed.
+            Not used with ``fetch_schema='lazy'``. Refer to
+            :class:`~tarantool.schema_cache.SchemaRegistry`.
+        :type schema_registry: :class:`~tarantool.schema_cache.SchemaRegistry`,
+            optional
 
         :raise: :exc:`~tarantool.error.ConfigurationError`,
             :meth:`~tarantool.Connection.connect` exceptions
@@ -756,22 +835,16 @@ class Connection(ConnectionInterface):
         .. _mp_str: https://github.com/msgpack/msgpack/blob/master/spec.md#str-format-family
         .. _mp_bin: https://github.com/msgpack/msgpack/blob/master/spec.md#bin-format-family
         .. _mp_array: https://github.com/msgpack/msgpack/blob/master/spec.md#array-format-family
+        .. _box.info: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_info/
         """
 
         if msgpack.version >= (1, 0, 0) and encoding not in (None, 'utf-8'):
             raise ConfigurationError("msgpack>=1.0.0 only supports None and " +
                                      "'utf-8' encoding option values")
+        if fetch_schema not in (True, False, 'lazy'):
+            raise ConfigurationError("fetch_schema must be True, False " +
+                                     "or 'lazy'")
 
-        if os.name == 'nt':
-            libc = ctypes.WinDLL(
-                ctypes.util.find_library('Ws2_32'), use_last_error=True
-            )
-        else:
-            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
-        recv = self._sys_recv = libc.recv
-        recv.argtypes = [
-            ctypes.c_int, ctypes.c_void_p, c_ssize_t, ctypes.c_int]
-        recv.restype = ctypes.c_int
         self.host = host
         self.port = port
         self.user = user
@@ -780,6 +853,14 @@ class Connection(ConnectionInterface):
         self.reconnect_delay = reconnect_delay
         self.reconnect_max_attempts = reconnect_max_attempts
         self.fetch_schema = fetch_schema
+        self.lazy_responses = lazy_responses
+        self.raw_responses = raw_responses
+        self.named_rows = named_rows
+        self.schema_cache = SchemaCache(schema_cache_dir) \
+            if schema_cache_dir is not None else None
+        self.schema_registry = schema_registry
+        self._server_schema_version = None
+        self._raw_syncs = set()
         self.schema = None
         self.schema_version = 0
         self._socket = None
@@ -805,8 +886,20 @@ class Connection(ConnectionInterface):
         }
         self._packer_factory_impl = packer_factory
         self._unpacker_factory_impl = unpacker_factory
+        self._packers = threading.local()
+        self._unpacker = None
+        self._unpacker_options = None
         self._client_auth_type = auth_type
         self._server_auth_type = None
+        self._sync_counter = itertools.count(1)
+        self._io_lock = threading.RLock()
+        self._send_lock = threading.Lock()
+        self._waiters_lock = threading.Lock()
+        self._waiters = {}
+        self._reader = None
+        self._recv_buffer = bytearray(RECV_BUFFER_SIZE)
+        self._recv_start = 0
+        self._recv_end = 0
 
         if connect_now:
             self.connect()
@@ -814,8 +907,11 @@ class Connection(ConnectionInterface):
     def close(self):
         """
         Close a connection to the server. The method is idempotent.
+        Requests which wait for responses in the background thread
+        fail with :exc:`~tarantool.error.NetworkError`.
         """
 
+        self._stop_reader()
         if self._socket is not None:
             self._socket.close()
         self._socket = None
@@ -839,6 +935,15 @@ class Connection(ConnectionInterface):
         :meta private:
         """
 
+        # The reader of the previous socket shares the receive buffer.
+        self._stop_reader()
+
+        # Drop data left from the previous socket.
+        self._raw_syncs.clear()
+        self._recv_buffer = bytearray(RECV_BUFFER_SIZE)
+        self._recv_start = 0
+        self._recv_end = 0
+
         if self.host is None:
             self.connect_unix()
         else:
@@ -899,6 +1004,24 @@ class Connection(ConnectionInterface):
         :meta private:
         """
 
+        context = self._ssl_context()
+
+        try:
+            self._socket = context.wrap_socket(self._socket)
+        except Exception as e:
+            raise SslError(e)
+
+    def _ssl_context(self):
+        """
+        Create an SSL context for the connection.
+
+        :rtype: :obj:`ssl.SSLContext`
+
+        :raise: :exc:`~tarantool.error.SslError`
+
+        :meta private:
+        """
+
         if not is_ssl_supported:
             raise SslError("Your version of Python doesn't support SSL")
 
@@ -938,13 +1061,13 @@ class Connection(ConnectionInterface):
 
             if self.ssl_ciphers:
                 context.set_ciphers(self.ssl_ciphers)
-
-            self._socket = context.wrap_socket(self._socket)
         except SslError as e:
             raise e
         except Exception as e:
             raise SslError(e)
 
+        return context
+
     def _ssl_load_cert_chain(self, context):
         """
         Decrypt and load SSL certificate and private key files.
@@ -1039,7 +1162,8 @@ class Connection(ConnectionInterface):
             self.handshake()
             if self.fetch_schema:
                 self.schema = Schema(self)
-                self.load_schema()
+                if self.fetch_schema != 'lazy':
+                    self.load_schema()
             else:
                 self.schema = None
         except SslError as e:
@@ -1061,17 +1185,35 @@ class Connection(ConnectionInterface):
         :meta private:
         """
 
-        buf = b""
-        while to_read > 0:
+        self._recv_fill(to_read)
+        start = self._recv_start
+        self._recv_start += to_read
+        return bytes(self._recv_buffer[start:start + to_read])
+
+    def _recv_fill(self, size):
+        """
+        Receive data from connection socket until the receive buffer
+        contains at least ``size`` unread bytes. Each read takes all
+        the data the kernel has, up to the free buffer space, so
+        a small response usually costs a single syscall.
+
+        :param size: Amount of unread data required, in bytes.
+        :type size: :obj:`int`
+
+        :raise: :exc:`~tarantool.error.NetworkError`
+
+        :meta private:
+        """
+
+        while self._recv_end - self._recv_start < size:
+            if len(self._recv_buffer) - self._recv_start < size:
+                self._recv_reserve(size)
+
             try:
-                tmp = self._socket.recv(to_read)
-            except OverflowError:
-                self._socket.close()
-                err = socket.error(
-                    errno.ECONNRESET,
-                    "Packet too large. Closing connection to server"
-                )
-                raise NetworkError(err)
+                with memoryview(self._recv_buffer) as view:
+                    nbytes = self._socket.recv_into(view[self._recv_end:])
+            except socket.timeout as e:
+                raise NetworkError(e)
             except socket.error:
                 err = socket.error(
                     errno.ECONNRESET,
@@ -1079,30 +1221,98 @@ class Connection(ConnectionInterface):
                 )
                 raise NetworkError(err)
             else:
-                if len(tmp) == 0:
+                if nbytes == 0:
                     err = socket.error(
                         errno.ECONNRESET,
                         "Lost connection to server during query"
                     )
                     raise NetworkError(err)
-                to_read -= len(tmp)
-                buf += tmp
-        return buf
+                self._recv_end += nbytes
+
+    def _recv_reserve(self, size):
+        """
+        Move unread data to the beginning of the receive buffer, if it
+        can fit ``size`` bytes, or to a new larger buffer otherwise.
+
+        Unread data overwrites the bytes of previous responses, so
+        memoryview slices returned by
+        :meth:`~tarantool.Connection._read_response` are valid only
+        until the next read from the connection. The buffer is replaced
+        rather than resized, because a :obj:`bytearray` with exported
+        slices cannot be resized.
+
+        :param size: Amount of data the buffer must fit, in bytes.
+        :type size: :obj:`int`
+
+        :meta private:
+        """
+
+        unread = self._recv_end - self._recv_start
+        if len(self._recv_buffer) >= size:
+            with memoryview(self._recv_buffer) as view:
+                view[:unread] = view[self._recv_start:self._recv_end]
+        else:
+            buffer = bytearray(max(size, 2 * len(self._recv_buffer)))
+            buffer[:unread] = self._recv_buffer[self._recv_start:self._recv_end]
+            self._recv_buffer = buffer
+        self._recv_start = 0
+        self._recv_end = unread
 
     def _read_response(self):
         """
         Read response from the transport (socket).
 
-        :return: Tuple of the form ``(header, body)``.
-        :rtype: :obj:`tuple`
+        The response is a slice of the connection receive buffer. It
+        is valid only until the next read from the connection: callers
+        must decode or copy it before reading the next response, refer
+        to :meth:`~tarantool.Connection._recv_reserve`.
+
+        :return: Response packet without the length prefix.
+        :rtype: :obj:`memoryview`
 
         :meta private:
         """
 
-        # Read packet length
-        length = msgpack.unpackb(self._recv(5))
+        if self._recv_start == self._recv_end:
+            self._recv_start = self._recv_end = 0
+            # Give memory back after a large response.
+            if len(self._recv_buffer) > RECV_BUFFER_SIZE:
+                self._recv_buffer = bytearray(RECV_BUFFER_SIZE)
+
+        # Read packet length: MessagePack uint32.
+        self._recv_fill(5)
+        if self._recv_buffer[self._recv_start] != 0xce:
+            raise NetworkError("Unexpected response length prefix")
+        length, = struct.unpack_from('>I', self._recv_buffer,
+                                     self._recv_start + 1)
+        self._recv_start += 5
+
         # Read the packet
-        return self._recv(length)
+        self._recv_fill(length)
+        start = self._recv_start
+        self._recv_start += length
+        return memoryview(self._recv_buffer)[start:start + length]
+
+    def _request_buffers(self, request):
+        """
+        Encode a request to be sent right away. The response body of
+        a request with ``raw`` set is kept encoded, so the request
+        IPROTO_SYNC is registered here, on submission, rather than on
+        encoding: the header is encoded again with a new IPROTO_SYNC
+        on each send.
+
+        :param request: Request to send.
+        :type request: :class:`~tarantool.request.Request`
+
+        :rtype: :obj:`list` of :obj:`bytes`
+
+        :meta private:
+        """
+
+        buffers = request.buffers()
+        if request.raw:
+            self._raw_syncs.add(request.sync)
+        return buffers
 
     def _send_request_wo_reconnect(self, request, on_push=None, on_push_ctx=None):
         """
@@ -1129,28 +1339,407 @@ class Connection(ConnectionInterface):
 
         assert isinstance(request, Request)
 
-        response = None
+        with self._io_lock:
+            # The reader is started under the lock, so it can not start
+            # while the socket is read here.
+            if not self._is_reader_alive():
+                return self._send_request_direct(request, on_push, on_push_ctx)
+
+        future = self._submit_requests([(request, on_push, on_push_ctx)])[0]
+        return self._wait_response(future)
+
+    def _send_request_direct(self, request, on_push=None, on_push_ctx=None):
+        """
+        Send request and read the response from the socket without
+        the reader thread. The caller must hold the I/O lock.
+        Refer to :meth:`~tarantool.Connection._send_request_wo_reconnect`.
+
+        :param request: Request to send.
+        :type request: :class:`~tarantool.request.Request`
+
+        :param on_push: Сallback for processing out-of-band messages.
+        :type on_push: :obj:`function`, optional
+
+        :param on_push_ctx: Сontext for working with on_push callback.
+        :type on_push_ctx: optional
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :meta private:
+        """
+
+        try:
+            response = None
+            while True:
+                try:
+                    self._sendall(self._request_buffers(request))
+                    response = request.response_class(
+                        self, self._read_response(), space_no=request.space_no)
+                    break
+                except SchemaReloadException as e:
+                    if self.schema is not None:
+                        self.update_schema(e.schema_version)
+                    continue
+
+            push_error = None
+            while response._code == IPROTO_CHUNK:
+                if on_push is not None and push_error is None:
+                    try:
+                        on_push(response._data, on_push_ctx)
+                    except Exception as e:
+                        # Read the rest of the responses, otherwise
+                        # the next request gets them.
+                        push_error = e
+                try:
+                    response = request.response_class(
+                        self, self._read_response(), space_no=request.space_no)
+                except NetworkError:
+                    raise
+                except DatabaseError:
+                    if push_error is None:
+                        raise
+                    break
+        except NetworkError:
+            # The socket has failed or a late response is still
+            # on the way: the stream is unusable either way.
+            self.connected = False
+            raise
+
+        if push_error is not None:
+            raise push_error
+        return response
+
+    def _sendall(self, buffers):
+        """
+        Send data to the socket. Buffers are passed to the kernel as is
+        with vectored writes, so they are never concatenated. SSL
+        sockets do not support vectored writes, the data is joined for
+        them.
+
+        :param buffers: Data to send.
+        :type buffers: :obj:`list` of :obj:`bytes`
+
+        :raise: :exc:`~tarantool.error.NetworkError`
+
+        :meta private:
+        """
+
+        try:
+            if self.transport == SSL_TRANSPORT or not hasattr(socket, 'sendmsg'):
+                self._socket.sendall(b''.join(buffers))
+            else:
+                self._sendmsg_all(buffers)
+        except socket.timeout as e:
+            raise NetworkError(e)
+        except (socket.error, AttributeError):
+            raise NetworkError(socket.error(errno.ECONNRESET,
+                                            "Lost connection to server during query"))
+
+    def _sendmsg_all(self, buffers):
+        """
+        Send all buffers with :meth:`socket.socket.sendmsg`, continue
+        after partial writes.
+
+        :param buffers: Data to send.
+        :type buffers: :obj:`list` of :obj:`bytes`
+
+        :meta private:
+        """
+
+        buffers = [memoryview(buf) for buf in buffers if len(buf)]
+        pos = 0
+        while pos < len(buffers):
+            sent = self._socket.sendmsg(buffers[pos:pos + IOV_MAX])
+            while sent:
+                size = len(buffers[pos])
+                if sent < size:
+                    buffers[pos] = buffers[pos][sent:]
+                    break
+                sent -= size
+                pos += 1
+
+    def _is_reader_alive(self):
+        """
+        Check whether the background reader thread is running.
+
+        :rtype: :obj:`bool`
+
+        :meta private:
+        """
+
+        reader = self._reader
+        return reader is not None and reader.is_alive()
+
+    def _start_reader(self):
+        """
+        Start the background thread which reads responses from the
+        socket and resolves the futures of sent requests. After the
+        thread is started, all requests of the connection are sent
+        through it.
+
+        :meta private:
+        """
+
+        with self._io_lock:
+            if self._is_reader_alive():
+                return
+            # Timeouts are tracked per request, the reader blocks
+            # until a response or a connection close.
+            self._socket.settimeout(None)
+            self._reader = threading.Thread(target=self._reader_loop,
+                                            args=(self._socket,),
+                                            name='tarantool-reader',
+                                            daemon=True)
+            self._reader.start()
+
+    def _stop_reader(self):
+        """
+        Wake up the background reader thread blocked on the socket and
+        wait for it to exit. The thread reads the connection socket and
+        receive buffer, so it must be stopped before they are replaced.
+
+        :meta private:
+        """
+
+        reader = self._reader
+        if reader is None or reader is threading.current_thread():
+            return
+        if reader.is_alive() and self._socket is not None:
+            try:
+                self._socket.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+        reader.join()
+
+    def _reader_loop(self, sock):
+        """
+        Read responses and dispatch them to waiters by IPROTO_SYNC
+        until the connection is closed or lost.
+
+        :param sock: Socket the thread was started for.
+        :type sock: :obj:`socket.socket`
+
+        :meta private:
+        """
+
+        error = None
         while True:
             try:
-                self._socket.sendall(bytes(request))
-                response = request.response_class(self, self._read_response())
+                # The packet is a slice of the receive buffer, it is
+                # decoded before the next read reuses the buffer.
+                message = unpack_response(self, self._read_response())
+                sync = message[0].get(IPROTO_SYNC, 0)
+            except NetworkError as e:
+                error = e
+                break
+            except Exception as e:
+                error = NetworkError(e)
                 break
+
+            with self._waiters_lock:
+                waiter = self._waiters.get(sync)
+            if waiter is None:
+                # The request has been abandoned on timeout.
+                continue
+            future, request, on_push, on_push_ctx = waiter
+
+            try:
+                response = request.response_class(
+                    self, message, space_no=request.space_no)
             except SchemaReloadException as e:
+                self._pop_waiter(sync)
                 if self.schema is not None:
-                    self.update_schema(e.schema_version)
+                    # Schema is fetched on demand from the application
+                    # threads: the reader must not wait for responses.
+                    self.schema_version = e.schema_version
+                    self._server_schema_version = None
+                    self.schema.invalidate()
+                # The reader must not send: a write blocked on a full
+                # socket would wait for the server, which waits for
+                # its responses to be read.
+                threading.Thread(target=self._resend_request,
+                                 args=(request, on_push, on_push_ctx, future),
+                                 name='tarantool-resend',
+                                 daemon=True).start()
+                continue
+            except Exception as e:
+                self._pop_waiter(sync)
+                future.set_exception(e)
+                continue
+
+            if response._code == IPROTO_CHUNK:
+                if on_push is not None:
+                    try:
+                        on_push(response._data, on_push_ctx)
+                    except Exception as e:
+                        self._pop_waiter(sync)
+                        future.set_exception(e)
                 continue
 
-        while response._code == IPROTO_CHUNK:
-            if on_push is not None: 
-                on_push(response._data, on_push_ctx)
-            response = request.response_class(self, self._read_response())
+            self._pop_waiter(sync)
+            future.set_result(response)
 
-        return response
+        if sock is self._socket:
+            self.connected = False
+
+        with self._waiters_lock:
+            waiters, self._waiters = self._waiters, {}
+        for sync, (future, _, _, _) in waiters.items():
+            self._raw_syncs.discard(sync)
+            future.set_exception(error)
+
+    def _resend_request(self, request, on_push, on_push_ctx, future):
+        """
+        Send again a request rejected with outdated schema error,
+        resolve the same future with the response.
+
+        :param request: Request to send.
+        :type request: :class:`~tarantool.request.Request`
+
+        :param on_push: Сallback for processing out-of-band messages.
+        :type on_push: :obj:`function`, optional
+
+        :param on_push_ctx: Сontext for working with on_push callback.
+        :type on_push_ctx: optional
+
+        :param future: Request future.
+        :type future: :class:`~concurrent.futures.Future`
+
+        :meta private:
+        """
+
+        try:
+            self._submit_requests([(request, on_push, on_push_ctx)], [future])
+        except NetworkError as e:
+            future.set_exception(e)
+
+    def _pop_waiter(self, sync):
+        """
+        Forget a request waiting for a response.
+
+        :param sync: Request IPROTO_SYNC.
+        :type sync: :obj:`int`
+
+        :meta private:
+        """
+
+        # A response to a raw request may never come.
+        self._raw_syncs.discard(sync)
+        with self._waiters_lock:
+            return self._waiters.pop(sync, None)
+
+    def _submit_requests(self, entries, futures=None):
+        """
+        Send requests with a single write without waiting for
+        responses. Responses are processed by the reader thread.
+
+        :param entries: List of ``(request, on_push, on_push_ctx)``
+            tuples.
+        :type entries: :obj:`list`
+
+        :param futures: Futures to resolve with responses. New futures
+            are created, if not set.
+        :type futures: :obj:`list` of :class:`~concurrent.futures.Future`,
+            optional
+
+        :rtype: :obj:`list` of :class:`~concurrent.futures.Future`
+
+        :raise: :exc:`~tarantool.error.NetworkError`
+
+        :meta private:
+        """
+
+        if futures is None:
+            futures = [concurrent.futures.Future() for _ in entries]
+
+        packets = []
+        syncs = []
+        with self._waiters_lock:
+            # The reader fails all waiters on exit, new ones would
+            # never be resolved.
+            if not self.connected:
+                raise NetworkError(socket.error(errno.ECONNRESET,
+                                                "Lost connection to server during query"))
+            for (request, on_push, on_push_ctx), future in zip(entries, futures):
+                packets.extend(self._request_buffers(request))
+                syncs.append(request.sync)
+                self._waiters[request.sync] = (future, request, on_push, on_push_ctx)
+
+        try:
+            with self._send_lock:
+                self._sendall(packets)
+        except NetworkError:
+            # Let the next request reconnect.
+            self.connected = False
+            for sync in syncs:
+                self._pop_waiter(sync)
+            raise
+
+        return futures
+
+    def _wait_response(self, future):
+        """
+        Wait for a response of a request sent through the reader
+        thread. Wait no longer than
+        :paramref:`~tarantool.Connection.socket_timeout`.
+
+        :param future: Request future.
+        :type future: :class:`~concurrent.futures.Future`
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :raise: :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.NetworkError`
+
+        :meta private:
+        """
+
+        try:
+            return future.result(timeout=self.socket_timeout)
+        except concurrent.futures.TimeoutError:
+            with self._waiters_lock:
+                for sync, waiter in list(self._waiters.items()):
+                    if waiter[0] is future:
+                        del self._waiters[sync]
+                        self._raw_syncs.discard(sync)
+            raise NetworkError(socket.timeout('timed out'))
+
+    def _send_request_async(self, request, on_push=None, on_push_ctx=None):
+        """
+        Send a request to the server without waiting for a response.
+        Start the reader thread, if required.
+
+        :param request: Request to send.
+        :type request: :class:`~tarantool.request.Request`
+
+        :param on_push: Сallback for processing out-of-band messages.
+            It is called from the reader thread.
+        :type on_push: :obj:`function`, optional
+
+        :param on_push_ctx: Сontext for working with on_push callback.
+        :type on_push_ctx: optional
+
+        :rtype: :class:`~concurrent.futures.Future`
+
+        :raise: :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+
+        :meta private:
+        """
+
+        assert isinstance(request, Request)
+
+        with self._io_lock:
+            self._opt_reconnect()
+            self._start_reader()
+
+        return self._submit_requests([(request, on_push, on_push_ctx)])[0]
 
     def _opt_reconnect(self):
         """
-        Check that the connection is alive using low-level recv from
-        libc(ctypes).
+        Reconnect, if the connection has been closed or lost. A lost
+        connection is detected by a failed socket read or write, so
+        there are no checks for a healthy connection.
 
         :raise: :exc:`~tarantool.error.NetworkError`,
             :exc:`~tarantool.error.SslError`
@@ -1158,44 +1747,10 @@ class Connection(ConnectionInterface):
         :meta private:
         """
 
-        # **Bug in Python: timeout is an internal Python construction (???).
         if not self._socket:
             return self.connect()
 
-        def check():  # Check that connection is alive
-            buf = ctypes.create_string_buffer(2)
-            try:
-                sock_fd = self._socket.fileno()
-            except socket.error as e:
-                if e.errno == errno.EBADF:
-                    return errno.ECONNRESETtuple_value
-            else:
-                if os.name == 'nt':
-                    flag = socket.MSG_PEEK
-                    self._socket.setblocking(False)
-                else:
-                    flag = socket.MSG_DONTWAIT | socket.MSG_PEEK
-                retbytes = self._sys_recv(sock_fd, buf, 1, flag)
-
-                err = 0
-                if os.name!= 'nt':
-                    err = ctypes.get_errno()
-                else:
-                    err = ctypes.get_last_error()
-                    self._socket.setblocking(True)
-
-
-                WWSAEWOULDBLOCK = 10035
-                if (retbytes < 0) and (err == errno.EAGAIN or
-                                       err == errno.EWOULDBLOCK or
-                                       err == WWSAEWOULDBLOCK):
-                    ctypes.set_errno(0)
-                    return errno.EAGAIN
-                else:
-                    return errno.ECONNRESET
-
-        last_errno = check()
-        if self.connected and last_errno == errno.EAGAIN:
+        if self.connected:
             return
 
         attempt = 0
@@ -1218,6 +1773,11 @@ class Connection(ConnectionInterface):
         if self.transport == SSL_TRANSPORT:
             self.wrap_socket_ssl()
         self.handshake()
+        if self._reader is not None:
+            # Requests of the connection have been sent through the
+            # reader thread: keep it so after the reconnect, so a slow
+            # request does not hold the socket for the others.
+            self._start_reader()
 
     def _send_request(self, request, on_push=None, on_push_ctx=None):
         """
@@ -1244,52 +1804,364 @@ class Connection(ConnectionInterface):
         """
         assert isinstance(request, Request)
 
-        self._opt_reconnect()
+        with self._io_lock:
+            self._opt_reconnect()
+
+        try:
+            return self._send_request_wo_reconnect(request, on_push, on_push_ctx)
+        except NetworkError as e:
+            # The server may have already executed a non-idempotent
+            # request, so only idempotent ones are sent again.
+            if not request.idempotent or e.errno != errno.ECONNRESET:
+                raise
+
+        with self._io_lock:
+            self._opt_reconnect()
 
         return self._send_request_wo_reconnect(request, on_push, on_push_ctx)
 
-    def load_schema(self):
+    def _send_requests(self, entries, return_exceptions=False):
         """
-        Fetch space and index schema.
+        Send a batch of requests to the server in a single write and
+        read all responses matching them by IPROTO_SYNC. Requests
+        rejected with outdated schema error are sent again after
+        schema reload; other request errors do not interrupt
+        the batch.
 
-        :raise: :exc:`~tarantool.error.SchemaError`,
-            :exc:`~tarantool.error.DatabaseError`
+        :param entries: List of ``(request, on_push, on_push_ctx)``
+            tuples.
+        :type entries: :obj:`list`
 
-        :meta private:
-        """
+        :param return_exceptions: If ``True``, request errors are
+            returned in place of responses. Otherwise, the first error
+            is raised after all responses are received.
+        :type return_exceptions: :obj:`bool`, optional
 
-        self.schema.fetch_space_all()
-        self.schema.fetch_index_all()
+        :return: Responses in the order of requests.
+        :rtype: :obj:`list`
 
-    def update_schema(self, schema_version):
+        :raise: :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+
+        :meta private:
         """
-        Set new schema version metainfo, reload space and index schema.
 
-        :param schema_version: New schema version metainfo.
-        :type schema_version: :obj:`int`
+        if not entries:
+            return []
+
+        with self._io_lock:
+            self._opt_reconnect()
+            # The reader is started under the lock, so it can not start
+            # while the socket is read here.
+            results = None
+            if not self._is_reader_alive():
+                try:
+                    results = self._send_requests_wo_reconnect(entries)
+                except NetworkError:
+                    self.connected = False
+                    raise
+
+        if results is None:
+            futures = self._submit_requests(entries)
+            results = []
+            for future in futures:
+                try:
+                    results.append(self._wait_response(future))
+                except DatabaseError as e:
+                    results.append(e)
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+        return results
+
+    def _send_requests_wo_reconnect(self, entries):
+        """
+        Send a batch of requests and read the responses without
+        the reader thread. Refer to
+        :meth:`~tarantool.Connection._send_requests`.
+
+        :param entries: List of ``(request, on_push, on_push_ctx)``
+            tuples.
+        :type entries: :obj:`list`
+
+        :return: Responses and request errors in the order of requests.
+        :rtype: :obj:`list`
 
         :raise: :exc:`~tarantool.error.SchemaError`,
-            :exc:`~tarantool.error.DatabaseError`
+            :exc:`~tarantool.error.NetworkError`
 
         :meta private:
         """
 
-        if self.schema is None:
-            self.schema = Schema(self)
+        results = [None] * len(entries)
+        pending = list(range(len(entries)))
+
+        while pending:
+            in_flight = {}
+            packets = []
+            for pos in pending:
+                request = entries[pos][0]
+                packets.extend(self._request_buffers(request))
+                in_flight[request.sync] = pos
+            self._sendall(packets)
+
+            pending = []
+            schema_version = None
+            failed = set()
+            while in_flight:
+                message = unpack_response(self, self._read_response())
+                sync = message[0].get(IPROTO_SYNC, 0)
+                if sync not in in_flight:
+                    raise NetworkError(
+                        "Got response with unexpected sync %d" % sync)
+                pos = in_flight[sync]
+                request, on_push, on_push_ctx = entries[pos]
+
+                if sync in failed:
+                    # The on_push error is the request result, the rest
+                    # of its responses are read and dropped.
+                    if message[0][IPROTO_REQUEST_TYPE] != IPROTO_CHUNK:
+                        self._raw_syncs.discard(sync)
+                        del in_flight[sync]
+                    continue
+
+                try:
+                    response = request.response_class(
+                        self, message, space_no=request.space_no)
+                except SchemaReloadException as e:
+                    schema_version = e.schema_version
+                    pending.append(pos)
+                    del in_flight[sync]
+                    continue
+                except DatabaseError as e:
+                    results[pos] = e
+                    del in_flight[sync]
+                    continue
+
+                if response._code == IPROTO_CHUNK:
+                    if on_push is not None:
+                        try:
+                            on_push(response._data, on_push_ctx)
+                        except Exception as e:
+                            results[pos] = e
+                            failed.add(sync)
+                    continue
+
+                results[pos] = response
+                del in_flight[sync]
+
+            if pending:
+                if self.schema is not None:
+                    self.update_schema(schema_version)
+                pending.sort()
+
+        return results
+
+    def load_schema(self):
+        """
+        Fetch space and index schema. With
+        :paramref:`~tarantool.Connection.params.schema_registry`, take
+        the schema registered for the server schema version or register
+        the fetched one. With
+        :paramref:`~tarantool.Connection.params.schema_cache_dir`, take
+        it from the cache file, if the file matches the server schema
+        version, or write the fetched schema to the file otherwise.
+        The connection then sends requests with the version of the
+        loaded schema, so the server reports schema changes.
+
+        :raise: :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        replicaset_uuid = None
+        if self.schema_registry is not None and self._server_schema_version:
+            replicaset_uuid = self._replicaset_uuid()
+        if replicaset_uuid is None:
+            self._load_schema()
+            return
+
+        def fetch():
+            version = self._load_schema()
+            return self.schema.schema, version
+
+        spaces, version = self.schema_registry.load(
+            replicaset_uuid, self.user, self._server_schema_version, fetch)
+        if version:
+            self.schema.share(spaces)
+            self.schema_version = version
+
+    def _load_schema(self):
+        """
+        Fetch space and index schema or read it from the cache file,
+        refer to :meth:`~tarantool.Connection.load_schema`.
+
+        :return: Schema version of the loaded schema or ``None``, if it
+            is not known.
+        :rtype: :obj:`int` or :obj:`None`
+
+        :raise: :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
+
+        if self.schema_cache is None or self.uuid is None:
+            spaces = self.schema.fetch_space_all()
+            indexes = self.schema.fetch_index_all()
+            if spaces.schema_version != indexes.schema_version:
+                return None
+            return spaces.schema_version
+
+        version = self._server_schema_version
+        cached = None
+        if version:
+            cached = self.schema_cache.read(self.uuid, self.user, version)
+        if cached is not None:
+            self.schema.load_encoded(*cached)
+            self.schema_version = version
+            return version
+
+        spaces = self.schema.fetch_space_from(None, raw=True)
+        indexes = self.schema.fetch_index_from(None, None, raw=True)
+        self.schema.load_encoded(spaces.raw_data, indexes.raw_data)
+        version = spaces.schema_version
+        if not version or version != indexes.schema_version:
+            # The schema has changed between the requests.
+            return None
+        self.schema_version = version
+        try:
+            self.schema_cache.write(self.uuid, self.user, version,
+                                    spaces.raw_data, indexes.raw_data)
+        except OSError as e:
+            warn("Failed to write schema cache: %s" % e, SchemaCacheWarning)
+        return version
+
+    def _replicaset_uuid(self):
+        """
+        Get the replicaset UUID of the instance to look the schema up
+        in :paramref:`~tarantool.Connection.params.schema_registry`.
+
+        :return: Replicaset UUID or ``None``, if it cannot be requested.
+        :rtype: :obj:`str` or :obj:`None`
+
+        :meta private:
+        """
+
+        if self.uuid is None:
+            return None
+        replicaset_uuid = self.schema_registry.get_replicaset(self.uuid)
+        if replicaset_uuid is not None:
+            return replicaset_uuid
+
+        try:
+            info = self.call('box.info', raw=False).data[0]
+        except DatabaseError:
+            return None
+        # box.info.cluster is the cluster configuration since
+        # Tarantool 3.0, box.info.replicaset replaces it.
+        replicaset = info.get('replicaset') or info.get('cluster') or {}
+        replicaset_uuid = replicaset.get('uuid')
+        if replicaset_uuid is None:
+            return None
+        self.schema_registry.set_replicaset(self.uuid, replicaset_uuid)
+        return str(replicaset_uuid)
+
+    def _row_class(self, space_no):
+        """
+        Get the row class of a space, refer to
+        :paramref:`~tarantool.Connection.params.named_rows`. The space
+        schema is fetched, if it is not loaded.
+
+        :param space_no: Space id.
+        :type space_no: :obj:`int`
+
+        :return: Row class or ``None``, if the space does not exist
+            anymore.
+        :rtype: :obj:`type` or :obj:`None`
+
+        :meta private:
+        """
+
+        if space_no in (SPACE_SPACE, SPACE_VSPACE, SPACE_INDEX, SPACE_VINDEX):
+            # Schema requests select from these spaces themselves.
+            space = self.schema.schema.get(space_no)
+            if space is None or space.stale:
+                return None
+            return space.row_class
+        try:
+            return self.schema.get_space(space_no).row_class
+        except SchemaError:
+            return None
+
+    def _response_space(self, space_no):
+        """
+        Get the schema of a space which tuples are returned in
+        a response. The space schema is fetched, if it is not loaded.
+
+        :param space_no: Space id.
+        :type space_no: :obj:`int`
+
+        :rtype: :class:`~tarantool.schema.SchemaSpace`
+
+        :raise: :exc:`~tarantool.error.SchemaError`
+
+        :meta private:
+        """
+
+        return self.schema.get_space(space_no)
+
+    def update_schema(self, schema_version):
+        """
+        Set new schema version metainfo and mark the loaded space and
+        index schema stale: spaces are fetched again on next use, refer
+        to :meth:`~tarantool.schema.Schema.invalidate`. The whole schema
+        is loaded, if the connection has no schema yet or it is shared
+        through :paramref:`~tarantool.Connection.params.schema_registry`.
+
+        :param schema_version: New schema version metainfo.
+        :type schema_version: :obj:`int`
+
+        :raise: :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.DatabaseError`
+
+        :meta private:
+        """
 
         self.schema_version = schema_version
-        self.flush_schema()
+        # The version got on connect is outdated, the server has
+        # reported the current one.
+        self._server_schema_version = schema_version
+        if self.schema is None:
+            self.schema = Schema(self)
+            self.load_schema()
+        elif self.schema.shared:
+            # Other connections are likely to get the same schema
+            # change: the new schema is fetched once for all of them.
+            self.schema.flush()
+            self.load_schema()
+        else:
+            self.schema.invalidate()
 
     def flush_schema(self):
         """
-        Reload space and index schema.
+        Reload space and index schema. In lazy mode (refer to
+        :paramref:`~tarantool.Connection.params.fetch_schema`), only
+        drop the loaded schema.
 
         :raise: :exc:`~tarantool.error.SchemaError`,
             :exc:`~tarantool.error.DatabaseError`
         """
 
         self.schema.flush()
-        self.load_schema()
+        if self.fetch_schema != 'lazy':
+            self.load_schema()
 
     def _schemaful_connection_check(self):
         """
@@ -1304,7 +2176,7 @@ class Connection(ConnectionInterface):
             raise NotSupportedError('This method is not available in ' +
                                     'connection opened with fetch_schema=False')
 
-    def call(self, func_name, *args, on_push=None, on_push_ctx=None):
+    def call(self, func_name, *args, on_push=None, on_push_ctx=None, raw=None):
         """
         Execute a CALL request: call a stored Lua function.
 
@@ -1320,6 +2192,15 @@ class Connection(ConnectionInterface):
         :param on_push_ctx: Сontext for working with on_push callback.
         :type on_push_ctx: optional
 
+        :param raw: If ``True``, response data is not decoded:
+            :attr:`~tarantool.response.Response.data` is a list of
+            MsgPack encoded rows and
+            :attr:`~tarantool.response.Response.raw_data` is
+            the encoded data array. If ``None``,
+            :paramref:`~tarantool.Connection.params.raw_responses` is
+            used.
+        :type raw: :obj:`bool` or :obj:`None`, optional
+
         :rtype: :class:`~tarantool.response.Response`
 
         :raise: :exc:`~AssertionError`,
@@ -1328,19 +2209,56 @@ class Connection(ConnectionInterface):
             :exc:`~tarantool.error.SslError`
         """
 
-        assert isinstance(func_name, str)
         if on_push is not None and not callable(on_push):
             raise TypeError('The on_push callback must be callable')
 
+        request = self._request_call(func_name, *args, raw=raw)
+        response = self._send_request(request, on_push, on_push_ctx)
+        return response
+
+    def _send_encoded(self, request):
+        """
+        Send a request built by another connection, refer to
+        :meth:`~tarantool.request.Request.bind`. It is used to send
+        a request encoded once to many servers.
+
+        :param request: Request to send.
+        :type request: :class:`~tarantool.request.Request`
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :raise: :exc:`~AssertionError`,
+            :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+
+        :meta private:
+        """
+
+        return self._send_request(request.bind(self))
+
+    def _request_call(self, func_name, *args, raw=None):
+        """
+        Build a CALL request. Refer to
+        :meth:`~tarantool.Connection.call`.
+
+        :rtype: :class:`~tarantool.request.RequestCall`
+
+        :meta private:
+        """
+
+        assert isinstance(func_name, str)
+
         # This allows to use a tuple or list as an argument
         if len(args) == 1 and isinstance(args[0], (list, tuple)):
             args = args[0]
 
         request = RequestCall(self, func_name, args, self.call_16)
-        response = self._send_request(request, on_push, on_push_ctx)
-        return response
+        request.raw = self.raw_responses if raw is None else raw
+        return request
 
-    def eval(self, expr, *args, on_push=None, on_push_ctx=None):
+    def eval(self, expr, *args, on_push=None, on_push_ctx=None, raw=None):
         """
         Execute an EVAL request: evaluate a Lua expression.
 
@@ -1356,6 +2274,15 @@ class Connection(ConnectionInterface):
         :param on_push_ctx: Сontext for working with on_push callback.
         :type on_push_ctx: optional
 
+        :param raw: If ``True``, response data is not decoded:
+            :attr:`~tarantool.response.Response.data` is a list of
+            MsgPack encoded rows and
+            :attr:`~tarantool.response.Response.raw_data` is
+            the encoded data array. If ``None``,
+            :paramref:`~tarantool.Connection.params.raw_responses` is
+            used.
+        :type raw: :obj:`bool` or :obj:`None`, optional
+
         :rtype: :class:`~tarantool.response.Response`
 
         :raise: :exc:`~AssertionError`,
@@ -1365,17 +2292,32 @@ class Connection(ConnectionInterface):
             :exc:`~tarantool.error.SslError`
         """
 
-        assert isinstance(expr, str)
         if on_push is not None and not callable(on_push):
             raise TypeError('The on_push callback must be callable')
 
+        request = self._request_eval(expr, *args, raw=raw)
+        response = self._send_request(request, on_push, on_push_ctx)
+        return response
+
+    def _request_eval(self, expr, *args, raw=None):
+        """
+        Build an EVAL request. Refer to
+        :meth:`~tarantool.Connection.eval`.
+
+        :rtype: :class:`~tarantool.request.RequestEval`
+
+        :meta private:
+        """
+
+        assert isinstance(expr, str)
+
         # This allows to use a tuple or list as an argument
         if len(args) == 1 and isinstance(args[0], (list, tuple)):
             args = args[0]
 
         request = RequestEval(self, expr, args)
-        response = self._send_request(request, on_push, on_push_ctx)
-        return response
+        request.raw = self.raw_responses if raw is None else raw
+        return request
 
     def replace(self, space_name, values, on_push=None, on_push_ctx=None):
         """
@@ -1407,15 +2349,28 @@ class Connection(ConnectionInterface):
         .. _replace: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/replace/
         """
 
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_replace(space_name, values)
+        return self._send_request(request, on_push, on_push_ctx)
+
+    def _request_replace(self, space_name, values):
+        """
+        Build a REPLACE request. Refer to
+        :meth:`~tarantool.Connection.replace`.
+
+        :rtype: :class:`~tarantool.request.RequestReplace`
+
+        :meta private:
+        """
+
         self._schemaful_connection_check()
 
         if isinstance(space_name, str):
             space_name = self.schema.get_space(space_name).sid
-        if on_push is not None and not callable(on_push):
-            raise TypeError('The on_push callback must be callable')
 
-        request = RequestReplace(self, space_name, values)
-        return self._send_request(request, on_push, on_push_ctx)
+        return RequestReplace(self, space_name, values)
 
     def authenticate(self, user, password):
         """
@@ -1628,15 +2583,28 @@ class Connection(ConnectionInterface):
         .. _insert: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/insert/
         """
 
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_insert(space_name, values)
+        return self._send_request(request, on_push, on_push_ctx)
+
+    def _request_insert(self, space_name, values):
+        """
+        Build an INSERT request. Refer to
+        :meth:`~tarantool.Connection.insert`.
+
+        :rtype: :class:`~tarantool.request.RequestInsert`
+
+        :meta private:
+        """
+
         self._schemaful_connection_check()
 
         if isinstance(space_name, str):
             space_name = self.schema.get_space(space_name).sid
-        if on_push is not None and not callable(on_push):
-            raise TypeError('The on_push callback must be callable')
 
-        request = RequestInsert(self, space_name, values)
-        return self._send_request(request, on_push, on_push_ctx)
+        return RequestInsert(self, space_name, values)
 
     def delete(self, space_name, key, *, index=0, on_push=None, on_push_ctx=None):
         """
@@ -1670,6 +2638,22 @@ class Connection(ConnectionInterface):
         .. _delete: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/delete/
         """
 
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_delete(space_name, key, index=index)
+        return self._send_request(request, on_push, on_push_ctx)
+
+    def _request_delete(self, space_name, key, *, index=0):
+        """
+        Build a DELETE request. Refer to
+        :meth:`~tarantool.Connection.delete`.
+
+        :rtype: :class:`~tarantool.request.RequestDelete`
+
+        :meta private:
+        """
+
         self._schemaful_connection_check()
 
         key = wrap_key(key)
@@ -1677,11 +2661,8 @@ class Connection(ConnectionInterface):
             space_name = self.schema.get_space(space_name).sid
         if isinstance(index, str):
             index = self.schema.get_index(space_name, index).iid
-        if on_push is not None and not callable(on_push):
-            raise TypeError('The on_push callback must be callable')
 
-        request = RequestDelete(self, space_name, index, key)
-        return self._send_request(request, on_push, on_push_ctx)
+        return RequestDelete(self, space_name, index, key)
 
     def upsert(self, space_name, tuple_value, op_list, *, index=0, on_push=None, on_push_ctx=None):
         """
@@ -1732,19 +2713,32 @@ class Connection(ConnectionInterface):
         .. _upsert: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/upsert/
         """
 
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_upsert(space_name, tuple_value, op_list,
+                                       index=index)
+        return self._send_request(request, on_push, on_push_ctx)
+
+    def _request_upsert(self, space_name, tuple_value, op_list, *, index=0):
+        """
+        Build an UPSERT request. Refer to
+        :meth:`~tarantool.Connection.upsert`.
+
+        :rtype: :class:`~tarantool.request.RequestUpsert`
+
+        :meta private:
+        """
+
         self._schemaful_connection_check()
 
         if isinstance(space_name, str):
             space_name = self.schema.get_space(space_name).sid
         if isinstance(index, str):
             index = self.schema.get_index(space_name, index).iid
-        if on_push is not None and not callable(on_push):
-            raise TypeError('The on_push callback must be callable')
 
         op_list = self._ops_process(space_name, op_list)
-        request = RequestUpsert(self, space_name, index, tuple_value,
-                                op_list)
-        return self._send_request(request, on_push, on_push_ctx)
+        return RequestUpsert(self, space_name, index, tuple_value, op_list)
 
     def update(self, space_name, key, op_list, *, index=0, on_push=None, on_push_ctx=None):
         """
@@ -1823,6 +2817,22 @@ class Connection(ConnectionInterface):
         .. _update: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/update/
         """
 
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_update(space_name, key, op_list, index=index)
+        return self._send_request(request, on_push, on_push_ctx)
+
+    def _request_update(self, space_name, key, op_list, *, index=0):
+        """
+        Build an UPDATE request. Refer to
+        :meth:`~tarantool.Connection.update`.
+
+        :rtype: :class:`~tarantool.request.RequestUpdate`
+
+        :meta private:
+        """
+
         self._schemaful_connection_check()
 
         key = wrap_key(key)
@@ -1830,12 +2840,9 @@ class Connection(ConnectionInterface):
             space_name = self.schema.get_space(space_name).sid
         if isinstance(index, str):
             index = self.schema.get_index(space_name, index).iid
-        if on_push is not None and not callable(on_push):
-            raise TypeError('The on_push callback must be callable')
 
         op_list = self._ops_process(space_name, op_list)
-        request = RequestUpdate(self, space_name, index, key, op_list)
-        return self._send_request(request, on_push, on_push_ctx)
+        return RequestUpdate(self, space_name, index, key, op_list)
 
     def ping(self, notime=False):
         """
@@ -1865,7 +2872,7 @@ class Connection(ConnectionInterface):
             return "Success"
         return t1 - t0
 
-    def select(self, space_name, key=None, *, offset=0, limit=0xffffffff, index=0, iterator=None, on_push=None, on_push_ctx=None):
+    def select(self, space_name, key=None, *, offset=0, limit=0xffffffff, index=0, iterator=None, on_push=None, on_push_ctx=None, raw=None):
         """
         Execute a SELECT request: `select`_ a tuple from the space.
 
@@ -1999,6 +3006,15 @@ class Connection(ConnectionInterface):
 
         :param on_push_ctx: Сontext for working with on_push callback.
         :type on_push_ctx: optional
+
+        :param raw: If ``True``, response data is not decoded:
+            :attr:`~tarantool.response.Response.data` is a list of
+            MsgPack encoded rows and
+            :attr:`~tarantool.response.Response.raw_data` is
+            the encoded data array. If ``None``,
+            :paramref:`~tarantool.Connection.params.raw_responses` is
+            used.
+        :type raw: :obj:`bool` or :obj:`None`, optional
         
         :rtype: :class:`~tarantool.response.Response`
 
@@ -2012,6 +3028,26 @@ class Connection(ConnectionInterface):
         .. _select: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_space/select/
         """
 
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_select(space_name, key, offset=offset,
+                                       limit=limit, index=index,
+                                       iterator=iterator, raw=raw)
+        response = self._send_request(request, on_push, on_push_ctx)
+        return response
+
+    def _request_select(self, space_name, key=None, *, offset=0,
+                        limit=0xffffffff, index=0, iterator=None, raw=None):
+        """
+        Build a SELECT request. Refer to
+        :meth:`~tarantool.Connection.select`.
+
+        :rtype: :class:`~tarantool.request.RequestSelect`
+
+        :meta private:
+        """
+
         self._schemaful_connection_check()
 
         if iterator is None:
@@ -2028,13 +3064,149 @@ class Connection(ConnectionInterface):
             space_name = self.schema.get_space(space_name).sid
         if isinstance(index, str):
             index = self.schema.get_index(space_name, index).iid
-        if on_push is not None and not callable(on_push):
-            raise TypeError('The on_push callback must be callable')
 
         request = RequestSelect(self, space_name, index, key, offset,
                                 limit, iterator)
-        response = self._send_request(request, on_push, on_push_ctx)
-        return response
+        request.raw = self.raw_responses if raw is None else raw
+        return request
+
+    def select_stream(self, space_name, key=None, *, offset=0, limit=0xffffffff, index=0, iterator=None, on_push=None, on_push_ctx=None):
+        """
+        Execute a SELECT request and return a response which decodes
+        rows one at a time while it is iterated. Peak memory of a large
+        select is then about the size of the encoded response instead
+        of the size of all decoded rows.
+
+        .. code-block:: python
+
+            for row in conn.select_stream('demo', iterator='ALL'):
+                process(row)
+
+        :param space_name: Refer to
+            :paramref:`~tarantool.Connection.select.params.space_name`.
+
+        :param key: Refer to
+            :paramref:`~tarantool.Connection.select.params.key`.
+
+        :param offset: Refer to
+            :paramref:`~tarantool.Connection.select.params.offset`.
+
+        :param limit: Refer to
+            :paramref:`~tarantool.Connection.select.params.limit`.
+
+        :param index: Refer to
+            :paramref:`~tarantool.Connection.select.params.index`.
+
+        :param iterator: Refer to
+            :paramref:`~tarantool.Connection.select.params.iterator`.
+
+        :param on_push: Refer to
+            :paramref:`~tarantool.Connection.select.params.on_push`.
+
+        :param on_push_ctx: Refer to
+            :paramref:`~tarantool.Connection.select.params.on_push_ctx`.
+
+        :rtype: :class:`~tarantool.response.StreamResponse`
+
+        :raise: :meth:`~tarantool.Connection.select` exceptions
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_select_stream(space_name, key, offset=offset,
+                                              limit=limit, index=index,
+                                              iterator=iterator)
+        return self._send_request(request, on_push, on_push_ctx)
+
+    def _request_select_stream(self, space_name, key=None, **kwargs):
+        """
+        Build a SELECT request with a streaming response. Refer to
+        :meth:`~tarantool.Connection.select_stream`.
+
+        :rtype: :class:`~tarantool.request.RequestSelect`
+
+        :meta private:
+        """
+
+        # The body of a raw response is kept encoded.
+        request = self._request_select(space_name, key, raw=True, **kwargs)
+        request.response_class = StreamResponse
+        return request
+
+    def select_columns(self, space_name, key=None, *, offset=0, limit=0xffffffff, index=0, iterator=None, fields=None, string_dtype=object):
+        """
+        Execute a SELECT request and decode the result into NumPy
+        arrays, one per space field. Field types are taken from
+        the space format:
+
+            +-----------------------+---------------------------------+
+            | Field type            | NumPy dtype                     |
+            +=======================+=================================+
+            | ``unsigned``          | ``uint64``                      |
+            +-----------------------+---------------------------------+
+            | ``integer``           | ``int64``                       |
+            +-----------------------+---------------------------------+
+            | ``double``, ``number``| ``float64``                     |
+            +-----------------------+---------------------------------+
+            | ``boolean``           | ``bool``                        |
+            +-----------------------+---------------------------------+
+            | ``datetime``          | ``datetime64[ns]``, UTC         |
+            +-----------------------+---------------------------------+
+            | ``string``            | :paramref:`string_dtype`        |
+            +-----------------------+---------------------------------+
+            | other                 | ``object``                      |
+            +-----------------------+---------------------------------+
+
+        Rows are decoded directly into column buffers, no list is built
+        per row. Columns with missing values of numeric, boolean or
+        datetime types are returned as :class:`numpy.ma.MaskedArray`.
+        If a value does not fit the column type (e.g. a decimal in
+        a ``number`` field), the column is built of objects.
+
+        .. code-block:: python
+
+            >>> conn.select_columns('demo', fields=['id', 'value'])
+            {'id': array([1, 2], dtype=uint64), 'value': array([0.5, 1.5])}
+
+        :param space_name: Refer to
+            :paramref:`~tarantool.Connection.select.params.space_name`.
+
+        :param key: Refer to
+            :paramref:`~tarantool.Connection.select.params.key`.
+
+        :param offset: Refer to
+            :paramref:`~tarantool.Connection.select.params.offset`.
+
+        :param limit: Refer to
+            :paramref:`~tarantool.Connection.select.params.limit`.
+
+        :param index: Refer to
+            :paramref:`~tarantool.Connection.select.params.index`.
+
+        :param iterator: Refer to
+            :paramref:`~tarantool.Connection.select.params.iterator`.
+
+        :param fields: Names or numbers of fields to decode. Other
+            fields are skipped. All fields are decoded, if not set.
+        :type fields: :obj:`list`, optional
+
+        :param string_dtype: NumPy dtype of ``string`` columns, for
+            example ``'U32'``.
+        :type string_dtype: optional
+
+        :return: Field name to array mapping in the field order.
+        :rtype: :obj:`dict`
+
+        :raise: :exc:`~ValueError`,
+            :meth:`~tarantool.Connection.select` exceptions
+        """
+
+        request = self._request_select_stream(space_name, key, offset=offset,
+                                              limit=limit, index=index,
+                                              iterator=iterator)
+        response = self._send_request(request)
+        return response.to_columns(fields, string_dtype)
 
     def space(self, space_name):
         """
@@ -2053,20 +3225,337 @@ class Connection(ConnectionInterface):
 
         return Space(self, space_name)
 
+    def pipeline(self):
+        """
+        Create a :class:`~tarantool.pipeline.Pipeline` instance to send
+        a batch of requests without waiting for each response.
+
+        .. code-block:: python
+
+            pipe = conn.pipeline()
+            for i in range(1000):
+                pipe.select('demo', i)
+            responses = pipe.flush()
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        return Pipeline(self)
+
+    def prepare_select(self, space_name, index=0, *, offset=0,
+                       limit=0xffffffff, iterator=None):
+        """
+        Create a SELECT request template. Space and index names are
+        resolved and constant request fields are encoded once, each
+        call encodes only the key. The template is rebuilt if
+        the schema changes.
+
+        .. code-block:: python
+
+            >>> get_user = conn.prepare_select('users', 'by_email')
+            >>> get_user('alice@example.com')
+            - [1, 'alice@example.com', 'Alice']
+
+        :param space_name: Refer to
+            :paramref:`~tarantool.Connection.select.params.space_name`.
+
+        :param index: Refer to
+            :paramref:`~tarantool.Connection.select.params.index`.
+
+        :param offset: Refer to
+            :paramref:`~tarantool.Connection.select.params.offset`.
+
+        :param limit: Refer to
+            :paramref:`~tarantool.Connection.select.params.limit`.
+
+        :param iterator: Refer to
+            :paramref:`~tarantool.prepared.PreparedSelect.params.iterator`.
+
+        :rtype: :class:`~tarantool.prepared.PreparedSelect`
+
+        :raise: :exc:`~ValueError`,
+            :exc:`~tarantool.error.NotSupportedError`,
+            :exc:`~tarantool.error.SchemaError`
+        """
+
+        return PreparedSelect(self, space_name, index, offset=offset,
+                              limit=limit, iterator=iterator)
+
+    def prepare_insert(self, space_name):
+        """
+        Create an INSERT request template. Refer to
+        :meth:`~tarantool.Connection.prepare_select`.
+
+        :param space_name: Space name or space id.
+        :type space_name: :obj:`str` or :obj:`int`
+
+        :rtype: :class:`~tarantool.prepared.PreparedInsert`
+
+        :raise: :exc:`~tarantool.error.NotSupportedError`,
+            :exc:`~tarantool.error.SchemaError`
+        """
+
+        return PreparedInsert(self, space_name)
+
+    def prepare_replace(self, space_name):
+        """
+        Create a REPLACE request template. Refer to
+        :meth:`~tarantool.Connection.prepare_select`.
+
+        :param space_name: Space name or space id.
+        :type space_name: :obj:`str` or :obj:`int`
+
+        :rtype: :class:`~tarantool.prepared.PreparedReplace`
+
+        :raise: :exc:`~tarantool.error.NotSupportedError`,
+            :exc:`~tarantool.error.SchemaError`
+        """
+
+        return PreparedReplace(self, space_name)
+
+    def prepare_delete(self, space_name, index=0):
+        """
+        Create a DELETE request template. Refer to
+        :meth:`~tarantool.Connection.prepare_select`.
+
+        :param space_name: Space name or space id.
+        :type space_name: :obj:`str` or :obj:`int`
+
+        :param index: Index name or index id.
+        :type index: :obj:`str` or :obj:`int`, optional
+
+        :rtype: :class:`~tarantool.prepared.PreparedDelete`
+
+        :raise: :exc:`~tarantool.error.NotSupportedError`,
+            :exc:`~tarantool.error.SchemaError`
+        """
+
+        return PreparedDelete(self, space_name, index)
+
+    def scan(self, space_name, key=None, *, index=0, iterator=None, batch_size=1000):
+        """
+        Iterate over tuples of a space with keyset pagination. Tuples
+        are selected in pages of ``batch_size``, each next page starts
+        after the key of the last tuple of the previous one. The next
+        page is requested before the tuples of the current page are
+        returned, so the round trip is hidden behind the processing of
+        the current page.
+
+        .. code-block:: python
+
+            for row in conn.scan('demo', index='name', batch_size=5000):
+                process(row)
+
+        The index must be unique. HASH indexes support only forward
+        scan.
+
+        :param space_name: Space name or space id.
+        :type space_name: :obj:`str` or :obj:`int`
+
+        :param key: Key to start the scan from. If not set, the whole
+            index is scanned.
+        :type key: optional
+
+        :param index: Index name or index id.
+        :type index: :obj:`str` or :obj:`int`, optional
+
+        :param iterator: ``'EQ'``, ``'REQ'``, ``'ALL'``, ``'LT'``,
+            ``'LE'``, ``'GE'`` or ``'GT'``. Defaults to ``'EQ'`` if
+            a key is passed and to ``'ALL'`` otherwise.
+        :type iterator: :obj:`str` or :obj:`int`, optional
+
+        :param batch_size: Number of tuples to select per request.
+        :type batch_size: :obj:`int`, optional
+
+        :rtype: :class:`~tarantool.scan.Scan`
+
+        :raise: :exc:`~ValueError`,
+            :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NotSupportedError`
+        """
+
+        space_no, index_schema = self._scan_index(space_name, index)
+        return Scan(self.select_async, space_no, index_schema, key,
+                    iterator=iterator, batch_size=batch_size)
+
+    def _scan_index(self, space_name, index):
+        """
+        Get the space id and the index schema for a scan.
+
+        :rtype: :obj:`tuple`
+
+        :meta private:
+        """
+
+        self._schemaful_connection_check()
+
+        space = self.schema.get_space(space_name)
+        return space.sid, self.schema.get_index(space.sid, index)
+
+    def call_async(self, func_name, *args, on_push=None, on_push_ctx=None, raw=None):
+        """
+        Send a CALL request without waiting for the response. Refer to
+        :meth:`~tarantool.Connection.call`.
+
+        Responses are read by a background thread, so the connection
+        may be shared by several threads and many requests may be in
+        flight at once. After the first asynchronous request, blocking
+        methods of the connection are served by the same thread.
+        ``on_push`` callback is called from the background thread.
+
+        .. code-block:: python
+
+            >>> futures = [conn.call_async('box.info') for _ in range(10)]
+            >>> responses = [f.result() for f in futures]
+
+        :return: Future which is resolved with
+            a :class:`~tarantool.response.Response` or request error.
+        :rtype: :class:`~concurrent.futures.Future`
+
+        :raise: :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_call(func_name, *args, raw=raw)
+        return self._send_request_async(request, on_push, on_push_ctx)
+
+    def eval_async(self, expr, *args, on_push=None, on_push_ctx=None, raw=None):
+        """
+        Send an EVAL request without waiting for the response. Refer to
+        :meth:`~tarantool.Connection.eval` and
+        :meth:`~tarantool.Connection.call_async`.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_eval(expr, *args, raw=raw)
+        return self._send_request_async(request, on_push, on_push_ctx)
+
+    def replace_async(self, space_name, values, on_push=None, on_push_ctx=None):
+        """
+        Send a REPLACE request without waiting for the response. Refer
+        to :meth:`~tarantool.Connection.replace` and
+        :meth:`~tarantool.Connection.call_async`.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_replace(space_name, values)
+        return self._send_request_async(request, on_push, on_push_ctx)
+
+    def insert_async(self, space_name, values, on_push=None, on_push_ctx=None):
+        """
+        Send an INSERT request without waiting for the response. Refer
+        to :meth:`~tarantool.Connection.insert` and
+        :meth:`~tarantool.Connection.call_async`.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_insert(space_name, values)
+        return self._send_request_async(request, on_push, on_push_ctx)
+
+    def delete_async(self, space_name, key, *, index=0, on_push=None, on_push_ctx=None):
+        """
+        Send a DELETE request without waiting for the response. Refer
+        to :meth:`~tarantool.Connection.delete` and
+        :meth:`~tarantool.Connection.call_async`.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_delete(space_name, key, index=index)
+        return self._send_request_async(request, on_push, on_push_ctx)
+
+    def upsert_async(self, space_name, tuple_value, op_list, *, index=0, on_push=None, on_push_ctx=None):
+        """
+        Send an UPSERT request without waiting for the response. Refer
+        to :meth:`~tarantool.Connection.upsert` and
+        :meth:`~tarantool.Connection.call_async`.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_upsert(space_name, tuple_value, op_list,
+                                       index=index)
+        return self._send_request_async(request, on_push, on_push_ctx)
+
+    def update_async(self, space_name, key, op_list, *, index=0, on_push=None, on_push_ctx=None):
+        """
+        Send an UPDATE request without waiting for the response. Refer
+        to :meth:`~tarantool.Connection.update` and
+        :meth:`~tarantool.Connection.call_async`.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_update(space_name, key, op_list, index=index)
+        return self._send_request_async(request, on_push, on_push_ctx)
+
+    def select_async(self, space_name, key=None, *, offset=0, limit=0xffffffff, index=0, iterator=None, on_push=None, on_push_ctx=None, raw=None):
+        """
+        Send a SELECT request without waiting for the response. Refer
+        to :meth:`~tarantool.Connection.select` and
+        :meth:`~tarantool.Connection.call_async`.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request_select(space_name, key, offset=offset,
+                                       limit=limit, index=index,
+                                       iterator=iterator, raw=raw)
+        return self._send_request_async(request, on_push, on_push_ctx)
+
+    def execute_async(self, query, params=None, *, raw=None):
+        """
+        Send an SQL EXECUTE request without waiting for the response.
+        Refer to :meth:`~tarantool.Connection.execute` and
+        :meth:`~tarantool.Connection.call_async`.
+
+        :rtype: :class:`~concurrent.futures.Future`
+        """
+
+        request = self._request_execute(query, params, raw=raw)
+        return self._send_request_async(request)
+
     def generate_sync(self):
         """
-        Generate IPROTO_SYNC code for a request. Since the connector is
-        synchronous, any constant value would be sufficient.
+        Generate IPROTO_SYNC code for a request. Each request sent
+        through the connection gets a unique value, so responses could
+        be matched to requests even if several requests are in flight.
 
-        :return: ``0``
         :rtype: :obj:`int`
 
         :meta private:
         """
 
-        return 0
+        return next(self._sync_counter)
 
-    def execute(self, query, params=None):
+    def execute(self, query, params=None, *, raw=None):
         """
         Execute an SQL request: see `documentation`_ for syntax
         reference.
@@ -2097,6 +3586,15 @@ class Connection(ConnectionInterface):
         :type params: :obj:`dict` or :obj:`list` or :obj:`None`,
             optional
 
+        :param raw: If ``True``, response data is not decoded:
+            :attr:`~tarantool.response.Response.data` is a list of
+            MsgPack encoded rows and
+            :attr:`~tarantool.response.Response.raw_data` is
+            the encoded data array. If ``None``,
+            :paramref:`~tarantool.Connection.params.raw_responses` is
+            used.
+        :type raw: :obj:`bool` or :obj:`None`, optional
+
         :rtype: :class:`~tarantool.response.Response`
 
         :raise: :exc:`~AssertionError`,
@@ -2108,11 +3606,71 @@ class Connection(ConnectionInterface):
         .. _documentation: https://www.tarantool.io/en/doc/latest/how-to/sql/
         """
 
+        request = self._request_execute(query, params, raw=raw)
+        response = self._send_request(request)
+        return response
+
+    def execute_columns(self, query, params=None, *, fields=None, string_dtype=object):
+        """
+        Execute an SQL request and decode the result into NumPy arrays,
+        one per result column. Column types are taken from the response
+        metadata, refer to :meth:`~tarantool.Connection.select_columns`
+        for the type mapping.
+
+        :param query: Refer to
+            :paramref:`~tarantool.Connection.execute.params.query`.
+
+        :param params: Refer to
+            :paramref:`~tarantool.Connection.execute.params.params`.
+
+        :param fields: Names or numbers of columns to decode. All columns
+            are decoded, if not set.
+        :type fields: :obj:`list`, optional
+
+        :param string_dtype: NumPy dtype of ``string`` columns.
+        :type string_dtype: optional
+
+        :return: Column name to array mapping in the column order.
+        :rtype: :obj:`dict`
+
+        :raise: :exc:`~ValueError`,
+            :meth:`~tarantool.Connection.execute` exceptions
+        """
+
+        request = self._request_execute_columns(query, params)
+        response = self._send_request(request)
+        return response.to_columns(fields, string_dtype)
+
+    def _request_execute_columns(self, query, params=None):
+        """
+        Build an SQL EXECUTE request which keeps the response body
+        encoded. Refer to :meth:`~tarantool.Connection.execute_columns`.
+
+        :rtype: :class:`~tarantool.request.RequestExecute`
+
+        :meta private:
+        """
+
+        # The body of a raw response is kept encoded.
+        request = self._request_execute(query, params, raw=True)
+        request.response_class = StreamResponseExecute
+        return request
+
+    def _request_execute(self, query, params=None, *, raw=None):
+        """
+        Build an EXECUTE request. Refer to
+        :meth:`~tarantool.Connection.execute`.
+
+        :rtype: :class:`~tarantool.request.RequestExecute`
+
+        :meta private:
+        """
+
         if not params:
             params = []
         request = RequestExecute(self, query, params)
-        response = self._send_request(request)
-        return response
+        request.raw = self.raw_responses if raw is None else raw
+        return request
 
     def _check_features(self):
         """
@@ -2139,12 +3697,14 @@ class Connection(ConnectionInterface):
             server_protocol_version = response.protocol_version
             server_features = response.features
             server_auth_type = response.auth_type
+            server_schema_version = response.schema_version
         except DatabaseError as exc:
             ER_UNKNOWN_REQUEST_TYPE = 48
             if exc.code == ER_UNKNOWN_REQUEST_TYPE:
                 server_protocol_version = None
                 server_features = []
                 server_auth_type = None
+                server_schema_version = None
             else:
                 raise exc
 
@@ -2158,6 +3718,7 @@ class Connection(ConnectionInterface):
             self._features[val] = True
 
         self._server_auth_type = server_auth_type
+        self._server_schema_version = server_schema_version
 
     def _packer_factory(self):
         return self._packer_factory_impl(self)
@@ -2165,6 +3726,41 @@ class Connection(ConnectionInterface):
     def _unpacker_factory(self):
         return self._unpacker_factory_impl(self)
 
+    def _request_packer(self):
+        """
+        Get the connection request packer. It is built once per thread
+        (packers are not thread-safe) and rebuilt only if the connection
+        encoding changes.
+
+        :rtype: :class:`msgpack.Packer`
+
+        :meta private:
+        """
+
+        cache = self._packers
+        packer = getattr(cache, 'packer', None)
+        if packer is None or cache.encoding != self.encoding:
+            packer = self._packer_factory()
+            cache.packer = packer
+            cache.encoding = self.encoding
+        return packer
+
+    def _response_unpacker(self):
+        """
+        Get the connection response unpacker. It is built once and
+        rebuilt only if the connection decoding options change.
+
+        :rtype: :class:`msgpack.Unpacker`
+
+        :meta private:
+        """
+
+        options = (self.encoding, self.use_list)
+        if self._unpacker is None or self._unpacker_options != options:
+            self._unpacker = self._unpacker_factory()
+            self._unpacker_options = options
+        return self._unpacker
+
     def crud_insert(self, space_name: str, values: Union[tuple, list], opts: dict={}) -> CrudResult:
         """
         Inserts row through the 
@@ -3,8 +3,12 @@ This module provides API for interaction with Tarantool servers cluster.
 """
 
 import abc
+import concurrent.futures
 import itertools
+import math
 import queue
+import random
+import socket
 import threading
 import time
 import typing
@@ -27,10 +31,13 @@ from tarantool.error import (
     PoolTolopogyWarning,
     ConfigurationError,
     NetworkError,
+    SslError,
     warn
 )
 from tarantool.utils import ENCODING_DEFAULT
 from tarantool.mesh_connection import prepare_address
+from tarantool.scan import Scan
+from tarantool.schema_cache import SchemaRegistry
 
 
 class Mode(Enum):
@@ -104,7 +111,7 @@ def QueueFactory():
     Build a queue-based channel.
     """
 
-    return queue.Queue(maxsize=1)
+    return queue.Queue()
 
 
 @dataclass
@@ -123,26 +130,40 @@ class PoolUnit():
 
     conn: Connection
     """
+    First connection to process requests for the server. The server
+    state is refreshed with it too, refer to
+    :meth:`~tarantool.ConnectionPool._refresh_loop`.
+
     :type: :class:`~tarantool.Connection`
     """
 
+    conns: list = field(default_factory=list)
+    """
+    Connections to process requests for the server, the first one is
+    :attr:`~tarantool.connection_pool.PoolUnit.conn`. Refer to
+    :paramref:`~tarantool.ConnectionPool.params.connections_per_instance`.
+
+    :type: :obj:`list`
+    """
+
     input_queue: queue.Queue = field(default_factory=QueueFactory)
     """
-    Channel to pass requests for the server thread.
+    Channel to pass requests for the server threads.
 
     :type: :obj:`queue.Queue`
     """
 
-    output_queue: queue.Queue = field(default_factory=QueueFactory)
+    threads: list = field(default_factory=list)
     """
-    Channel to receive responses from the server thread.
+    Background threads to process requests for the server, one per
+    connection.
 
-    :type: :obj:`queue.Queue`
+    :type: :obj:`list`
     """
 
-    thread: typing.Optional[threading.Thread] = None
+    refresher: typing.Optional[threading.Thread] = None
     """
-    Background thread to process requests for the server.
+    Background thread to refresh the server state.
 
     :type: :obj:`threading.Thread`
     """
@@ -162,6 +183,22 @@ class PoolUnit():
     :type: :obj:`bool`
     """
 
+    refreshed: bool = False
+    """
+    ``True``, if the server state has been refreshed since
+    :meth:`~tarantool.ConnectionPool.connect`.
+
+    :type: :obj:`bool`
+    """
+
+    error: typing.Optional[Exception] = None
+    """
+    Configuration or SSL error of the last state refresh. It is raised
+    by :meth:`~tarantool.ConnectionPool.connect`.
+
+    :type: :exc:`~Exception`, optional
+    """
+
 # Based on https://realpython.com/python-interface/
 class StrategyInterface(metaclass=abc.ABCMeta):
     """
@@ -205,6 +242,128 @@ class StrategyInterface(metaclass=abc.ABCMeta):
 
         raise NotImplementedError
 
+    def request_started(self, key):
+        """
+        Called before a request is passed to a pool server chosen by
+        :meth:`~tarantool.connection_pool.StrategyInterface.getnext`.
+        Does nothing by default.
+
+        :param key: Pool server key.
+        :type key: :obj:`str`
+
+        :return: Request token, passed to
+            :meth:`~tarantool.connection_pool.StrategyInterface.request_finished`
+            of the same request.
+        """
+
+    def request_finished(self, key, latency, error, token=None):
+        """
+        Called when a request to a pool server is finished. Does
+        nothing by default.
+
+        :param key: Pool server key.
+        :type key: :obj:`str`
+
+        :param latency: Request time including the time it has waited
+            in the pool server queue, in seconds.
+        :type latency: :obj:`float`
+
+        :param error: Request exception or ``None``, if it has
+            succeeded.
+        :type error: :exc:`~Exception` or :obj:`None`
+
+        :param token: Result of
+            :meth:`~tarantool.connection_pool.StrategyInterface.request_started`
+            for the request.
+        """
+
+
+def split_by_mode(pool):
+    """
+    Split healthy pool servers by their `box.info.ro`_ state.
+
+    :param pool: Pool servers.
+    :type pool: :obj:`dict` of
+        :class:`~tarantool.connection_pool.PoolUnit` objects
+
+    :return: ``ANY``, ``RW`` and ``RO`` lists of server keys.
+    :rtype: :obj:`tuple`
+
+    :meta private:
+    """
+
+    ANY_pool = []
+    RW_pool = []
+    RO_pool = []
+
+    for key in pool:
+        state = pool[key].state
+
+        if state.status == Status.UNHEALTHY:
+            continue
+
+        ANY_pool.append(key)
+
+        if state.ro == False:
+            RW_pool.append(key)
+        else:
+            RO_pool.append(key)
+
+    return ANY_pool, RW_pool, RO_pool
+
+
+def choose_by_mode(mode, ANY_pool, RW_pool, RO_pool, choose):
+    """
+    Choose a pool server based on the request mode.
+
+    :param mode: Request mode
+    :type mode: :class:`~tarantool.Mode`
+
+    :param ANY_pool: Servers of any role, nothing if empty.
+    :param RW_pool: Read-write servers, nothing if empty.
+    :param RO_pool: Read-only servers, nothing if empty.
+
+    :param choose: Function to choose a server from a non-empty pool.
+    :type choose: :obj:`function`
+
+    :rtype: :obj:`str`
+
+    :raise: :exc:`~tarantool.error.PoolTolopogyError`
+
+    :meta private:
+    """
+
+    if mode == Mode.ANY:
+        if ANY_pool:
+            return choose(ANY_pool)
+        else:
+            raise PoolTolopogyError("Can't find healthy instance in pool")
+    elif mode == Mode.RW:
+        if RW_pool:
+            return choose(RW_pool)
+        else:
+            raise PoolTolopogyError("Can't find healthy rw instance in pool")
+    elif mode == Mode.RO:
+        if RO_pool:
+            return choose(RO_pool)
+        else:
+            raise PoolTolopogyError("Can't find healthy ro instance in pool")
+    elif mode == Mode.PREFER_RO:
+        if RO_pool:
+            return choose(RO_pool)
+        elif RW_pool:
+            return choose(RW_pool)
+        else:
+            raise PoolTolopogyError("Can't find healthy instance in pool")
+    elif mode == Mode.PREFER_RW:
+        if RW_pool:
+            return choose(RW_pool)
+        elif RO_pool:
+            return choose(RO_pool)
+        else:
+            raise PoolTolopogyError("Can't find healthy instance in pool")
+
+
 class RoundRobinStrategy(StrategyInterface):
     """
     Simple round-robin pool servers rotation.
@@ -228,22 +387,7 @@ class RoundRobinStrategy(StrategyInterface):
         based on `box.info.ro`_ state.
         """
 
-        ANY_pool = []
-        RW_pool = []
-        RO_pool = []
-
-        for key in self.pool:
-            state = self.pool[key].state
-
-            if state.status == Status.UNHEALTHY:
-                continue
-
-            ANY_pool.append(key)
-
-            if state.ro == False:
-                RW_pool.append(key)
-            else:
-                RO_pool.append(key)
+        ANY_pool, RW_pool, RO_pool = split_by_mode(self.pool)
 
         if len(ANY_pool) > 0:
             self.ANY_iter = itertools.cycle(ANY_pool)
@@ -286,35 +430,223 @@ class RoundRobinStrategy(StrategyInterface):
         if self.rebuild_needed:
             self.build()
 
-        if mode == Mode.ANY:
-            if self.ANY_iter is not None:
-                return next(self.ANY_iter)
-            else:
-                raise PoolTolopogyError("Can't find healthy instance in pool")
-        elif mode == Mode.RW:
-            if self.RW_iter is not None:
-                return next(self.RW_iter)
-            else:
-                raise PoolTolopogyError("Can't find healthy rw instance in pool")
-        elif mode == Mode.RO:
-            if self.RO_iter is not None:
-                return next(self.RO_iter)
-            else:
-                raise PoolTolopogyError("Can't find healthy ro instance in pool")
-        elif mode == Mode.PREFER_RO:
-            if self.RO_iter is not None:
-                return next(self.RO_iter)
-            elif self.RW_iter is not None:
-                return next(self.RW_iter)
-            else:
-                raise PoolTolopogyError("Can't find healthy instance in pool")
-        elif mode == Mode.PREFER_RW:
-            if self.RW_iter is not None:
-                return next(self.RW_iter)
-            elif self.RO_iter is not None:
-                return next(self.RO_iter)
+        return choose_by_mode(mode, self.ANY_iter, self.RW_iter, self.RO_iter,
+                              next)
+
+
+@dataclass
+class InstanceLatency():
+    """
+    Pool server latency statistics of
+    :class:`~tarantool.connection_pool.LatencyAwareStrategy`.
+    """
+
+    cost: float = 0.0
+    """
+    Peak-sensitive exponentially weighted moving average of the
+    request latency, in seconds.
+
+    :type: :obj:`float`
+    """
+
+    stamp: float = 0.0
+    """
+    Time of the last :attr:`cost` update, :func:`time.monotonic`
+    based.
+
+    :type: :obj:`float`
+    """
+
+    started: dict = field(default_factory=dict)
+    """
+    Start times of the requests passed to the server and not finished
+    yet, :func:`time.monotonic` based, by request token in the start
+    order.
+
+    :type: :obj:`dict`
+    """
+
+    @property
+    def in_flight(self):
+        """
+        Number of requests passed to the server and not finished yet.
+
+        :type: :obj:`int`
+        """
+
+        return len(self.started)
+
+
+class LatencyAwareStrategy(StrategyInterface):
+    """
+    Pool servers choice based on their latency. The strategy tracks the
+    moving average of request latency and the number of requests in
+    flight for each server and picks the less loaded of two random
+    servers matching the request mode ("power of two choices"). The
+    load of a server is its average latency multiplied by the number
+    of its requests in flight plus one.
+
+    The average follows a latency rise at once and decays over
+    :attr:`decay_time` otherwise, so a degraded server (GC pause, heavy
+    snapshot) stops getting traffic after the first slow response.
+    The average of a server without new responses decays to zero with
+    time as well, so a recovered server gets requests again. The
+    oldest request in flight counts as if it has finished at the moment
+    of the choice, so a stalled server, which finishes no requests,
+    gets more expensive with time rather than cheaper. Network errors
+    count as :attr:`error_latency` long requests.
+
+    .. code-block:: python
+
+        >>> pool = tarantool.ConnectionPool(
+        ...     addrs,
+        ...     strategy_class=tarantool.connection_pool.LatencyAwareStrategy)
+    """
+
+    decay_time = 1.0
+    """
+    Time for the latency average to decay by ``e`` times, in seconds.
+
+    :type: :obj:`float`
+    """
+
+    error_latency = 1.0
+    """
+    Latency of a request failed with
+    :exc:`~tarantool.error.NetworkError`, in seconds.
+
+    :type: :obj:`float`
+    """
+
+    def __init__(self, pool):
+        """
+        :type: :obj:`list` of
+            :class:`~tarantool.connection_pool.PoolUnit` objects
+        """
+
+        self.ANY_pool = []
+        self.RW_pool = []
+        self.RO_pool = []
+        self.pool = pool
+        self.stats = {}
+        self.tokens = itertools.count()
+        self.lock = threading.Lock()
+        self.rebuild_needed = True
+
+    def build(self):
+        """
+        Initialize (or re-initialize) internal pools of servers based
+        on `box.info.ro`_ state.
+        """
+
+        self.ANY_pool, self.RW_pool, self.RO_pool = split_by_mode(self.pool)
+        self.rebuild_needed = False
+
+    def update(self):
+        """
+        Set flag to re-initialize internal pools on next
+        :meth:`~tarantool.connection_pool.LatencyAwareStrategy.getnext`
+        call.
+        """
+
+        self.rebuild_needed = True
+
+    def _load(self, key, now):
+        """
+        Get the current load of a server.
+
+        :meta private:
+        """
+
+        stats = self.stats.get(key)
+        if stats is None:
+            return 0.0
+        cost = stats.cost * math.exp((stats.stamp - now) / self.decay_time)
+        if stats.started:
+            cost = max(cost, now - next(iter(stats.started.values())))
+        return cost * (stats.in_flight + 1)
+
+    def _choose(self, keys):
+        """
+        Choose the less loaded of two random servers.
+
+        :meta private:
+        """
+
+        if len(keys) == 1:
+            return keys[0]
+        first, second = random.sample(keys, 2)
+        now = time.monotonic()
+        with self.lock:
+            if self._load(second, now) < self._load(first, now):
+                return second
+        return first
+
+    def getnext(self, mode):
+        """
+        Get server based on the request mode.
+
+        :param mode: Request mode
+        :type mode: :class:`~tarantool.Mode`
+
+        :rtype: :class:`~tarantool.connection_pool.PoolUnit`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+        """
+
+        if self.rebuild_needed:
+            self.build()
+
+        return choose_by_mode(mode, self.ANY_pool, self.RW_pool, self.RO_pool,
+                              self._choose)
+
+    def request_started(self, key):
+        """
+        Count a request in flight.
+
+        :param key: Pool server key.
+        :type key: :obj:`str`
+        """
+
+        now = time.monotonic()
+        with self.lock:
+            stats = self.stats.setdefault(key, InstanceLatency())
+            token = next(self.tokens)
+            stats.started[token] = now
+        return token
+
+    def request_finished(self, key, latency, error, token=None):
+        """
+        Update the server latency average.
+
+        :param key: Pool server key.
+        :type key: :obj:`str`
+
+        :param latency: Request time, in seconds.
+        :type latency: :obj:`float`
+
+        :param error: Request exception or ``None``.
+        :type error: :exc:`~Exception` or :obj:`None`
+
+        :param token: Result of
+            :meth:`~tarantool.connection_pool.LatencyAwareStrategy.request_started`
+            for the request.
+        :type token: :obj:`int`
+        """
+
+        now = time.monotonic()
+        with self.lock:
+            stats = self.stats.setdefault(key, InstanceLatency())
+            stats.started.pop(token, None)
+
+            if isinstance(error, NetworkError):
+                latency = max(latency, self.error_latency)
+            if latency > stats.cost:
+                stats.cost = latency
             else:
-                raise PoolTolopogyError("Can't find healthy instance in pool")
+                weight = math.exp((stats.stamp - now) / self.decay_time)
+                stats.cost = stats.cost * weight + latency * (1 - weight)
+            stats.stamp = now
 
 
 @dataclass
@@ -344,6 +676,14 @@ class PoolTask():
     :type: :obj:`dict`
     """
 
+    future: concurrent.futures.Future = field(
+        default_factory=concurrent.futures.Future)
+    """
+    Future to set the method result or exception to.
+
+    :type: :class:`~concurrent.futures.Future`
+    """
+
 
 class ConnectionPool(ConnectionInterface):
     """
@@ -379,7 +719,14 @@ class ConnectionPool(ConnectionInterface):
                  connection_timeout=CONNECTION_TIMEOUT,
                  strategy_class=RoundRobinStrategy,
                  refresh_delay=POOL_REFRESH_DELAY,
-                 fetch_schema=True):
+                 fetch_schema=True,
+                 lazy_responses=False,
+                 raw_responses=False,
+                 named_rows=False,
+                 schema_cache_dir=None,
+                 schema_registry=None,
+                 connections_per_instance=1,
+                 connect_quorum=None):
         """
         :param addrs: List of dictionaries describing server addresses:
 
@@ -456,6 +803,41 @@ class ConnectionPool(ConnectionInterface):
         :param fetch_schema: Refer to
             :paramref:`~tarantool.Connection.params.fetch_schema`.
 
+        :param lazy_responses: Refer to
+            :paramref:`~tarantool.Connection.params.lazy_responses`.
+
+        :param raw_responses: Refer to
+            :paramref:`~tarantool.Connection.params.raw_responses`.
+
+        :param named_rows: Refer to
+            :paramref:`~tarantool.Connection.params.named_rows`.
+
+        :param schema_cache_dir: Refer to
+            :paramref:`~tarantool.Connection.params.schema_cache_dir`.
+
+        :param schema_registry: Refer to
+            :paramref:`~tarantool.Connection.params.schema_registry`.
+            If not set, the pool creates a registry, so the pool
+            connections to instances of a replicaset share a single
+            schema.
+
+        :param connections_per_instance: Number of connections to each
+            pool server. Requests to a server are processed by
+            a thread per connection, so up to this number of requests
+            from different threads are sent to a server at once.
+            Connections other than the first one are established on
+            first use.
+        :type connections_per_instance: :obj:`int`, optional
+
+        :param connect_quorum: Number of healthy servers per mode to
+            wait for in
+            :meth:`~tarantool.connection_pool.ConnectionPool.connect`,
+            for example ``{tarantool.Mode.RW: 1, tarantool.Mode.RO: 1}``.
+            Supported modes are :attr:`~tarantool.Mode.ANY`,
+            :attr:`~tarantool.Mode.RW` and :attr:`~tarantool.Mode.RO`.
+            If not set, wait until each server has been probed.
+        :type connect_quorum: :obj:`dict`, optional
+
         :raise: :exc:`~tarantool.error.ConfigurationError`,
             :class:`~tarantool.Connection` exceptions
 
@@ -467,6 +849,17 @@ class ConnectionPool(ConnectionInterface):
         if not isinstance(addrs, list) or len(addrs) == 0:
             raise ConfigurationError("addrs must be non-empty list")
 
+        if not isinstance(connections_per_instance, int) or \
+                connections_per_instance < 1:
+            raise ConfigurationError(
+                "connections_per_instance must be a positive integer")
+
+        if connect_quorum is not None:
+            for mode in connect_quorum:
+                if mode not in (Mode.ANY, Mode.RW, Mode.RO):
+                    raise ConfigurationError(
+                        "connect_quorum supports only ANY, RW and RO modes")
+
         # Prepare addresses for usage.
         new_addrs = []
         for addr in addrs:
@@ -479,13 +872,25 @@ class ConnectionPool(ConnectionInterface):
         # Create connections
         self.pool = {}
         self.refresh_delay = refresh_delay
+        self.connect_quorum = connect_quorum
+        # connect() waits for the first refresh of each server: a
+        # connection and requests.
+        if connection_timeout is None:
+            self._connect_wait = None
+        elif socket_timeout is None:
+            self._connect_wait = 2 * connection_timeout
+        else:
+            self._connect_wait = connection_timeout + socket_timeout
+        self._refresh_condition = threading.Condition()
         self.strategy = strategy_class(self.pool)
+        if schema_registry is None:
+            schema_registry = SchemaRegistry()
+        self.schema_registry = schema_registry
 
         for addr in self.addrs:
             key = self._make_key(addr)
-            self.pool[key] = PoolUnit(
-                addr=addr,
-                conn=Connection(
+            conns = [
+                Connection(
                     host=addr['host'],
                     port=addr['port'],
                     user=user,
@@ -505,8 +910,15 @@ class ConnectionPool(ConnectionInterface):
                     ssl_password=addr['ssl_password'],
                     ssl_password_file=addr['ssl_password_file'],
                     auth_type=addr['auth_type'],
-                    fetch_schema=fetch_schema)
-            )
+                    fetch_schema=fetch_schema,
+                    lazy_responses=lazy_responses,
+                    raw_responses=raw_responses,
+                    named_rows=named_rows,
+                    schema_cache_dir=schema_cache_dir,
+                    schema_registry=schema_registry)
+                for _ in range(connections_per_instance)
+            ]
+            self.pool[key] = PoolUnit(addr=addr, conn=conns[0], conns=conns)
 
         if connect_now:
             self.connect()
@@ -530,7 +942,9 @@ class ConnectionPool(ConnectionInterface):
 
     def _get_new_state(self, unit):
         """
-        Get new pool server state.
+        Get new pool server state. `box.info`_ is requested through
+        the reader thread of the first server connection, so the
+        request neither waits for requests in flight nor delays them.
 
         :param unit: Server metainfo.
         :type unit: :class:`~tarantool.connection_pool.PoolUnit`
@@ -541,18 +955,18 @@ class ConnectionPool(ConnectionInterface):
         """
 
         conn = unit.conn
-
-        if conn.is_closed():
-            try:
-                conn.connect()
-            except NetworkError as e:
-                msg = "Failed to connect to {0}:{1}".format(
-                    unit.addr['host'], unit.addr['port'])
-                warn(msg, ClusterConnectWarning)
-                return InstanceState(Status.UNHEALTHY)
+        with conn._io_lock:
+            if conn.is_closed():
+                try:
+                    conn.connect()
+                except NetworkError as e:
+                    msg = "Failed to connect to {0}:{1}".format(
+                        unit.addr['host'], unit.addr['port'])
+                    warn(msg, ClusterConnectWarning)
+                    return InstanceState(Status.UNHEALTHY)
 
         try:
-            resp = conn.call('box.info')
+            resp = conn._wait_response(conn.call_async('box.info', raw=False))
         except NetworkError as e:
             msg = "Failed to get box.info for {0}:{1}, reason: {2}".format(
                 unit.addr['host'], unit.addr['port'], repr(e))
@@ -596,21 +1010,64 @@ class ConnectionPool(ConnectionInterface):
 
         unit = self.pool[key]
 
-        state = self._get_new_state(unit)
-        if state != unit.state:
-            unit.state = state
-            self.strategy.update()
+        state = InstanceState(Status.UNHEALTHY)
+        error = None
+        try:
+            state = self._get_new_state(unit)
+        except (SslError, ConfigurationError) as e:
+            # Refreshes fail the same way until the pool is recreated.
+            error = e
+        except Exception as e:
+            msg = "Failed to refresh {0}:{1} state, reason: {2}".format(
+                unit.addr['host'], unit.addr['port'], repr(e))
+            warn(msg, PoolTolopogyWarning)
+        finally:
+            with self._refresh_condition:
+                if state != unit.state:
+                    unit.state = state
+                    self.strategy.update()
+                unit.error = error
+                unit.refreshed = True
+                self._refresh_condition.notify_all()
 
     def close(self):
         """
         Stop request processing, close each connection in the pool.
         """
         for unit in self.pool.values():
-            unit.request_processing_enabled = False
-            unit.thread.join()
+            with self._refresh_condition:
+                unit.request_processing_enabled = False
+                # Wake up the refresher waiting for the next refresh.
+                self._refresh_condition.notify_all()
+            # Wake up the threads blocked on the empty queue.
+            for _ in unit.threads:
+                unit.input_queue.put(None)
+            for thread in unit.threads:
+                thread.join()
+            if unit.refresher is not None:
+                # Wake up the refresher blocked on the socket of
+                # a server which does not respond.
+                sock = unit.conn._socket
+                if sock is not None:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+                unit.refresher.join()
+
+            # Fail requests which have not been taken by the threads.
+            while True:
+                try:
+                    task = unit.input_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if task is not None and task.future.set_running_or_notify_cancel():
+                    task.future.set_exception(
+                        NetworkError("Connection pool is closed"))
 
-            if not unit.conn.is_closed():
-                unit.conn.close()
+            for conn in unit.conns:
+                if not conn.is_closed():
+                    conn.close()
 
     def is_closed(self):
         """
@@ -622,10 +1079,14 @@ class ConnectionPool(ConnectionInterface):
 
         return all(unit.request_processing_enabled == False for unit in self.pool.values())
 
-    def _request_process_loop(self, key, unit, last_refresh):
+    def _request_process_loop(self, key, unit, conn):
         """
         Request process background loop for a pool server. Started in
-        a separate thread, one thread per server.
+        a separate thread, one thread per server connection. Threads
+        take requests from the server queue, so requests of different
+        application threads are processed in parallel. A thread blocks
+        on the queue until a request comes, so an idle pool does not
+        use the CPU.
 
         :param key: Result of
             :meth:`~tarantool.connection_pool._make_key`.
@@ -634,26 +1095,53 @@ class ConnectionPool(ConnectionInterface):
         :param unit: Server metainfo.
         :type unit: :class:`~tarantool.connection_pool.PoolUnit`
 
-        :param last_refresh: Time of last metainfo refresh.
-        :type last_refresh: :obj:`float`
+        :param conn: Connection to process requests with.
+        :type conn: :class:`~tarantool.Connection`
         """
 
         while unit.request_processing_enabled:
-            if not unit.input_queue.empty():
-                task = unit.input_queue.get()
+            task = unit.input_queue.get()
+
+            # None is put on close.
+            if task is not None and task.future.set_running_or_notify_cancel():
                 method = getattr(Connection, task.method_name)
                 try:
-                    resp = method(unit.conn, *task.args, **task.kwargs)
+                    resp = method(conn, *task.args, **task.kwargs)
                 except Exception as e:
-                    unit.output_queue.put(e)
+                    task.future.set_exception(e)
                 else:
-                    unit.output_queue.put(resp)
+                    task.future.set_result(resp)
+
+    def _refresh_loop(self, key, unit):
+        """
+        Server state refresh background loop. Started in a separate
+        thread, one thread per server. The state is refreshed each
+        :paramref:`~tarantool.ConnectionPool.params.refresh_delay`
+        seconds, independently of requests, refer to
+        :meth:`~tarantool.ConnectionPool._get_new_state`.
+
+        :param key: Result of
+            :meth:`~tarantool.connection_pool._make_key`.
+        :type key: :obj:`str`
 
-            now = time.time()
+        :param unit: Server metainfo.
+        :type unit: :class:`~tarantool.connection_pool.PoolUnit`
+        """
 
-            if now - last_refresh > self.refresh_delay:
+        while True:
+            try:
                 self._refresh_state(key)
-                last_refresh = time.time()
+            except Exception:
+                # A warning turned into an error: the state is set
+                # anyway, keep refreshing.
+                pass
+
+            with self._refresh_condition:
+                self._refresh_condition.wait_for(
+                    lambda: not unit.request_processing_enabled,
+                    timeout=self.refresh_delay)
+            if not unit.request_processing_enabled:
+                break
 
     def connect(self):
         """
@@ -662,25 +1150,86 @@ class ConnectionPool(ConnectionInterface):
         There is no need to call this method explicitly until you have
         set ``connect_now=False`` on initialization.
 
+        Servers are connected and probed in parallel by their
+        background refresh threads. The method returns when each server has
+        been probed or, with
+        :paramref:`~tarantool.ConnectionPool.params.connect_quorum`,
+        as soon as the quorum is healthy.
+
         If some connections have failed to connect successfully or
         provide `box.info`_ status (including the case when all of them
         have failed), no exceptions are raised. Attempts to reconnect
         and refresh the info would be processed in the background.
+        With :paramref:`~tarantool.ConnectionPool.params.connection_timeout`
+        set, the method waits no longer than it for the connection plus
+        :paramref:`~tarantool.ConnectionPool.params.socket_timeout` (or
+        ``connection_timeout`` again, if it is not set) for the
+        requests. Configuration and SSL errors are raised, the pool is
+        closed then.
+
+        :raise: :exc:`~tarantool.error.ConfigurationError`,
+            :exc:`~tarantool.error.SslError`
         """
 
         for key in self.pool:
             unit = self.pool[key]
-
-            self._refresh_state(key)
-            last_refresh = time.time()
-
-            unit.thread = threading.Thread(
-                target=self._request_process_loop,
-                args=(key, unit, last_refresh),
+            unit.refreshed = False
+            unit.error = None
+
+            unit.threads = [
+                threading.Thread(
+                    target=self._request_process_loop,
+                    args=(key, unit, conn),
+                    daemon=True,
+                )
+                for conn in unit.conns
+            ]
+            unit.refresher = threading.Thread(
+                target=self._refresh_loop,
+                args=(key, unit),
                 daemon=True,
             )
             unit.request_processing_enabled = True
-            unit.thread.start()
+            for thread in unit.threads:
+                thread.start()
+            unit.refresher.start()
+
+        with self._refresh_condition:
+            self._refresh_condition.wait_for(self._is_connected,
+                                             timeout=self._connect_wait)
+            errors = [unit.error for unit in self.pool.values()
+                      if unit.error is not None]
+        if errors:
+            self.close()
+            raise errors[0]
+
+    def _is_connected(self):
+        """
+        Check whether :meth:`~tarantool.ConnectionPool.connect` may
+        return: each server has been probed or
+        :paramref:`~tarantool.ConnectionPool.params.connect_quorum` is
+        healthy.
+
+        :rtype: :obj:`bool`
+
+        :meta private:
+        """
+
+        units = self.pool.values()
+        if all(unit.refreshed for unit in units):
+            return True
+        if self.connect_quorum is None:
+            return False
+
+        healthy = [unit.state for unit in units
+                   if unit.state.status == Status.HEALTHY]
+        counts = {
+            Mode.ANY: len(healthy),
+            Mode.RW: sum(1 for state in healthy if state.ro == False),
+            Mode.RO: sum(1 for state in healthy if state.ro != False),
+        }
+        return all(counts[mode] >= count
+                   for mode, count in self.connect_quorum.items())
 
     def _send(self, mode, method_name, *args, **kwargs):
         """
@@ -712,19 +1261,103 @@ class ConnectionPool(ConnectionInterface):
         """
 
         key = self.strategy.getnext(mode)
-        unit = self.pool[key]
 
-        task = PoolTask(method_name=method_name, args=args, kwargs=kwargs)
+        token = self.strategy.request_started(key)
+        start = time.monotonic()
+        try:
+            resp = self._submit(key, method_name, *args, **kwargs).result()
+        except Exception as e:
+            self.strategy.request_finished(key, time.monotonic() - start, e,
+                                           token)
+            raise
+        self.strategy.request_finished(key, time.monotonic() - start, None,
+                                       token)
+        return resp
 
-        unit.input_queue.put(task)
-        resp = unit.output_queue.get()
+    def _send_async(self, mode, method_name, *args, **kwargs):
+        """
+        Request wrapper for :class:`~tarantool.Connection` methods
+        which return a future. Choose a pool server based on mode and
+        send a request with arguments. The request is reported to the
+        strategy as finished when its future is done, not when it is
+        sent.
 
-        if isinstance(resp, Exception):
-            raise resp
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`
 
-        return resp
+        :param method_name: :class:`~tarantool.Connection`
+            method name.
+        :type method_name: :obj:`str`
+
+        :param args: Method args.
+        :type args: :obj:`tuple`
 
-    def call(self, func_name, *args, mode=None, on_push=None, on_push_ctx=None):
+        :param kwargs: Method kwargs.
+        :type kwargs: :obj:`dict`
+
+        :rtype: :class:`~concurrent.futures.Future`
+
+        :raise: :meth:`~tarantool.ConnectionPool._send` exceptions
+
+        :meta private:
+        """
+
+        key = self.strategy.getnext(mode)
+
+        token = self.strategy.request_started(key)
+        start = time.monotonic()
+        try:
+            future = self._submit(key, method_name, *args, **kwargs).result()
+        except Exception as e:
+            self.strategy.request_finished(key, time.monotonic() - start, e,
+                                           token)
+            raise
+
+        def finished(future):
+            error = None if future.cancelled() else future.exception()
+            self.strategy.request_finished(key, time.monotonic() - start,
+                                           error, token)
+
+        future.add_done_callback(finished)
+        return future
+
+    def _submit(self, key, method_name, *args, **kwargs):
+        """
+        Pass a request to the threads of a pool server.
+
+        :param key: Result of
+            :meth:`~tarantool.connection_pool._make_key`.
+        :type key: :obj:`str`
+
+        :param method_name: :class:`~tarantool.Connection`
+            method name.
+        :type method_name: :obj:`str`
+
+        :param args: Method args.
+        :type args: :obj:`tuple`
+
+        :param kwargs: Method kwargs.
+        :type kwargs: :obj:`dict`
+
+        :return: Future of the method result.
+        :rtype: :class:`~concurrent.futures.Future`
+
+        :raise: :exc:`~tarantool.error.NetworkError`
+
+        :meta private:
+        """
+
+        unit = self.pool[key]
+        task = PoolTask(method_name=method_name, args=args, kwargs=kwargs)
+        # close() disables the processing under the same lock before it
+        # drains the queue, so the task is either failed or taken.
+        with self._refresh_condition:
+            if not unit.request_processing_enabled:
+                raise NetworkError("Connection pool is closed")
+            unit.input_queue.put(task)
+        return task.future
+
+    def call(self, func_name, *args, mode=None, on_push=None, on_push_ctx=None, raw=None):
         """
         Execute a CALL request on the pool server: call a stored Lua
         function. Refer to :meth:`~tarantool.Connection.call`.
@@ -744,6 +1377,9 @@ class ConnectionPool(ConnectionInterface):
         :param on_push_ctx: Refer to
             :paramref:`~tarantool.Connection.call.params.on_push_ctx`.
 
+        :param raw: Refer to
+            :paramref:`~tarantool.Connection.call.params.raw`.
+
         :rtype: :class:`~tarantool.response.Response`
 
         :raise: :exc:`~ValueError`,
@@ -753,9 +1389,9 @@ class ConnectionPool(ConnectionInterface):
         if mode is None:
             raise ValueError("Please, specify 'mode' keyword argument")
 
-        return self._send(mode, 'call', func_name, *args, on_push=on_push, on_push_ctx=on_push_ctx)
+        return self._send(mode, 'call', func_name, *args, on_push=on_push, on_push_ctx=on_push_ctx, raw=raw)
 
-    def eval(self, expr, *args, mode=None, on_push=None, on_push_ctx=None):
+    def eval(self, expr, *args, mode=None, on_push=None, on_push_ctx=None, raw=None):
         """
         Execute an EVAL request on the pool server: evaluate a Lua
         expression. Refer to :meth:`~tarantool.Connection.eval`.
@@ -775,6 +1411,9 @@ class ConnectionPool(ConnectionInterface):
         :param on_push_ctx: Refer to
             :paramref:`~tarantool.Connection.eval.params.on_push_ctx`.
 
+        :param raw: Refer to
+            :paramref:`~tarantool.Connection.eval.params.raw`.
+
         :rtype: :class:`~tarantool.response.Response`
 
         :raise: :exc:`~ValueError`,
@@ -784,7 +1423,7 @@ class ConnectionPool(ConnectionInterface):
         if mode is None:
             raise ValueError("Please, specify 'mode' keyword argument")
 
-        return self._send(mode, 'eval', expr, *args, on_push=on_push, on_push_ctx=on_push_ctx)
+        return self._send(mode, 'eval', expr, *args, on_push=on_push, on_push_ctx=on_push_ctx, raw=raw)
 
     def replace(self, space_name, values, *, mode=Mode.RW, on_push=None, on_push_ctx=None):
         """
@@ -972,7 +1611,8 @@ class ConnectionPool(ConnectionInterface):
         return self._send(mode, 'ping', notime)
 
     def select(self, space_name, key, *, offset=0, limit=0xffffffff,
-               index=0, iterator=None, mode=Mode.ANY, on_push=None, on_push_ctx=None):
+               index=0, iterator=None, mode=Mode.ANY, on_push=None, on_push_ctx=None,
+               raw=None):
         """
         Execute a SELECT request on the pool server: `update`_ a tuple
         from the space. Refer to :meth:`~tarantool.Connection.select`.
@@ -1004,6 +1644,9 @@ class ConnectionPool(ConnectionInterface):
         :param on_push_ctx: Refer to
             :paramref:`~tarantool.Connection.select.params.on_push_ctx`.
 
+        :param raw: Refer to
+            :paramref:`~tarantool.Connection.select.params.raw`.
+
         :rtype: :class:`~tarantool.response.Response`
 
         :raise: :meth:`~tarantool.Connection.select` exceptions
@@ -1012,9 +1655,290 @@ class ConnectionPool(ConnectionInterface):
         """
 
         return self._send(mode, 'select', space_name, key, offset=offset, limit=limit,
-                          index=index, iterator=iterator, on_push=on_push, on_push_ctx=on_push_ctx)
+                          index=index, iterator=iterator, on_push=on_push, on_push_ctx=on_push_ctx,
+                          raw=raw)
+
+    def scan(self, space_name, key=None, *, index=0, iterator=None,
+             batch_size=1000, mode=Mode.ANY):
+        """
+        Iterate over tuples of a space with keyset pagination. Refer to
+        :meth:`~tarantool.Connection.scan`. Each page is selected from
+        a pool server chosen by ``mode``.
 
-    def execute(self, query, params=None, *, mode=None):
+        :param space_name: Refer to
+            :paramref:`~tarantool.Connection.scan.params.space_name`.
+
+        :param key: Refer to
+            :paramref:`~tarantool.Connection.scan.params.key`.
+
+        :param index: Refer to
+            :paramref:`~tarantool.Connection.scan.params.index`.
+
+        :param iterator: Refer to
+            :paramref:`~tarantool.Connection.scan.params.iterator`.
+
+        :param batch_size: Refer to
+            :paramref:`~tarantool.Connection.scan.params.batch_size`.
+
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`, optional
+
+        :rtype: :class:`~tarantool.scan.Scan`
+
+        :raise: :meth:`~tarantool.Connection.scan` exceptions
+        """
+
+        space_no, index_schema = self._send(mode, '_scan_index', space_name, index)
+        index_name = index
+
+        def select_async(_space_no, key, *, index=None, **kwargs):
+            # Pages may be selected from other servers: each of them
+            # resolves the space and index names itself.
+            return self._send_async(mode, 'select_async', space_name, key,
+                                    index=index_name, **kwargs)
+
+        return Scan(select_async, space_no, index_schema, key,
+                    iterator=iterator, batch_size=batch_size)
+
+    def _map_keys(self, mode):
+        """
+        Get healthy pool servers matching a request mode:
+        :attr:`~tarantool.Mode.ANY` matches each server,
+        :attr:`~tarantool.Mode.PREFER_RO` (:attr:`~tarantool.Mode.PREFER_RW`)
+        matches read-only (read-write) servers or read-write (read-only)
+        ones, if there are none.
+
+        :param mode: Request mode.
+        :type mode: :class:`~tarantool.Mode`
+
+        :return: Pool server keys.
+        :rtype: :obj:`list`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`
+
+        :meta private:
+        """
+
+        healthy = [key for key, unit in self.pool.items()
+                   if unit.state.status == Status.HEALTHY]
+        rw = [key for key in healthy if self.pool[key].state.ro == False]
+        ro = [key for key in healthy if self.pool[key].state.ro != False]
+
+        if mode == Mode.RW:
+            keys = rw
+        elif mode == Mode.RO:
+            keys = ro
+        elif mode == Mode.PREFER_RO:
+            keys = ro or rw
+        elif mode == Mode.PREFER_RW:
+            keys = rw or ro
+        else:
+            keys = healthy
+
+        if not keys:
+            raise PoolTolopogyError("Can't find healthy instance in pool")
+        return keys
+
+    def _map(self, mode, reduce, schema_bound, method_name, *args, **kwargs):
+        """
+        Build a request and send it to each pool server matching mode
+        in parallel. The request is built by a pool server
+        :class:`~tarantool.Connection` and sent by others with the same
+        encoded payload, refer to
+        :meth:`~tarantool.request.Request.bind`.
+
+        :param mode: Request mode, refer to
+            :meth:`~tarantool.ConnectionPool._map_keys`.
+        :type mode: :class:`~tarantool.Mode`
+
+        :param reduce: Function to combine the results or ``None``.
+        :type reduce: :obj:`callable`
+
+        :param schema_bound: ``True``, if the payload holds space or
+            index ids resolved with the schema: the request is built
+            once for each schema then. Connections which share a schema
+            through :paramref:`~tarantool.ConnectionPool.params.schema_registry`
+            share the request.
+        :type schema_bound: :obj:`bool`
+
+        :param method_name: :class:`~tarantool.Connection` method name
+            to build a request.
+        :type method_name: :obj:`str`
+
+        :param args: Method args.
+        :type args: :obj:`tuple`
+
+        :param kwargs: Method kwargs.
+        :type kwargs: :obj:`dict`
+
+        :return: Response or exception of each server by its key, or
+            ``reduce`` result.
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`,
+            :exc:`~tarantool.error.NetworkError`
+
+        :meta private:
+        """
+
+        # (schema mapping, request or build exception) pairs.
+        requests = []
+        futures = {}
+        results = {}
+        for key in self._map_keys(mode):
+            conn = self.pool[key].conn
+            schema = None
+            if schema_bound and conn.schema is not None:
+                schema = conn.schema.schema
+            for built_schema, request in requests:
+                if built_schema is schema:
+                    break
+            else:
+                try:
+                    request = self._submit(key, method_name, *args,
+                                           **kwargs).result()
+                except Exception as e:
+                    request = e
+                requests.append((schema, request))
+
+            if isinstance(request, Exception):
+                results[key] = request
+            else:
+                futures[key] = self._submit(key, '_send_encoded', request)
+
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                results[key] = e
+
+        if reduce is not None:
+            return reduce(results)
+        return results
+
+    def map_call(self, func_name, *args, mode=Mode.ANY, reduce=None, raw=None):
+        """
+        Execute a CALL request on each pool server matching the mode in
+        parallel, for example, to collect statistics or to run a local
+        aggregation on each shard. The request is encoded once. Refer
+        to :meth:`~tarantool.Connection.call`.
+
+        .. code-block:: python
+
+            >>> pool.map_call('box.stat')
+            {'localhost:3301': - {...}, 'localhost:3302': - {...}}
+            >>> pool.map_call('count_local', 'demo', reduce=lambda results:
+            ...     sum(resp.data[0] for resp in results.values()))
+            42
+
+        :param func_name: Refer to
+            :paramref:`~tarantool.Connection.call.params.func_name`.
+
+        :param args: Refer to
+            :paramref:`~tarantool.Connection.call.params.args`.
+
+        :param mode: Request mode. :attr:`~tarantool.Mode.ANY` matches
+            each server, :attr:`~tarantool.Mode.PREFER_RO`
+            (:attr:`~tarantool.Mode.PREFER_RW`) matches read-only
+            (read-write) servers or read-write (read-only) ones, if there
+            are none.
+        :type mode: :class:`~tarantool.Mode`, optional
+
+        :param reduce: Function to combine the results. It is called
+            with the result mapping, its return value is returned.
+        :type reduce: :obj:`callable`, optional
+
+        :param raw: Refer to
+            :paramref:`~tarantool.Connection.call.params.raw`.
+
+        :return: :class:`~tarantool.response.Response` or exception of
+            each server by its key (``'host:port'``), or ``reduce``
+            result.
+        :rtype: :obj:`dict`
+
+        :raise: :exc:`~tarantool.error.PoolTolopogyError`,
+            :exc:`~tarantool.error.NetworkError`
+        """
+
+        return self._map(mode, reduce, False, '_request_call', func_name,
+                         *args, raw=raw)
+
+    def map_eval(self, expr, *args, mode=Mode.ANY, reduce=None, raw=None):
+        """
+        Execute an EVAL request on each pool server matching the mode
+        in parallel. The request is encoded once. Refer to
+        :meth:`~tarantool.Connection.eval`.
+
+        :param expr: Refer to
+            :paramref:`~tarantool.Connection.eval.params.expr`.
+
+        :param args: Refer to
+            :paramref:`~tarantool.Connection.eval.params.args`.
+
+        :param mode: Refer to
+            :paramref:`~tarantool.ConnectionPool.map_call.params.mode`.
+
+        :param reduce: Refer to
+            :paramref:`~tarantool.ConnectionPool.map_call.params.reduce`.
+
+        :param raw: Refer to
+            :paramref:`~tarantool.Connection.eval.params.raw`.
+
+        :rtype: Refer to :meth:`~tarantool.ConnectionPool.map_call`.
+
+        :raise: :meth:`~tarantool.ConnectionPool.map_call` exceptions
+        """
+
+        return self._map(mode, reduce, False, '_request_eval', expr,
+                         *args, raw=raw)
+
+    def map_select(self, space_name, key=None, *, offset=0, limit=0xffffffff,
+                   index=0, iterator=None, mode=Mode.ANY, reduce=None,
+                   raw=None):
+        """
+        Execute a SELECT request on each pool server matching the mode
+        in parallel. Space and index names are resolved with the schema
+        of each server, the request is encoded once for servers which
+        share the schema, refer to
+        :paramref:`~tarantool.ConnectionPool.params.schema_registry`.
+        Refer to :meth:`~tarantool.Connection.select`.
+
+        :param space_name: Refer to
+            :paramref:`~tarantool.Connection.select.params.space_name`.
+
+        :param key: Refer to
+            :paramref:`~tarantool.Connection.select.params.key`.
+
+        :param offset: Refer to
+            :paramref:`~tarantool.Connection.select.params.offset`.
+
+        :param limit: Refer to
+            :paramref:`~tarantool.Connection.select.params.limit`.
+
+        :param index: Refer to
+            :paramref:`~tarantool.Connection.select.params.index`.
+
+        :param iterator: Refer to
+            :paramref:`~tarantool.Connection.select.params.iterator`.
+
+        :param mode: Refer to
+            :paramref:`~tarantool.ConnectionPool.map_call.params.mode`.
+
+        :param reduce: Refer to
+            :paramref:`~tarantool.ConnectionPool.map_call.params.reduce`.
+
+        :param raw: Refer to
+            :paramref:`~tarantool.Connection.select.params.raw`.
+
+        :rtype: Refer to :meth:`~tarantool.ConnectionPool.map_call`.
+
+        :raise: :meth:`~tarantool.ConnectionPool.map_call` exceptions
+        """
+
+        return self._map(mode, reduce, True, '_request_select', space_name,
+                         key, offset=offset, limit=limit, index=index,
+                         iterator=iterator, raw=raw)
+
+    def execute(self, query, params=None, *, mode=None, raw=None):
         """
         Execute an SQL request on the pool server. Refer to
         :meth:`~tarantool.Connection.execute`.
@@ -1028,6 +1952,9 @@ class ConnectionPool(ConnectionInterface):
         :param mode: Request mode.
         :type mode: :class:`~tarantool.Mode`
 
+        :param raw: Refer to
+            :paramref:`~tarantool.Connection.execute.params.raw`.
+
         :rtype: :class:`~tarantool.response.Response`
 
         :raise: :exc:`~ValueError`,
@@ -1037,7 +1964,7 @@ class ConnectionPool(ConnectionInterface):
         if mode is None:
             raise ValueError("Please, specify 'mode' keyword argument")
 
-        return self._send(mode, 'execute', query, params)
+        return self._send(mode, 'execute', query, params, raw=raw)
 
     def crud_insert(self, space_name, values, opts={}, *, mode=Mode.ANY):
         """
@@ -30,6 +30,8 @@ IPROTO_DATA = 0x30
 IPROTO_ERROR_24 = 0x31
 #
 IPROTO_METADATA = 0x32
+IPROTO_FIELD_NAME = 0x00
+IPROTO_FIELD_TYPE = 0x01
 IPROTO_SQL_TEXT = 0x40
 IPROTO_SQL_BIND = 0x41
 IPROTO_SQL_INFO = 0x42
@@ -106,6 +108,10 @@ SOCKET_TIMEOUT = None
 RECONNECT_MAX_ATTEMPTS = 10
 # Default delay between attempts to reconnect (seconds)
 RECONNECT_DELAY = 0.1
+# Initial size of a connection receive buffer (bytes)
+RECV_BUFFER_SIZE = 64 * 1024
+# Maximum number of buffers passed to a single vectored write
+IOV_MAX = 1024
 # Default value for transport
 DEFAULT_TRANSPORT = ""
 # Value for SSL transport
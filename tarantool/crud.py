@@ -63,7 +63,7 @@ def call_crud(conn, *args):
     """
 
     try:
-        crud_resp = conn.call(*args)
+        crud_resp = conn.call(*args, raw=False)
     except DatabaseError as e:
         if e.code == ER_NO_SUCH_PROC or e.code == ER_ACCESS_DENIED:
             exc_msg = ". Ensure that you're calling crud.router and user has sufficient grants"
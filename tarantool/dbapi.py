@@ -116,7 +116,7 @@ class Cursor:
 
         self._check_not_closed("Can not execute on closed cursor.")
 
-        response = self._c.execute(query, params)
+        response = self._c.execute(query, params, raw=False)
 
         self._rows = response.data
         self._rowcount = response.affected_row_count or -1
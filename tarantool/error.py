@@ -136,6 +136,11 @@ class MsgpackWarning(UserWarning):
     Warning with encoding or decoding of `MP_EXT`_ types.
     """
 
+class SchemaCacheWarning(UserWarning):
+    """
+    Warning about a schema cache file which cannot be written.
+    """
+
 # Monkey patch os.strerror for win32
 if sys.platform == "win32":
     # Windows Sockets Error Codes (not all, but related on network errors)
@@ -284,7 +284,12 @@ class MeshConnection(Connection):
                  strategy_class=RoundRobinStrategy,
                  cluster_discovery_function=None,
                  cluster_discovery_delay=CLUSTER_DISCOVERY_DELAY,
-                 fetch_schema=True):
+                 fetch_schema=True,
+                 lazy_responses=False,
+                 raw_responses=False,
+                 named_rows=False,
+                 schema_cache_dir=None,
+                 schema_registry=None):
         """
         :param host: Refer to
             :paramref:`~tarantool.Connection.params.host`.
@@ -429,6 +434,23 @@ class MeshConnection(Connection):
         :param fetch_schema: Refer to
             :paramref:`~tarantool.Connection.params.fetch_schema`.
 
+        :param lazy_responses: Refer to
+            :paramref:`~tarantool.Connection.params.lazy_responses`.
+
+        :param raw_responses: Refer to
+            :paramref:`~tarantool.Connection.params.raw_responses`.
+
+        :param named_rows: Refer to
+            :paramref:`~tarantool.Connection.params.named_rows`.
+
+        :param schema_cache_dir: Refer to
+            :paramref:`~tarantool.Connection.params.schema_cache_dir`.
+
+        :param schema_registry: Refer to
+            :paramref:`~tarantool.Connection.params.schema_registry`.
+            The schema is kept in the registry when the connection
+            switches to another instance of the replicaset.
+
         :raises: :exc:`~tarantool.error.ConfigurationError`,
             :class:`~tarantool.Connection` exceptions,
             :class:`~tarantool.MeshConnection.connect` exceptions
@@ -494,7 +516,12 @@ class MeshConnection(Connection):
             ssl_password=addr['ssl_password'],
             ssl_password_file=addr['ssl_password_file'],
             auth_type=addr['auth_type'],
-            fetch_schema=fetch_schema)
+            fetch_schema=fetch_schema,
+            lazy_responses=lazy_responses,
+            raw_responses=raw_responses,
+            named_rows=named_rows,
+            schema_cache_dir=schema_cache_dir,
+            schema_registry=schema_registry)
 
     def connect(self):
         """
@@ -0,0 +1,186 @@
+"""
+Request pipeline definition. It allows to send a batch of requests to
+a Tarantool server without waiting for each response.
+"""
+
+from tarantool.request import RequestPing
+
+
+class Pipeline(object):
+    """
+    Collects requests and sends them to the server at once. Responses
+    are matched to requests by IPROTO_SYNC, so a batch of requests
+    costs roughly a single network round trip.
+
+    Space and index names are resolved when a request is added to
+    the pipeline.
+
+    .. code-block:: python
+
+        >>> pipe = conn.pipeline()
+        >>> pipe.insert('demo', ('BBBB', 'Bravo')).select('demo', 'AAAA')
+        >>> insert_resp, select_resp = pipe.flush()
+        >>> select_resp
+        - ['AAAA', 'Alpha']
+    """
+
+    def __init__(self, connection):
+        """
+        :param connection: Connection to the server.
+        :type connection: :class:`~tarantool.Connection`
+        """
+
+        self.connection = connection
+        self._entries = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _add(self, request, on_push=None, on_push_ctx=None):
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        self._entries.append((request, on_push, on_push_ctx))
+        return self
+
+    def call(self, func_name, *args, on_push=None, on_push_ctx=None):
+        """
+        Add a CALL request. Refer to
+        :meth:`~tarantool.Connection.call`.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = self.connection._request_call(func_name, *args)
+        return self._add(request, on_push, on_push_ctx)
+
+    def eval(self, expr, *args, on_push=None, on_push_ctx=None):
+        """
+        Add an EVAL request. Refer to
+        :meth:`~tarantool.Connection.eval`.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = self.connection._request_eval(expr, *args)
+        return self._add(request, on_push, on_push_ctx)
+
+    def replace(self, space_name, values, on_push=None, on_push_ctx=None):
+        """
+        Add a REPLACE request. Refer to
+        :meth:`~tarantool.Connection.replace`.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = self.connection._request_replace(space_name, values)
+        return self._add(request, on_push, on_push_ctx)
+
+    def insert(self, space_name, values, on_push=None, on_push_ctx=None):
+        """
+        Add an INSERT request. Refer to
+        :meth:`~tarantool.Connection.insert`.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = self.connection._request_insert(space_name, values)
+        return self._add(request, on_push, on_push_ctx)
+
+    def delete(self, space_name, key, *, index=0, on_push=None, on_push_ctx=None):
+        """
+        Add a DELETE request. Refer to
+        :meth:`~tarantool.Connection.delete`.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = self.connection._request_delete(space_name, key, index=index)
+        return self._add(request, on_push, on_push_ctx)
+
+    def upsert(self, space_name, tuple_value, op_list, *, index=0, on_push=None, on_push_ctx=None):
+        """
+        Add an UPSERT request. Refer to
+        :meth:`~tarantool.Connection.upsert`.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = self.connection._request_upsert(space_name, tuple_value,
+                                                  op_list, index=index)
+        return self._add(request, on_push, on_push_ctx)
+
+    def update(self, space_name, key, op_list, *, index=0, on_push=None, on_push_ctx=None):
+        """
+        Add an UPDATE request. Refer to
+        :meth:`~tarantool.Connection.update`.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = self.connection._request_update(space_name, key, op_list,
+                                                  index=index)
+        return self._add(request, on_push, on_push_ctx)
+
+    def ping(self):
+        """
+        Add a PING request. The response of the request is
+        a :class:`~tarantool.response.Response`, not a response time.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = RequestPing(self.connection)
+        return self._add(request)
+
+    def select(self, space_name, key=None, *, offset=0, limit=0xffffffff,
+               index=0, iterator=None, on_push=None, on_push_ctx=None):
+        """
+        Add a SELECT request. Refer to
+        :meth:`~tarantool.Connection.select`.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = self.connection._request_select(space_name, key,
+                                                  offset=offset, limit=limit,
+                                                  index=index,
+                                                  iterator=iterator)
+        return self._add(request, on_push, on_push_ctx)
+
+    def execute(self, query, params=None):
+        """
+        Add an SQL EXECUTE request. Refer to
+        :meth:`~tarantool.Connection.execute`.
+
+        :rtype: :class:`~tarantool.pipeline.Pipeline`
+        """
+
+        request = self.connection._request_execute(query, params)
+        return self._add(request)
+
+    def flush(self, return_exceptions=False):
+        """
+        Send all collected requests and wait for their responses.
+        The pipeline is empty after the call and may be reused.
+
+        A failed request does not interrupt the others: all responses
+        are read before an error is raised. Requests rejected due to
+        an outdated schema are sent again after the schema reload.
+
+        :param return_exceptions: If ``True``, return request errors
+            in place of the corresponding responses instead of raising
+            the first one.
+        :type return_exceptions: :obj:`bool`, optional
+
+        :return: Responses in the order the requests were added.
+        :rtype: :obj:`list` of :class:`~tarantool.response.Response`
+
+        :raise: :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+        """
+
+        entries, self._entries = self._entries, []
+        return self.connection._send_requests(entries, return_exceptions)
@@ -0,0 +1,359 @@
+"""
+Prepared request templates. A template resolves space and index names
+and encodes the constant part of a request body once, so each call
+encodes only the key or the tuple.
+"""
+
+from tarantool.const import (
+    IPROTO_SPACE_ID,
+    IPROTO_INDEX_ID,
+    IPROTO_LIMIT,
+    IPROTO_OFFSET,
+    IPROTO_KEY,
+    IPROTO_TUPLE,
+    IPROTO_ITERATOR,
+    ITERATOR_EQ,
+    ITERATOR_REQ,
+    ITERATOR_ALL,
+    ITERATOR_LT,
+    ITERATOR_LE,
+    ITERATOR_GE,
+    ITERATOR_GT,
+    ITERATOR_BITSET_ALL_SET,
+    ITERATOR_BITSET_ANY_SET,
+    ITERATOR_BITSET_ALL_NOT_SET,
+    ITERATOR_OVERLAPS,
+    ITERATOR_NEIGHBOR,
+)
+from tarantool.request import (
+    RequestDelete,
+    RequestInsert,
+    RequestReplace,
+    RequestSelect,
+)
+from tarantool.utils import wrap_key
+
+# IPROTO_ITERATOR is encoded as a number, names are mapped once.
+_ITERATORS = {
+    'EQ': ITERATOR_EQ,
+    'REQ': ITERATOR_REQ,
+    'ALL': ITERATOR_ALL,
+    'LT': ITERATOR_LT,
+    'LE': ITERATOR_LE,
+    'GE': ITERATOR_GE,
+    'GT': ITERATOR_GT,
+    'BITS_ALL_SET': ITERATOR_BITSET_ALL_SET,
+    'BITS_ANY_SET': ITERATOR_BITSET_ANY_SET,
+    'BITS_ALL_NOT_SET': ITERATOR_BITSET_ALL_NOT_SET,
+    'OVERLAPS': ITERATOR_OVERLAPS,
+    'NEIGHBOR': ITERATOR_NEIGHBOR,
+}
+
+
+class PreparedRequest(object):
+    """
+    Base class for request templates.
+
+    The encoded constant part of the request body is cached until
+    the connection schema or encoding changes. Space and index names
+    are resolved again after that, so a template stays valid after
+    a schema reload or a reconnect.
+    """
+
+    request_class = None
+
+    def __init__(self, connection, space_name, index=0):
+        """
+        :param connection: Connection to the server.
+        :type connection: :class:`~tarantool.Connection`
+
+        :param space_name: Space name or space id.
+        :type space_name: :obj:`str` or :obj:`int`
+
+        :param index: Index name or index id.
+        :type index: :obj:`str` or :obj:`int`, optional
+
+        :raise: :exc:`~tarantool.error.NotSupportedError`,
+            :exc:`~tarantool.error.SchemaError`
+        """
+
+        connection._schemaful_connection_check()
+
+        self.connection = connection
+        self.space_name = space_name
+        self.index = index
+        self._cache = None
+
+        # Report unknown space or index right away.
+        self._body_prefix()
+
+    def _constant_fields(self, space_no, index_no):
+        """
+        Request body fields which do not depend on call arguments.
+
+        :param space_no: Space id.
+        :type space_no: :obj:`int`
+
+        :param index_no: Index id.
+        :type index_no: :obj:`int`
+
+        :rtype: :obj:`dict`
+
+        :meta private:
+        """
+
+        raise NotImplementedError
+
+    def _body_prefix(self):
+        """
+        Get the encoded constant body fields, encode them if the cache
+        is outdated.
+
+        :return: Encoded fields, their count and the space id.
+        :rtype: :obj:`tuple`
+
+        :raise: :exc:`~tarantool.error.SchemaError`
+
+        :meta private:
+        """
+
+        conn = self.connection
+        cache_key = (conn.schema, conn.schema_version, conn.encoding)
+        cache = self._cache
+        if cache is not None and cache[0] == cache_key:
+            return cache[1], cache[2], cache[3]
+
+        space_no = self.space_name
+        if isinstance(space_no, str):
+            space_no = conn.schema.get_space(space_no).sid
+        index_no = self.index
+        if isinstance(index_no, str):
+            index_no = conn.schema.get_index(space_no, index_no).iid
+
+        fields = self._constant_fields(space_no, index_no)
+        packer = conn._request_packer()
+        prefix = b''.join(packer.pack(key) + packer.pack(value)
+                          for key, value in fields.items())
+        # Replace the tuple at once: templates may be shared by threads.
+        self._cache = (cache_key, prefix, len(fields), space_no)
+        return prefix, len(fields), space_no
+
+    def _request(self, fields):
+        """
+        Build a request from the cached constant part of the body and
+        the call specific fields.
+
+        :param fields: Call specific body fields.
+        :type fields: :obj:`dict`
+
+        :rtype: :class:`~tarantool.request.Request`
+
+        :meta private:
+        """
+
+        prefix, count, space_no = self._body_prefix()
+        packer = self.connection._request_packer()
+        parts = [packer.pack_map_header(count + len(fields)), prefix]
+        for key, value in fields.items():
+            parts.append(packer.pack(key))
+            parts.append(packer.pack(value))
+        request = self.request_class.from_body(self.connection,
+                                               b''.join(parts))
+        request.space_no = space_no
+        return request
+
+    def _send(self, fields, on_push=None, on_push_ctx=None):
+        """
+        Build a request and send it to the server.
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :meta private:
+        """
+
+        if on_push is not None and not callable(on_push):
+            raise TypeError('The on_push callback must be callable')
+
+        request = self._request(fields)
+        return self.connection._send_request(request, on_push, on_push_ctx)
+
+
+class PreparedSelect(PreparedRequest):
+    """
+    SELECT request template. Refer to
+    :meth:`~tarantool.Connection.prepare_select`.
+    """
+
+    request_class = RequestSelect
+
+    def __init__(self, connection, space_name, index=0, *, offset=0,
+                 limit=0xffffffff, iterator=None):
+        """
+        :param connection: Connection to the server.
+        :type connection: :class:`~tarantool.Connection`
+
+        :param space_name: Refer to
+            :paramref:`~tarantool.Connection.select.params.space_name`.
+
+        :param index: Refer to
+            :paramref:`~tarantool.Connection.select.params.index`.
+
+        :param offset: Refer to
+            :paramref:`~tarantool.Connection.select.params.offset`.
+
+        :param limit: Refer to
+            :paramref:`~tarantool.Connection.select.params.limit`.
+
+        :param iterator: Refer to
+            :paramref:`~tarantool.Connection.select.params.iterator`.
+            Iterator names (``'GE'``) are mapped to their numbers
+            (:data:`~tarantool.const.ITERATOR_GE`). If not set, chosen
+            on each call like in :meth:`~tarantool.Connection.select`.
+
+        :raise: :exc:`~ValueError`,
+            :exc:`~tarantool.error.NotSupportedError`,
+            :exc:`~tarantool.error.SchemaError`
+        """
+
+        if isinstance(iterator, str):
+            if iterator.upper() not in _ITERATORS:
+                raise ValueError('Unknown iterator %r' % (iterator,))
+            iterator = _ITERATORS[iterator.upper()]
+
+        self.offset = offset
+        self.limit = limit
+        self.iterator = iterator
+        super(PreparedSelect, self).__init__(connection, space_name, index)
+
+    def _constant_fields(self, space_no, index_no):
+        fields = {IPROTO_SPACE_ID: space_no,
+                  IPROTO_INDEX_ID: index_no,
+                  IPROTO_OFFSET: self.offset,
+                  IPROTO_LIMIT: self.limit}
+        if self.iterator is not None:
+            fields[IPROTO_ITERATOR] = self.iterator
+        return fields
+
+    def __call__(self, key=None, *, on_push=None, on_push_ctx=None):
+        """
+        Execute the SELECT request.
+
+        :param key: Key to search in the index.
+
+        :param on_push: Сallback for processing out-of-band messages.
+        :type on_push: :obj:`function`, optional
+
+        :param on_push_ctx: Сontext for working with on_push callback.
+        :type on_push_ctx: optional
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :raise: :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+        """
+
+        key = wrap_key(key, select=True)
+        if self.iterator is None:
+            iterator = ITERATOR_ALL if len(key) == 0 else ITERATOR_EQ
+            fields = {IPROTO_ITERATOR: iterator, IPROTO_KEY: key}
+        else:
+            fields = {IPROTO_KEY: key}
+        return self._send(fields, on_push, on_push_ctx)
+
+
+class PreparedInsert(PreparedRequest):
+    """
+    INSERT request template. Refer to
+    :meth:`~tarantool.Connection.prepare_insert`.
+    """
+
+    request_class = RequestInsert
+
+    def __init__(self, connection, space_name):
+        """
+        :param connection: Connection to the server.
+        :type connection: :class:`~tarantool.Connection`
+
+        :param space_name: Space name or space id.
+        :type space_name: :obj:`str` or :obj:`int`
+
+        :raise: :exc:`~tarantool.error.NotSupportedError`,
+            :exc:`~tarantool.error.SchemaError`
+        """
+
+        super(PreparedInsert, self).__init__(connection, space_name)
+
+    def _constant_fields(self, space_no, index_no):
+        return {IPROTO_SPACE_ID: space_no}
+
+    def __call__(self, values, *, on_push=None, on_push_ctx=None):
+        """
+        Execute the request.
+
+        :param values: Record to be inserted.
+        :type values: :obj:`tuple` or :obj:`list`
+
+        :param on_push: Сallback for processing out-of-band messages.
+        :type on_push: :obj:`function`, optional
+
+        :param on_push_ctx: Сontext for working with on_push callback.
+        :type on_push_ctx: optional
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :raise: :exc:`~AssertionError`,
+            :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+        """
+
+        assert isinstance(values, (tuple, list))
+
+        return self._send({IPROTO_TUPLE: values}, on_push, on_push_ctx)
+
+
+class PreparedReplace(PreparedInsert):
+    """
+    REPLACE request template. Refer to
+    :meth:`~tarantool.Connection.prepare_replace`.
+    """
+
+    request_class = RequestReplace
+
+
+class PreparedDelete(PreparedRequest):
+    """
+    DELETE request template. Refer to
+    :meth:`~tarantool.Connection.prepare_delete`.
+    """
+
+    request_class = RequestDelete
+
+    def _constant_fields(self, space_no, index_no):
+        return {IPROTO_SPACE_ID: space_no,
+                IPROTO_INDEX_ID: index_no}
+
+    def __call__(self, key, *, on_push=None, on_push_ctx=None):
+        """
+        Execute the DELETE request.
+
+        :param key: Key of a tuple to be deleted.
+
+        :param on_push: Сallback for processing out-of-band messages.
+        :type on_push: :obj:`function`, optional
+
+        :param on_push_ctx: Сontext for working with on_push callback.
+        :type on_push_ctx: optional
+
+        :rtype: :class:`~tarantool.response.Response`
+
+        :raise: :exc:`~tarantool.error.DatabaseError`,
+            :exc:`~tarantool.error.SchemaError`,
+            :exc:`~tarantool.error.NetworkError`,
+            :exc:`~tarantool.error.SslError`
+        """
+
+        return self._send({IPROTO_KEY: wrap_key(key)}, on_push, on_push_ctx)
@@ -4,7 +4,9 @@ Request types definitions. For internal use only, there is no API to
 send pre-build request objects.
 """
 
+import copy
 import sys
+import struct
 import msgpack
 import hashlib
 
@@ -65,6 +67,9 @@ from tarantool.utils import (
 
 from tarantool.msgpack_ext.packer import default as packer_default
 
+# Total request length is always encoded as MessagePack uint32.
+_length_struct = struct.Struct('>BI')
+
 def packer_factory(conn):
     """
     Build packer to pack request.
@@ -138,6 +143,23 @@ class Request(object):
 
     request_type = None
 
+    idempotent = False
+    """
+    Whether the request may be safely sent again if the connection has
+    been lost before the response is received.
+    """
+
+    raw = False
+    """
+    Whether the response data should be left encoded. Refer to
+    :attr:`~tarantool.response.Response.raw_data`.
+    """
+
+    space_no = None
+    """
+    Id of the space which tuples are returned in the response, if any.
+    """
+
     def __init__(self, conn):
         """
         :param conn: Request sender.
@@ -150,17 +172,83 @@ class Request(object):
         self._body = ''
         self.response_class = Response
 
-        self.packer = conn._packer_factory()
+    @classmethod
+    def from_body(cls, conn, body):
+        """
+        Build a request with an already encoded payload.
+
+        :param conn: Request sender.
+        :type conn: :class:`~tarantool.Connection`
+
+        :param body: MsgPack encoded request payload.
+        :type body: :obj:`bytes`
+
+        :rtype: :class:`~tarantool.request.Request`
+        """
+
+        request = cls.__new__(cls)
+        Request.__init__(request, conn)
+        request._body = body
+        return request
+
+    def bind(self, conn):
+        """
+        Build the same request to be sent by another connection. The
+        encoded payload is reused, only the header is encoded for the
+        connection, so the connections must have the same encoding.
+
+        :param conn: Request sender.
+        :type conn: :class:`~tarantool.Connection`
+
+        :rtype: :class:`~tarantool.request.Request`
+        """
+
+        request = copy.copy(self)
+        request.conn = conn
+        request._sync = None
+        return request
+
+    @property
+    def packer(self):
+        """
+        :type: :class:`msgpack.Packer`
+
+        Request packer cached by the connection.
+        """
+
+        return self.conn._request_packer()
 
     def _dumps(self, src):
         """
         Encode MsgPack data.
         """
 
-        return self.packer.pack(src)
+        return self.conn._request_packer().pack(src)
+
+    def _pack_header(self, header_fields, length):
+        """
+        Encode header fields and prepend total (header + payload)
+        length info.
+
+        :meta private:
+        """
+
+        header = self._dumps(header_fields)
+        return _length_struct.pack(0xce, length + len(header)) + header
+
+    def buffers(self):
+        """
+        Encode the request without concatenating the header and
+        the payload.
+
+        :return: Total length info with header, and payload.
+        :rtype: :obj:`list` of :obj:`bytes`
+        """
+
+        return [self.header(len(self._body)), self._body]
 
     def __bytes__(self):
-        return self.header(len(self._body)) + self._body
+        return b''.join(self.buffers())
 
     __str__ = __bytes__
 
@@ -194,9 +282,8 @@ class Request(object):
         }
         if self.conn.schema is not None:
             header_fields[IPROTO_SCHEMA_ID] = self.conn.schema_version
-        header = self._dumps(header_fields)
 
-        return self._dumps(length + len(header)) + header
+        return self._pack_header(header_fields, length)
 
 
 class RequestInsert(Request):
@@ -222,6 +309,7 @@ class RequestInsert(Request):
         """
 
         super(RequestInsert, self).__init__(conn)
+        self.space_no = space_no
         assert isinstance(values, (tuple, list))
 
         request_body = self._dumps({IPROTO_SPACE_ID: space_no,
@@ -308,11 +396,9 @@ class RequestAuthenticate(Request):
         self._sync = self.conn.generate_sync()
         # Set IPROTO_SCHEMA_ID: 0 to avoid SchemaReloadException
         # It is ok to use 0 in auth every time.
-        header = self._dumps({IPROTO_REQUEST_TYPE: self.request_type,
-                              IPROTO_SYNC: self._sync,
-                              IPROTO_SCHEMA_ID: 0})
-
-        return self._dumps(length + len(header)) + header
+        return self._pack_header({IPROTO_REQUEST_TYPE: self.request_type,
+                                  IPROTO_SYNC: self._sync,
+                                  IPROTO_SCHEMA_ID: 0}, length)
 
 
 class RequestReplace(Request):
@@ -338,6 +424,7 @@ class RequestReplace(Request):
         """
 
         super(RequestReplace, self).__init__(conn)
+        self.space_no = space_no
         assert isinstance(values, (tuple, list))
 
         request_body = self._dumps({IPROTO_SPACE_ID: space_no,
@@ -372,6 +459,7 @@ class RequestDelete(Request):
         """
 
         super(RequestDelete, self).__init__(conn)
+        self.space_no = space_no
 
         request_body = self._dumps({IPROTO_SPACE_ID: space_no,
                                     IPROTO_INDEX_ID: index_no,
@@ -386,6 +474,7 @@ class RequestSelect(Request):
     """
 
     request_type = REQUEST_TYPE_SELECT
+    idempotent = True
 
     # pylint: disable=W0231
     def __init__(self, conn, space_no, index_no, key, offset, limit, iterator):
@@ -416,6 +505,7 @@ class RequestSelect(Request):
         """
 
         super(RequestSelect, self).__init__(conn)
+        self.space_no = space_no
         request_body = self._dumps({IPROTO_SPACE_ID: space_no,
                                     IPROTO_INDEX_ID: index_no,
                                     IPROTO_OFFSET: offset,
@@ -457,6 +547,7 @@ class RequestUpdate(Request):
         """
 
         super(RequestUpdate, self).__init__(conn)
+        self.space_no = space_no
 
         request_body = self._dumps({IPROTO_SPACE_ID: space_no,
                                     IPROTO_INDEX_ID: index_no,
@@ -540,6 +631,7 @@ class RequestPing(Request):
     """
 
     request_type = REQUEST_TYPE_PING
+    idempotent = True
 
     def __init__(self, conn):
         """
@@ -582,6 +674,7 @@ class RequestUpsert(Request):
         """
 
         super(RequestUpsert, self).__init__(conn)
+        self.space_no = space_no
 
         request_body = self._dumps({IPROTO_SPACE_ID: space_no,
                                     IPROTO_INDEX_ID: index_no,
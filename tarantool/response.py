@@ -11,10 +11,13 @@ import msgpack
 from tarantool.const import (
     IPROTO_REQUEST_TYPE,
     IPROTO_DATA,
+    IPROTO_METADATA,
     IPROTO_ERROR_24,
     IPROTO_ERROR,
     IPROTO_SYNC,
     IPROTO_SCHEMA_ID,
+    IPROTO_CHUNK,
+    REQUEST_TYPE_OK,
     REQUEST_TYPE_ERROR,
     IPROTO_SQL_INFO,
     IPROTO_SQL_INFO_ROW_COUNT,
@@ -31,9 +34,22 @@ from tarantool.error import (
     tnt_strerror
 )
 from tarantool.schema import to_unicode
+from tarantool.columns import (
+    build_dataframe,
+    data_array,
+    decode_columns,
+    metadata_fields,
+    rows_to_columns,
+    space_fields,
+    sql_fields,
+)
 
 from tarantool.msgpack_ext.unpacker import ext_hook as unpacker_ext_hook
 
+# Placeholder of a lazy response row which is not decoded yet.
+_MISSING = object()
+
+
 def unpacker_factory(conn):
     """
     Build unpacker to unpack request response.
@@ -86,6 +102,52 @@ def unpacker_factory(conn):
     return msgpack.Unpacker(**unpacker_kwargs)
 
 
+def unpack_response(conn, response):
+    """
+    Decode a response packet to a ``(header, body)`` pair. The
+    long-lived unpacker of the connection is used, so no decoder is
+    created per response.
+
+    :param conn: Request sender.
+    :type conn: :class:`~tarantool.Connection`
+
+    :param response: Response binary data. A :obj:`memoryview` of
+        the connection receive buffer is not kept: an encoded body is
+        copied, since the buffer is reused by the next read.
+    :type response: :obj:`bytes` or :obj:`memoryview`
+
+    :return: Response header and body. Body is an empty :obj:`dict`,
+        if the response has no body. If
+        :paramref:`~tarantool.Connection.params.lazy_responses` is set
+        or the request has been sent with ``raw=True``, the body of
+        a successful response is returned encoded, as :obj:`bytes`.
+    :rtype: :obj:`tuple`
+    """
+
+    unpacker = conn._response_unpacker()
+    try:
+        start = unpacker.tell()
+        unpacker.feed(response)
+        header = unpacker.unpack()
+        body = {}
+        header_size = unpacker.tell() - start
+        if header_size < len(response):
+            if (header.get(IPROTO_REQUEST_TYPE) == REQUEST_TYPE_OK and
+                    (conn.lazy_responses or
+                     (conn._raw_syncs and
+                      header.get(IPROTO_SYNC) in conn._raw_syncs))):
+                unpacker.skip()
+                body = bytes(response[header_size:])
+            else:
+                body = unpacker.unpack()
+    except BaseException:
+        # Unpacker may keep the rest of a broken packet.
+        conn._unpacker = None
+        raise
+
+    return header, body
+
+
 class Response(Sequence):
     """
     Represents a single response from the server in compliance with the
@@ -94,13 +156,19 @@ class Response(Sequence):
     the server.
     """
 
-    def __init__(self, conn, response):
+    def __init__(self, conn, response, space_no=None):
         """
         :param conn: Request sender.
         :type conn: :class:`~tarantool.Connection`
 
-        :param response: Response binary data.
-        :type response: :obj:`bytes`
+        :param response: Response binary data or ``(header, body)``
+            pair decoded with :func:`~tarantool.response.unpack_response`.
+            Binary data is decoded right away and not kept, refer to
+            :func:`~tarantool.response.unpack_response`.
+        :type response: :obj:`bytes` or :obj:`memoryview` or :obj:`tuple`
+
+        :param space_no: Id of the space which tuples are returned.
+        :type space_no: :obj:`int`, optional
 
         :raise: :exc:`~tarantool.error.DatabaseError`,
             :exc:`~tarantool.error.SchemaReloadException`
@@ -110,34 +178,41 @@ class Response(Sequence):
         # created in the __new__().
         # super(Response, self).__init__()
 
-        unpacker = conn._unpacker_factory()
-
-        unpacker.feed(response)
-        header = unpacker.unpack()
+        if isinstance(response, tuple):
+            header, body = response
+        else:
+            header, body = unpack_response(conn, response)
 
         self.conn = conn
         self._sync = header.get(IPROTO_SYNC, 0)
         self._code = header[IPROTO_REQUEST_TYPE]
-        self._body = {}
+        self._raw_body = None
+        self._raw_data = None
+        self._space_no = space_no
         self._schema_version = header.get(IPROTO_SCHEMA_ID, None)
-        try:
-            self._body = unpacker.unpack()
-        except msgpack.OutOfData:
-            pass
 
-        if self._code < REQUEST_TYPE_ERROR:
+        raw = False
+        if conn._raw_syncs and self._code != IPROTO_CHUNK and \
+                self._sync in conn._raw_syncs:
+            conn._raw_syncs.discard(self._sync)
+            raw = True
+
+        if isinstance(body, bytes):
+            # Lazy response: _body and _data are set on first access,
+            # see __getattr__().
+            self._return_code = 0
+            self._raw_body = body
+            if raw:
+                self._set_raw_data(body)
+        elif self._code < REQUEST_TYPE_ERROR:
             self._return_code = 0
-            self._schema_version = header.get(IPROTO_SCHEMA_ID, None)
-            self._data = self._body.get(IPROTO_DATA, None)
-            if (not isinstance(self._data, (list, tuple)) and
-                    self._data is not None):
-                self._data = [self._data]
-            # # Backward-compatibility
-            # if isinstance(self._data, (list, tuple)):
-            #     self.extend(self._data)
-            # else:
-            #     self.append(self._data)
+            if self._rows_deferred():
+                # Rows are built on first access, see __getattr__().
+                self._decoded_body = body
+            else:
+                self._set_body(body)
         else:
+            self._body = body
             # Separate return_code and completion_code
             self._return_message = self._body.get(IPROTO_ERROR_24, "")
             self._return_code = self._code & (REQUEST_TYPE_ERROR - 1)
@@ -156,12 +231,245 @@ class Response(Sequence):
                                     self._return_message,
                                     extra_info=self._return_error)
 
+    def _set_body(self, body):
+        """
+        Set the decoded body of a successful response.
+
+        :param body: Decoded response body.
+        :type body: :obj:`dict`
+
+        :meta private:
+        """
+
+        data = body.get(IPROTO_DATA, None)
+        if not isinstance(data, (list, tuple)) and data is not None:
+            data = [data]
+        # # Backward-compatibility
+        # if isinstance(self._data, (list, tuple)):
+        #     self.extend(self._data)
+        # else:
+        #     self.append(self._data)
+        row_class = self._row_class()
+        if row_class is not None and data is not None:
+            data = list(map(row_class, data))
+        self._body = body
+        self._data = data
+
+    def _named(self):
+        """
+        Check whether rows are built with a row class, refer to
+        :paramref:`~tarantool.Connection.params.named_rows`.
+
+        :rtype: :obj:`bool`
+
+        :meta private:
+        """
+
+        return self.conn.named_rows and self._space_no is not None and \
+            self._code != IPROTO_CHUNK and self.conn.schema is not None
+
+    def _rows_deferred(self):
+        """
+        Check whether the space schema required to build rows is not
+        loaded. The response may be built in the connection reader
+        thread, which must not send schema requests, so the rows are
+        built on first access instead.
+
+        :rtype: :obj:`bool`
+
+        :meta private:
+        """
+
+        if not self._named():
+            return False
+        space = self.conn.schema.schema.get(self._space_no)
+        return space is None or space.stale
+
+    def _row_class(self):
+        """
+        Get the row class of the response space.
+
+        :rtype: :obj:`type` or :obj:`None`
+
+        :meta private:
+        """
+
+        if not self._named():
+            return None
+        return self.conn._row_class(self._space_no)
+
+    def _set_raw_data(self, body):
+        """
+        Split the encoded IPROTO_DATA of a raw response into encoded
+        rows without decoding them.
+
+        :param body: Encoded response body.
+        :type body: :obj:`bytes`
+
+        :meta private:
+        """
+
+        unpacker = msgpack.Unpacker()
+        unpacker.feed(body)
+        data = None
+        for _ in range(unpacker.read_map_header()):
+            key = unpacker.unpack()
+            start = unpacker.tell()
+            if key != IPROTO_DATA:
+                unpacker.skip()
+                continue
+
+            # mp_array: fixarray, array 16, array 32.
+            if 0x90 <= body[start] <= 0x9f or body[start] in (0xdc, 0xdd):
+                data = []
+                for _ in range(unpacker.read_array_header()):
+                    row_start = unpacker.tell()
+                    unpacker.skip()
+                    data.append(body[row_start:unpacker.tell()])
+            else:
+                unpacker.skip()
+                data = [body[start:unpacker.tell()]]
+            self._raw_data = body[start:unpacker.tell()]
+        self._data = data
+
+    def __getattr__(self, name):
+        # Only called if the attribute is not set: build deferred rows or
+        # decode the body of a lazy or raw response.
+        if name in ('_body', '_data') and '_decoded_body' in self.__dict__:
+            self._set_body(self.__dict__.pop('_decoded_body'))
+            return getattr(self, name)
+        if name in ('_body', '_data') and \
+                self.__dict__.get('_raw_body') is not None:
+            unpacker = self.conn._unpacker_factory()
+            unpacker.feed(self._raw_body)
+            body = unpacker.unpack()
+            if '_data' in self.__dict__:
+                # Raw response: data rows stay encoded.
+                self._body = body
+            else:
+                self._set_body(body)
+            self._raw_body = None
+            return getattr(self, name)
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (type(self).__name__, name))
+
+    def _raw_rows(self):
+        """
+        Find data rows in the encoded body of a lazy response to decode
+        them one by one in a single pass.
+
+        :return: Unpacker positioned at the first row and the number of
+            rows, or ``None`` if the data is not an array.
+        :rtype: :obj:`tuple` or :obj:`None`
+
+        :meta private:
+        """
+
+        if self._raw_body is None:
+            return None
+        unpacker = self.conn._unpacker_factory()
+        unpacker.feed(self._raw_body)
+        try:
+            for _ in range(unpacker.read_map_header()):
+                if unpacker.unpack() != IPROTO_DATA:
+                    unpacker.skip()
+                    continue
+                return unpacker, unpacker.read_array_header()
+        except ValueError:
+            pass
+        return None
+
+    def _raw_row_offsets(self):
+        """
+        Find data rows in the encoded body of a lazy response for
+        random access. The body is scanned once, row offsets are
+        cached in the response.
+
+        :return: Offsets of the rows in the body followed by the end
+            offset of the last row, or ``None`` if the data is not an
+            array.
+        :rtype: :obj:`list` or :obj:`None`
+
+        :meta private:
+        """
+
+        if self._raw_body is None:
+            return None
+        offsets = self.__dict__.get('_row_offsets', False)
+        if offsets is not False:
+            return offsets
+
+        offsets = None
+        # Rows are only skipped, extension types need no decoding.
+        unpacker = msgpack.Unpacker()
+        unpacker.feed(self._raw_body)
+        try:
+            for _ in range(unpacker.read_map_header()):
+                if unpacker.unpack() != IPROTO_DATA:
+                    unpacker.skip()
+                    continue
+                count = unpacker.read_array_header()
+                offsets = [unpacker.tell()]
+                for _ in range(count):
+                    unpacker.skip()
+                    offsets.append(unpacker.tell())
+                break
+        except ValueError:
+            offsets = None
+        self._row_offsets = offsets
+        self._decoded_rows = [_MISSING] * (len(offsets) - 1) if offsets else []
+        return offsets
+
+    def _raw_row(self, offsets, idx):
+        """
+        Decode a data row of a lazy response. Decoded rows are cached,
+        the row unpacker is built once per response.
+
+        :param offsets: Row offsets returned by
+            :meth:`~tarantool.response.Response._raw_row_offsets`.
+        :type offsets: :obj:`list`
+
+        :param idx: Row number.
+        :type idx: :obj:`int`
+
+        :meta private:
+        """
+
+        row = self._decoded_rows[idx]
+        if row is not _MISSING:
+            return row
+
+        unpacker = self.__dict__.get('_row_unpacker')
+        if unpacker is None:
+            unpacker = self._row_unpacker = self.conn._unpacker_factory()
+        with memoryview(self._raw_body) as body:
+            unpacker.feed(body[offsets[idx]:offsets[idx + 1]])
+        row = unpacker.unpack()
+        row_class = self._row_class()
+        if row_class is not None:
+            row = row_class(row)
+        self._decoded_rows[idx] = row
+        return row
+
     def __getitem__(self, idx):
+        if '_data' not in self.__dict__ and isinstance(idx, int):
+            offsets = self._raw_row_offsets()
+            if offsets is not None:
+                count = len(offsets) - 1
+                if idx < 0:
+                    idx += count
+                if not 0 <= idx < count:
+                    raise IndexError('list index out of range')
+                return self._raw_row(offsets, idx)
         if self._data is None:
             raise InterfaceError("Trying to access data when there's no data")
         return self._data.__getitem__(idx)
 
     def __len__(self):
+        if '_data' not in self.__dict__:
+            offsets = self._raw_row_offsets()
+            if offsets is not None:
+                return len(offsets) - 1
         if self._data is None:
             raise InterfaceError("Trying to access data when there's no data")
         return len(self._data)
@@ -203,6 +511,94 @@ class Response(Sequence):
             raise InterfaceError("Trying to access data when there's no data")
         return self._data.count(item)
 
+    def _fields(self):
+        """
+        Get names and types of the data row fields.
+
+        :return: ``(name, type)`` pairs, empty if unknown.
+        :rtype: :obj:`list`
+
+        :meta private:
+        """
+
+        if self._space_no is None or self.conn.schema is None:
+            return []
+        return space_fields(self.conn._response_space(self._space_no))
+
+    def to_columns(self, fields=None, string_dtype=object):
+        """
+        Split the response data into NumPy arrays, one per field. Refer
+        to :meth:`~tarantool.Connection.select_columns` for the type
+        mapping. Field names and types are taken from the space format
+        for SELECT and DML responses and from the SQL metadata for
+        EXECUTE responses. Fields of other responses are named by
+        their numbers.
+
+        If the response body is still encoded (see
+        :paramref:`~tarantool.Connection.params.lazy_responses`), rows
+        are decoded straight into the arrays.
+
+        :param fields: Names or numbers of fields to take. All fields
+            are taken, if not set.
+        :type fields: :obj:`list`, optional
+
+        :param string_dtype: NumPy dtype of ``string`` columns.
+        :type string_dtype: optional
+
+        :return: Field name to array mapping in the field order.
+        :rtype: :obj:`dict`
+
+        :raise: :exc:`~ValueError`,
+            :exc:`~tarantool.error.InterfaceError`
+        """
+
+        info = self._fields()
+        if info:
+            if self._raw_body is not None:
+                return decode_columns(self.conn,
+                                      data_array(self.conn, self._raw_body),
+                                      info, fields, string_dtype)
+            if self._raw_data is not None:
+                return decode_columns(self.conn, self._raw_data, info,
+                                      fields, string_dtype)
+
+        rows = self._data
+        if rows is None:
+            raise InterfaceError("Trying to access data when there's no data")
+        if not info:
+            width = 0
+            for row in rows:
+                if not isinstance(row, (list, tuple)):
+                    raise ValueError('Response data rows are not tuples')
+                width = max(width, len(row))
+            info = [(field_no, None) for field_no in range(width)]
+        return rows_to_columns(rows, info, fields, string_dtype)
+
+    def to_dataframe(self, fields=None):
+        """
+        Build a :class:`pandas.DataFrame` of the response data. Columns
+        are built with :meth:`to_columns`, so rows of an encoded body
+        are never materialized as lists. Numeric and boolean columns
+        with missing values use pandas nullable types.
+
+        .. code-block:: python
+
+            >>> conn.execute('SELECT * FROM "demo"').to_dataframe()
+               id  value
+            0   1    0.5
+            1   2    1.5
+
+        :param fields: Names or numbers of fields to take. All fields
+            are taken, if not set.
+        :type fields: :obj:`list`, optional
+
+        :rtype: :class:`pandas.DataFrame`
+
+        :raise: :meth:`to_columns` exceptions
+        """
+
+        return build_dataframe(self.to_columns(fields))
+
     @property
     def rowcount(self):
         """
@@ -266,6 +662,18 @@ class Response(Sequence):
 
         return self._data
 
+    @property
+    def raw_data(self):
+        """
+        :type: :obj:`bytes` or :obj:`None`
+
+        Encoded IPROTO_DATA of a response to a request sent with
+        ``raw=True``. :attr:`data` of such response is a list of
+        encoded rows. ``None`` for other responses.
+        """
+
+        return self._raw_data
+
     @property
     def strerror(self):
         """
@@ -313,11 +721,64 @@ class Response(Sequence):
     __repr__ = __str__
 
 
+class StreamResponse(Response):
+    """
+    Response to :meth:`~tarantool.Connection.select_stream`. The body
+    is kept encoded and iteration decodes rows one at a time, so
+    the whole list of decoded rows is never built. Other data access
+    decodes the body like a lazy response does.
+    """
+
+    def _set_raw_data(self, body):
+        """
+        Keep the data encoded: rows are decoded by :meth:`__iter__`.
+
+        :meta private:
+        """
+
+    def __iter__(self):
+        if '_data' not in self.__dict__:
+            rows = self._raw_rows()
+            if rows is not None:
+                return self._iter_rows(*rows, self._row_class())
+        return super(StreamResponse, self).__iter__()
+
+    @staticmethod
+    def _iter_rows(unpacker, count, row_class=None):
+        """
+        Decode rows from an unpacker positioned at the first row.
+
+        :param unpacker: Unpacker returned by
+            :meth:`~tarantool.response.Response._raw_rows`.
+        :type unpacker: :class:`msgpack.Unpacker`
+
+        :param count: Number of rows.
+        :type count: :obj:`int`
+
+        :param row_class: Class to build rows with.
+        :type row_class: :obj:`type`, optional
+
+        :meta private:
+        """
+
+        if row_class is None:
+            for _ in range(count):
+                yield unpacker.unpack()
+        else:
+            for _ in range(count):
+                yield row_class(unpacker.unpack())
+
+
 class ResponseExecute(Response):
     """
     Represents an SQL EXECUTE request response.
     """
 
+    def _fields(self):
+        if self._raw_body is not None:
+            return sql_fields(self.conn, self._raw_body)
+        return metadata_fields(self._body.get(IPROTO_METADATA))
+
     @property
     def autoincrement_ids(self):
         """
@@ -358,6 +819,13 @@ class ResponseExecute(Response):
         return info.get(IPROTO_SQL_INFO_ROW_COUNT)
 
 
+class StreamResponseExecute(StreamResponse, ResponseExecute):
+    """
+    SQL EXECUTE request response which keeps the body encoded. Refer to
+    :class:`~tarantool.response.StreamResponse`.
+    """
+
+
 class ResponseProtocolVersion(Response):
     """
     Represents an ID request response: information about server protocol
@@ -0,0 +1,105 @@
+"""
+Row classes with access to tuple fields by name. A class is built per
+space from its format, refer to
+:paramref:`~tarantool.Connection.params.named_rows`.
+"""
+
+import keyword
+
+
+class Row(tuple):
+    """
+    Base class of space row classes. A row is a :obj:`tuple` with a
+    property per named field, so it takes as much memory as a tuple
+    does.
+
+    .. code-block:: python
+
+        >>> row = conn.select('users', 1)[0]
+        >>> row
+        users(id=1, name='Alice', age=None)
+        >>> row.name
+        'Alice'
+        >>> row[1]
+        'Alice'
+        >>> row._asdict()
+        {'id': 1, 'name': 'Alice', 'age': None}
+
+    Trailing nullable fields may be omitted in a tuple: properties of
+    such fields return ``None``. Fields which names are not valid
+    Python identifiers, start with an underscore or clash with
+    :obj:`tuple` attributes have no property: use
+    :meth:`~tarantool.rows.Row._asdict` or the field number to access
+    them.
+    """
+
+    __slots__ = ()
+
+    _fields = ()
+    """
+    Field names from the space format.
+    """
+
+    def _asdict(self):
+        """
+        Get the field name to value mapping. Fields beyond the space
+        format are not included.
+
+        :rtype: :obj:`dict`
+        """
+
+        result = dict.fromkeys(self._fields)
+        result.update(zip(self._fields, self))
+        return result
+
+    def __repr__(self):
+        names = self._fields
+        values = ['%s=%r' % (names[field_no], value) if field_no < len(names)
+                  else repr(value)
+                  for field_no, value in enumerate(self)]
+        return '%s(%s)' % (type(self).__name__, ', '.join(values))
+
+
+def _field_property(field_no):
+    """
+    Build a property to get a field by number.
+
+    :meta private:
+    """
+
+    def get(self):
+        try:
+            return self[field_no]
+        except IndexError:
+            return None
+
+    return property(get)
+
+
+def make_row_class(space_name, fields):
+    """
+    Build a row class for a space.
+
+    :param space_name: Space name, used as the class name if it is
+        a valid identifier.
+    :type space_name: :obj:`str`
+
+    :param fields: Field names in the order of tuple fields.
+    :type fields: :obj:`list`
+
+    :rtype: :obj:`type`
+
+    :meta private:
+    """
+
+    namespace = {'__slots__': (), '_fields': tuple(fields)}
+    for field_no, name in enumerate(fields):
+        if not isinstance(name, str) or not name.isidentifier() or \
+                keyword.iskeyword(name) or name.startswith('_') or \
+                hasattr(Row, name):
+            continue
+        namespace[name] = _field_property(field_no)
+
+    class_name = space_name if isinstance(space_name, str) and \
+        space_name.isidentifier() else 'Row'
+    return type(class_name, (Row,), namespace)
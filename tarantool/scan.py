@@ -0,0 +1,264 @@
+"""
+Keyset pagination over a space index. Each page is selected with
+a key extracted from the last tuple of the previous page, so the cost of
+a page does not grow with the scan position like it does with
+``offset``.
+"""
+
+from itertools import islice
+
+from tarantool.const import (
+    ITERATOR_EQ,
+    ITERATOR_REQ,
+    ITERATOR_ALL,
+    ITERATOR_LT,
+    ITERATOR_LE,
+    ITERATOR_GE,
+    ITERATOR_GT,
+)
+from tarantool.schema import to_unicode
+
+ITERATORS = {
+    'EQ': ITERATOR_EQ,
+    'REQ': ITERATOR_REQ,
+    'ALL': ITERATOR_ALL,
+    'LT': ITERATOR_LT,
+    'LE': ITERATOR_LE,
+    'GE': ITERATOR_GE,
+    'GT': ITERATOR_GT,
+}
+"""
+Iterator types supported by :class:`~tarantool.scan.Scan`.
+"""
+
+# Iterator used to select the pages after the first one.
+CONTINUATION = {
+    ITERATOR_EQ: ITERATOR_GT,
+    ITERATOR_ALL: ITERATOR_GT,
+    ITERATOR_GE: ITERATOR_GT,
+    ITERATOR_GT: ITERATOR_GT,
+    ITERATOR_REQ: ITERATOR_LT,
+    ITERATOR_LE: ITERATOR_LT,
+    ITERATOR_LT: ITERATOR_LT,
+}
+
+
+def is_unique(index):
+    """
+    Check whether an index is unique.
+
+    :param index: Index schema.
+    :type index: :class:`~tarantool.schema.SchemaIndex`
+
+    :rtype: :obj:`bool`
+
+    :meta private:
+    """
+
+    if index.iid == 0:
+        return True
+    opts = index.unique
+    if isinstance(opts, dict):
+        # Tarantool 1.7+ stores index options in a map.
+        return bool(opts.get('unique', opts.get(b'unique', False)))
+    return bool(opts)
+
+
+def is_nullable(index):
+    """
+    Check whether any part of an index is nullable, either in the index
+    definition or in the space format.
+
+    :param index: Index schema.
+    :type index: :class:`~tarantool.schema.SchemaIndex`
+
+    :rtype: :obj:`bool`
+
+    :meta private:
+    """
+
+    if index.iid == 0:
+        return False
+    if getattr(index, 'nullable', False):
+        return True
+    space_format = getattr(index.space, 'format', {})
+    return any(space_format.get(field, {}).get('is_nullable', False)
+               for field, _ in index.parts)
+
+
+class Scan(object):
+    """
+    Iterator over tuples of a space selected page by page. Refer to
+    :meth:`~tarantool.Connection.scan`.
+
+    The request for the next page is sent before the tuples of
+    the current page are returned, so the response is on its way while
+    the caller processes the current page.
+
+    A unique index with nullable parts may have many tuples with
+    the same key with ``NULL`` parts, so its pages after the first one
+    are selected with ``offset`` instead of the last key.
+    """
+
+    def __init__(self, select_async, space_no, index, key=None, *,
+                 iterator=None, batch_size=1000):
+        """
+        :param select_async: Function to send a SELECT request. It is
+            called like :meth:`~tarantool.Connection.select_async`
+            and must return a :class:`~concurrent.futures.Future`.
+        :type select_async: :obj:`function`
+
+        :param space_no: Space id.
+        :type space_no: :obj:`int`
+
+        :param index: Index schema.
+        :type index: :class:`~tarantool.schema.SchemaIndex`
+
+        :param key: Key to start the scan from.
+        :type key: optional
+
+        :param iterator: Iterator type: ``'EQ'``, ``'REQ'``, ``'ALL'``,
+            ``'LT'``, ``'LE'``, ``'GE'``, ``'GT'`` or the matching
+            ``tarantool.const.ITERATOR_*`` value. Defaults to ``'EQ'``
+            if a key is passed and to ``'ALL'`` otherwise.
+        :type iterator: :obj:`str` or :obj:`int`, optional
+
+        :param batch_size: Number of tuples to select per request.
+        :type batch_size: :obj:`int`, optional
+
+        :raise: :exc:`~ValueError`
+        """
+
+        if key is None:
+            key = []
+        elif not isinstance(key, (list, tuple)):
+            key = [key]
+        key = list(key)
+
+        if iterator is None:
+            iterator = ITERATOR_EQ if key else ITERATOR_ALL
+        iterator = ITERATORS.get(iterator, iterator)
+        if iterator not in CONTINUATION:
+            raise ValueError('Iterator %r does not support scan' % (iterator,))
+        if not is_unique(index):
+            raise ValueError('Scan requires a unique index, index %r is not'
+                             % (index.name,))
+        if to_unicode(index.index).upper() == 'HASH' and \
+                CONTINUATION[iterator] != ITERATOR_GT:
+            raise ValueError('HASH index supports only forward scan')
+        if batch_size <= 0:
+            raise ValueError('batch_size must be positive')
+
+        self.select_async = select_async
+        self.space_no = space_no
+        self.index = index
+        self.key = key
+        self.iterator = iterator
+        self.batch_size = batch_size
+        self.nullable = is_nullable(index)
+
+    def _fetch(self, key, iterator, offset=0):
+        """
+        Send a request for a page. Rows are decoded regardless of
+        :paramref:`~tarantool.Connection.params.raw_responses`: the key
+        of the next page is taken from the last row.
+
+        :rtype: :class:`~concurrent.futures.Future`
+
+        :meta private:
+        """
+
+        return self.select_async(self.space_no, key, index=self.index.iid,
+                                 iterator=iterator, offset=offset,
+                                 limit=self.batch_size, raw=False)
+
+    def _key_of(self, row):
+        """
+        Extract the index key from a tuple.
+
+        :rtype: :obj:`list`
+
+        :meta private:
+        """
+
+        return [row[field] if field < len(row) else None
+                for field, _ in self.index.parts]
+
+    def pages(self):
+        """
+        Iterate over the page responses. The request for the next page
+        is sent before the current one is returned.
+
+        :return: Pairs of a page response and the number of its leading
+            rows which belong to the scan.
+        :rtype: :obj:`tuple`
+
+        :raise: :meth:`~tarantool.Connection.select` exceptions
+        """
+
+        # A continuation key selects from the whole index, so EQ and REQ
+        # scans stop at the first tuple out of the key range.
+        prefix = self.key if self.iterator in (ITERATOR_EQ, ITERATOR_REQ) \
+            else None
+        continuation = CONTINUATION[self.iterator]
+
+        future = self._fetch(self.key, self.iterator)
+        offset = 0
+        while future is not None:
+            page = future.result()
+            future = None
+            count = len(page)
+            if count == 0:
+                return
+
+            # Pages are ordered: if the last row is in the range, all
+            # rows are.
+            if prefix and self._key_of(page[-1])[:len(prefix)] != prefix:
+                for count, row in enumerate(page):
+                    if self._key_of(row)[:len(prefix)] != prefix:
+                        break
+                if count > 0:
+                    yield page, count
+                return
+
+            if count >= self.batch_size:
+                offset += count
+                if self.nullable:
+                    future = self._fetch(self.key, self.iterator, offset)
+                else:
+                    future = self._fetch(self._key_of(page[-1]), continuation)
+            yield page, count
+
+    def __iter__(self):
+        for page, count in self.pages():
+            yield from islice(page, count)
+
+    def dataframes(self, fields=None):
+        """
+        Iterate over the scan in :class:`pandas.DataFrame` chunks, one
+        per page of ``batch_size`` rows. Refer to
+        :meth:`~tarantool.response.Response.to_dataframe`. Only one
+        page is kept in memory at once; with
+        :paramref:`~tarantool.Connection.params.lazy_responses` the
+        pages are decoded straight into columns.
+
+        .. code-block:: python
+
+            for frame in conn.scan('demo', batch_size=100000).dataframes():
+                process(frame)
+
+        :param fields: Names or numbers of fields to take. All fields
+            are taken, if not set.
+        :type fields: :obj:`list`, optional
+
+        :rtype: :class:`pandas.DataFrame`
+
+        :raise: :meth:`~tarantool.response.Response.to_dataframe`
+            exceptions
+        """
+
+        for page, count in self.pages():
+            frame = page.to_dataframe(fields)
+            if count < len(frame):
+                frame = frame.iloc[:count]
+            yield frame
@@ -4,12 +4,15 @@ Schema types definitions. For internal use only, there is no API to use
 pre-build schema objects.
 """
 
+import copy
+
 from tarantool.error import (
     Error,
     SchemaError,
     DatabaseError
 )
 import tarantool.const as const
+from tarantool.rows import make_row_class
 
 
 class RecursionError(Error):
@@ -80,6 +83,44 @@ def to_unicode_recursive(x, max_depth):
     return to_unicode(x)
 
 
+def space_not_found(space):
+    """
+    Build an error for a missing space.
+
+    :param space: Space name or space id.
+    :type space: :obj:`str` or :obj:`int`
+
+    :rtype: :exc:`~tarantool.error.SchemaError`
+
+    :meta private:
+    """
+
+    temp_name = 'name' if isinstance(space, str) else 'id'
+    errmsg = "There's no space with {1} '{0}'".format(space, temp_name)
+    return SchemaError(errmsg)
+
+
+def index_not_found(space_object, index):
+    """
+    Build an error for a missing index.
+
+    :param space_object: Space schema.
+    :type space_object: :class:`~tarantool.schema.SchemaSpace`
+
+    :param index: Index name or index id.
+    :type index: :obj:`str` or :obj:`int`
+
+    :rtype: :exc:`~tarantool.error.SchemaError`
+
+    :meta private:
+    """
+
+    temp_name = 'name' if isinstance(index, str) else 'id'
+    errmsg = ("There's no index with {2} '{0}'"
+              " in space '{1}'").format(index, space_object.name, temp_name)
+    return SchemaError(errmsg)
+
+
 class SchemaIndex(object):
     """
     Contains schema for a space index.
@@ -102,6 +143,11 @@ class SchemaIndex(object):
         self.index = index_row[3]
         self.unique = index_row[4]
         self.parts = []
+        self.nullable = False
+        """
+        ``True``, if any index part is nullable. Many tuples may have
+        the same key with ``NULL`` parts in a unique index.
+        """
         try:
             parts_raw = to_unicode_recursive(index_row[5], 3)
         except RecursionError as e:
@@ -111,6 +157,8 @@ class SchemaIndex(object):
             for val in parts_raw:
                 if isinstance(val, dict):
                     self.parts.append((val['field'], val['type']))
+                    if val.get('is_nullable'):
+                        self.nullable = True
                 else:
                     self.parts.append((val[0], val[1]))
         else:
@@ -159,6 +207,13 @@ class SchemaSpace(object):
         if self.name:
             self.schema[self.name] = self
         self.format = dict()
+        self._row_class = None
+        self.stale = False
+        """
+        ``True``, if the server schema has changed since the space
+        schema is fetched. A stale space schema is fetched again on
+        next use, refer to :meth:`~tarantool.schema.Schema.invalidate`.
+        """
         try:
             format_raw = to_unicode_recursive(space_row[6], 3)
         except RecursionError as e:
@@ -169,14 +224,31 @@ class SchemaSpace(object):
             self.format[part['name']] = part
             self.format[part_id     ] = part
 
+    @property
+    def row_class(self):
+        """
+        Row class with access to fields by name, built from the space
+        format on first use. Refer to :class:`~tarantool.rows.Row`.
+
+        :rtype: :obj:`type`
+        """
+
+        if self._row_class is None:
+            fields = [self.format[part_id]['name']
+                      for part_id in range(len(self.format) // 2)]
+            self._row_class = make_row_class(self.name, fields)
+        return self._row_class
+
     def flush(self):
         """
         Clean existing space data.
         """
 
-        del self.schema[self.sid]
-        if self.name:
-            del self.schema[self.name]
+        # The name or the id may already belong to a newer space schema.
+        if self.schema.get(self.sid) is self:
+            self.schema.pop(self.sid, None)
+        if self.name and self.schema.get(self.name) is self:
+            self.schema.pop(self.name, None)
 
 
 class Schema(object):
@@ -192,6 +264,19 @@ class Schema(object):
 
         self.schema = {}
         self.con = con
+        self.lazy = con.fetch_schema == 'lazy'
+        self.missing = set()
+        """
+        Space names and ids and ``(space id, index)`` pairs which have
+        not been found on the server. Cached in lazy mode, refer to
+        :paramref:`~tarantool.Connection.params.fetch_schema`.
+        """
+        self.shared = False
+        """
+        ``True``, if the space schema mapping is shared with other
+        connections through a :class:`~tarantool.schema_cache.SchemaRegistry`.
+        A shared mapping is never changed: it is copied first.
+        """
 
     def get_space(self, space):
         """
@@ -209,11 +294,38 @@ class Schema(object):
         space = to_unicode(space)
 
         try:
-            return self.schema[space]
+            _space = self.schema[space]
         except KeyError:
-            pass
+            if space in self.missing:
+                raise space_not_found(space)
+            return self.fetch_space(space)
+
+        if _space.stale:
+            return self.reload_space(_space, space)
+        return _space
+
+    def reload_space(self, space_object, space):
+        """
+        Fetch a stale space schema again together with its indexes.
 
-        return self.fetch_space(space)
+        :param space_object: Stale space schema.
+        :type space_object: :class:`~tarantool.schema.SchemaSpace`
+
+        :param space: Space name or space id to fetch.
+        :type space: :obj:`str` or :obj:`int`
+
+        :rtype: :class:`~tarantool.schema.SchemaSpace`
+
+        :raises: :meth:`~tarantool.schema.Schema.fetch_space` exceptions
+        """
+
+        # The space may have been dropped or renamed: forget it before
+        # the fetch, so a failed one does not leave it cached.
+        space_object.flush()
+        space_object = self.fetch_space(space)
+        for row in self.fetch_index_from(space_object.sid, None):
+            SchemaIndex(row, space_object)
+        return space_object
 
     def fetch_space(self, space):
         """
@@ -238,15 +350,19 @@ class Schema(object):
             )
         elif len(space_row) == 0 or not len(space_row[0]):
             # We can't find space with this name or id
-            temp_name = 'name' if isinstance(space, str) else 'id'
-            errmsg = "There's no space with {1} '{0}'".format(space, temp_name)
-            raise SchemaError(errmsg)
+            if self.lazy:
+                self.missing.add(space)
+            raise space_not_found(space)
 
+        if self.lazy:
+            self.track_version(space_row)
         space_row = space_row[0]
 
+        if self.shared:
+            self.unshare()
         return SchemaSpace(space_row, self.schema)
 
-    def fetch_space_from(self, space):
+    def fetch_space_from(self, space, raw=False):
         """
         Fetch space schema from the Tarantool server.
 
@@ -254,6 +370,10 @@ class Schema(object):
             fetch all spaces.
         :type space: :obj:`str` or :obj:`int` or :obj:`None`
 
+        :param raw: If ``True``, leave the tuples encoded, refer to
+            :paramref:`~tarantool.Connection.select.params.raw`.
+        :type raw: :obj:`bool`, optional
+
         :return: Space format data received from Tarantool.
         :rtype: :obj:`list` or :obj:`tuple`
 
@@ -273,7 +393,7 @@ class Schema(object):
         try:
             # Try to fetch from '_vspace'
             space_row = self.con.select(const.SPACE_VSPACE, space,
-                                        index=_index)
+                                        index=_index, raw=raw)
         except DatabaseError as e:
             # if space can't be found, then user is using old version of
             # tarantool, try again with '_space'
@@ -281,7 +401,8 @@ class Schema(object):
                 raise
         if space_row is None:
             # Try to fetch from '_space'
-            space_row = self.con.select(const.SPACE_SPACE, space, index=_index)
+            space_row = self.con.select(const.SPACE_SPACE, space, index=_index,
+                                        raw=raw)
 
         return space_row
 
@@ -290,6 +411,9 @@ class Schema(object):
         Fetch all spaces schema from the Tarantool server and build
         corresponding schema objects.
 
+        :return: Fetch response.
+        :rtype: :class:`~tarantool.response.Response`
+
         :raises: :meth:`~tarantool.schema.Schema.fetch_space_from`
             exceptions
         """
@@ -297,6 +421,32 @@ class Schema(object):
         space_rows = self.fetch_space_from(None)
         for row in space_rows:
             SchemaSpace(row, self.schema)
+        return space_rows
+
+    def load_encoded(self, spaces, indexes):
+        """
+        Build space and index schema objects from encoded tuples of
+        all spaces and indexes, for example read from
+        a :class:`~tarantool.schema_cache.SchemaCache`.
+
+        :param spaces: Encoded array of ``_vspace`` tuples.
+        :type spaces: :obj:`bytes`
+
+        :param indexes: Encoded array of ``_vindex`` tuples.
+        :type indexes: :obj:`bytes`
+
+        :raises: :exc:`~tarantool.error.SchemaError`
+        """
+
+        unpacker = self.con._unpacker_factory()
+        unpacker.feed(spaces)
+        unpacker.feed(indexes)
+        space_rows = unpacker.unpack()
+        index_rows = unpacker.unpack()
+        for row in space_rows:
+            SchemaSpace(row, self.schema)
+        for row in index_rows:
+            SchemaIndex(row, self.schema[row[0]])
 
     def get_index(self, space, index):
         """
@@ -322,6 +472,9 @@ class Schema(object):
         except KeyError:
             pass
 
+        if (_space.sid, index) in self.missing:
+            raise index_not_found(_space, index)
+
         return self.fetch_index(_space, index)
 
     def fetch_index(self, space_object, index):
@@ -350,14 +503,15 @@ class Schema(object):
             )
         elif len(index_row) == 0 or not len(index_row[0]):
             # We can't find index with this name or id
-            temp_name = 'name' if isinstance(index, str) else 'id'
-            errmsg = ("There's no index with {2} '{0}'"
-                      " in space '{1}'").format(index, space_object.name,
-                                                temp_name)
-            raise SchemaError(errmsg)
+            if self.lazy:
+                self.missing.add((space_object.sid, index))
+            raise index_not_found(space_object, index)
 
         index_row = index_row[0]
 
+        if self.shared:
+            self.unshare()
+            space_object = self.schema[space_object.sid]
         return SchemaIndex(index_row, space_object)
 
     def fetch_index_all(self):
@@ -365,14 +519,18 @@ class Schema(object):
         Fetch all spaces indexes schema from the Tarantool server and
         build corresponding schema objects.
 
+        :return: Fetch response.
+        :rtype: :class:`~tarantool.response.Response`
+
         :raises: :meth:`~tarantool.schema.Schema.fetch_index_from`
             exceptions
         """
         index_rows = self.fetch_index_from(None, None)
         for row in index_rows:
             SchemaIndex(row, self.schema[row[0]])
+        return index_rows
 
-    def fetch_index_from(self, space, index):
+    def fetch_index_from(self, space, index, raw=False):
         """
         Fetch space index schema from the Tarantool server.
 
@@ -384,6 +542,10 @@ class Schema(object):
             indexes schema.
         :type index: :obj:`str` or :obj:`int` or :obj:`None`
 
+        :param raw: Refer to
+            :paramref:`~tarantool.schema.Schema.fetch_space_from.params.raw`.
+        :type raw: :obj:`bool`, optional
+
         :return: Space index format data received from Tarantool.
         :rtype: :obj:`list` or :obj:`tuple`
 
@@ -410,7 +572,7 @@ class Schema(object):
         try:
             # Try to fetch from '_vindex'
             index_row = self.con.select(const.SPACE_VINDEX, _key_tuple,
-                                        index=_index)
+                                        index=_index, raw=raw)
         except DatabaseError as e:
             # if space can't be found, then user is using old version of
             # tarantool, try again with '_index'
@@ -419,7 +581,7 @@ class Schema(object):
         if index_row is None:
             # Try to fetch from '_index'
             index_row = self.con.select(const.SPACE_INDEX, _key_tuple,
-                                        index=_index)
+                                        index=_index, raw=raw)
 
         return index_row
 
@@ -454,9 +616,85 @@ class Schema(object):
 
         return field
 
+    def invalidate(self):
+        """
+        Mark the loaded space and index schema stale after a server
+        schema change. Nothing is fetched immediately: a stale space is
+        fetched again with its indexes on next use, spaces which are not
+        used are never fetched.
+        """
+
+        if self.shared:
+            self.unshare(stale=True)
+        else:
+            for space in list(self.schema.values()):
+                space.stale = True
+        self.missing.clear()
+
+    def share(self, spaces):
+        """
+        Use a space schema mapping shared with other connections.
+
+        :param spaces: Space schema mapping of a schema registered in
+            a :class:`~tarantool.schema_cache.SchemaRegistry`.
+        :type spaces: :obj:`dict`
+        """
+
+        self.schema = spaces
+        self.shared = True
+
+    def unshare(self, stale=False):
+        """
+        Replace the shared space schema mapping with a private copy
+        before changing it. Space schema objects are copied, index
+        schema objects and space formats are not changed in place, so
+        they are kept shared.
+
+        :param stale: Mark the copied space schema stale, refer to
+            :meth:`~tarantool.schema.Schema.invalidate`.
+        :type stale: :obj:`bool`, optional
+        """
+
+        spaces = {}
+        copies = {}
+        for key, space in self.schema.items():
+            space_copy = copies.get(id(space))
+            if space_copy is None:
+                space_copy = copy.copy(space)
+                space_copy.schema = spaces
+                space_copy.indexes = dict(space.indexes)
+                space_copy.stale = stale
+                copies[id(space)] = space_copy
+            spaces[key] = space_copy
+        # The reader thread may look the mapping up meanwhile: replace
+        # it only when the copy is complete.
+        self.schema = spaces
+        self.shared = False
+
+    def track_version(self, response):
+        """
+        Take the schema version of the connection from a schema fetch
+        response, if it is not known yet. Requests are then sent with
+        the version, so the server reports schema changes and the
+        cached schema (missing names included) is invalidated. In lazy
+        mode the version is not known otherwise, since the schema is
+        not loaded on connect.
+
+        :param response: Schema fetch response.
+        :type response: :class:`~tarantool.response.Response`
+        """
+
+        if not self.con.schema_version and response.schema_version:
+            self.con.schema_version = response.schema_version
+
     def flush(self):
         """
         Clean existing schema data.
         """
 
-        self.schema.clear()
+        if self.shared:
+            self.schema = {}
+            self.shared = False
+        else:
+            self.schema.clear()
+        self.missing.clear()
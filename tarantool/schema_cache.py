@@ -0,0 +1,244 @@
+"""
+Caches of the space and index schema.
+
+:class:`~tarantool.schema_cache.SchemaCache` is an on-disk cache, refer
+to :paramref:`~tarantool.Connection.params.schema_cache_dir`. A cache
+file holds the encoded ``_vspace`` and ``_vindex`` tuples of an
+instance, as seen by a user, together with the schema version they have
+been fetched with. A file is used only if its version matches the
+current schema version reported by the server, otherwise the schema is
+fetched and the file is replaced.
+
+:class:`~tarantool.schema_cache.SchemaRegistry` is an in-memory registry
+of loaded schema shared by connections to instances of a replicaset,
+refer to :paramref:`~tarantool.Connection.params.schema_registry`.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+
+import msgpack
+
+_FORMAT = 1
+
+
+class SchemaCache(object):
+    """
+    Directory of schema cache files.
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: Directory to keep cache files in. It is created
+            on the first write, if it does not exist.
+        :type directory: :obj:`str`
+        """
+
+        self.directory = directory
+
+    def path(self, instance_uuid, user):
+        """
+        Get the cache file path of an instance and a user: system space
+        views return different tuples to different users.
+
+        :param instance_uuid: Instance UUID from the server greeting.
+        :type instance_uuid: :class:`~uuid.UUID` or :obj:`str`
+
+        :param user: User name. ``None`` stands for ``guest``.
+        :type user: :obj:`str` or :obj:`None`
+
+        :rtype: :obj:`str`
+        """
+
+        user_key = hashlib.sha1((user or 'guest').encode()).hexdigest()[:16]
+        return os.path.join(self.directory,
+                            '%s-%s.schema' % (instance_uuid, user_key))
+
+    def read(self, instance_uuid, user, version):
+        """
+        Read the cached schema.
+
+        :param instance_uuid: Refer to
+            :paramref:`~tarantool.schema_cache.SchemaCache.path.params.instance_uuid`.
+
+        :param user: Refer to
+            :paramref:`~tarantool.schema_cache.SchemaCache.path.params.user`.
+
+        :param version: Current schema version of the server.
+        :type version: :obj:`int`
+
+        :return: Encoded ``_vspace`` and ``_vindex`` tuples or ``None``,
+            if there is no valid cache file for the version.
+        :rtype: :obj:`tuple` or :obj:`None`
+        """
+
+        try:
+            with open(self.path(instance_uuid, user), 'rb') as cache_file:
+                entry = msgpack.unpackb(cache_file.read(), raw=False)
+        except (OSError, ValueError, msgpack.UnpackException):
+            return None
+
+        if not isinstance(entry, dict) or entry.get('format') != _FORMAT or \
+                entry.get('version') != version:
+            return None
+        return entry['spaces'], entry['indexes']
+
+    def write(self, instance_uuid, user, version, spaces, indexes):
+        """
+        Write the schema to a cache file. The file is written under
+        a temporary name and renamed, so concurrent readers and writers
+        see either the old or the new file.
+
+        :param instance_uuid: Refer to
+            :paramref:`~tarantool.schema_cache.SchemaCache.path.params.instance_uuid`.
+
+        :param user: Refer to
+            :paramref:`~tarantool.schema_cache.SchemaCache.path.params.user`.
+
+        :param version: Schema version the tuples have been fetched with.
+        :type version: :obj:`int`
+
+        :param spaces: Encoded ``_vspace`` tuples.
+        :type spaces: :obj:`bytes`
+
+        :param indexes: Encoded ``_vindex`` tuples.
+        :type indexes: :obj:`bytes`
+
+        :raise: :exc:`~OSError`
+        """
+
+        data = msgpack.packb({
+            'format': _FORMAT,
+            'version': version,
+            'spaces': bytes(spaces),
+            'indexes': bytes(indexes),
+        }, use_bin_type=True)
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.schema-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, self.path(instance_uuid, user))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+class SchemaRegistry(object):
+    """
+    Space and index schema shared by connections. Instances of
+    a replicaset have the same schema, so connections to them may use
+    a single copy of it instead of fetching and keeping their own.
+
+    The schema is registered by replicaset UUID, user (system space
+    views return different tuples to different users) and schema
+    version. A registered schema is never changed: a connection which
+    needs to change it (for example, after a schema change on the
+    server) takes a private copy. Only the latest version is kept for
+    a replicaset and a user.
+
+    .. code-block:: python
+
+        >>> registry = tarantool.SchemaRegistry()
+        >>> conn1 = tarantool.MeshConnection(addrs=addrs,
+        ...                                  schema_registry=registry)
+        >>> conn2 = tarantool.MeshConnection(addrs=addrs,
+        ...                                  schema_registry=registry)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._loading = {}
+        self._replicasets = {}
+
+    def get_replicaset(self, instance_uuid):
+        """
+        Get the replicaset UUID of an instance, if it is known.
+
+        :param instance_uuid: Instance UUID from the server greeting.
+        :type instance_uuid: :class:`~uuid.UUID` or :obj:`str`
+
+        :rtype: :obj:`str` or :obj:`None`
+        """
+
+        return self._replicasets.get(str(instance_uuid))
+
+    def set_replicaset(self, instance_uuid, replicaset_uuid):
+        """
+        Remember the replicaset UUID of an instance.
+
+        :param instance_uuid: Instance UUID from the server greeting.
+        :type instance_uuid: :class:`~uuid.UUID` or :obj:`str`
+
+        :param replicaset_uuid: Replicaset UUID from `box.info`_.
+        :type replicaset_uuid: :obj:`str`
+
+        .. _box.info: https://www.tarantool.io/en/doc/latest/reference/reference_lua/box_info/
+        """
+
+        self._replicasets[str(instance_uuid)] = str(replicaset_uuid)
+
+    def load(self, replicaset_uuid, user, version, fetch):
+        """
+        Get the schema of a replicaset. If it is not registered, fetch
+        and register it. Concurrent calls for the same schema wait for
+        the first one instead of fetching it too.
+
+        :param replicaset_uuid: Replicaset UUID.
+        :type replicaset_uuid: :obj:`str`
+
+        :param user: User name. ``None`` stands for ``guest``.
+        :type user: :obj:`str` or :obj:`None`
+
+        :param version: Current schema version of the server.
+        :type version: :obj:`int`
+
+        :param fetch: Function to fetch the schema. It returns the
+            space schema mapping of a :class:`~tarantool.schema.Schema`
+            and the schema version it has been fetched with, or
+            ``None`` if the version is not known.
+        :type fetch: :obj:`callable`
+
+        :return: Space schema mapping and its schema version. The
+            version is ``None``, if the fetched schema has not been
+            registered.
+        :rtype: :obj:`tuple`
+
+        :raise: ``fetch`` exceptions
+        """
+
+        user = user or 'guest'
+        key = (replicaset_uuid, user, version)
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key], version
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    return self._entries[key], version
+
+            try:
+                spaces, fetched_version = fetch()
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+            if not fetched_version:
+                return spaces, None
+
+            with self._lock:
+                fetched_key = (replicaset_uuid, user, fetched_version)
+                for other_key in list(self._entries):
+                    if other_key[:2] == fetched_key[:2] and \
+                            other_key[2] < fetched_version:
+                        del self._entries[other_key]
+                self._entries.setdefault(fetched_key, spaces)
+                return self._entries[fetched_key], fetched_version
@@ -24,6 +24,18 @@ from .test_error_ext import TestSuite_ErrorExt
 from .test_push import TestSuite_Push
 from .test_connection import TestSuite_Connection
 from .test_crud import TestSuite_Crud
+from .test_pipeline import TestSuite_Pipeline
+from .test_future import TestSuite_Future
+from .test_async_connection import TestSuite_AsyncConnection
+from .test_prepared import TestSuite_Prepared
+from .test_lazy_response import TestSuite_LazyResponse
+from .test_raw_response import TestSuite_RawResponse
+from .test_select_stream import TestSuite_SelectStream
+from .test_scan import TestSuite_Scan
+from .test_columns import TestSuite_Columns
+from .test_dataframe import TestSuite_DataFrame
+from .test_named_rows import TestSuite_NamedRows
+from .test_schema_cache import TestSuite_SchemaCache
 
 test_cases = (TestSuite_Schema_UnicodeConnection,
               TestSuite_Schema_BinaryConnection,
@@ -32,7 +44,13 @@ test_cases = (TestSuite_Schema_UnicodeConnection,
               TestSuite_Encoding, TestSuite_Pool, TestSuite_Ssl,
               TestSuite_Decimal, TestSuite_UUID, TestSuite_Datetime,
               TestSuite_Interval, TestSuite_ErrorExt, TestSuite_Push,
-              TestSuite_Connection, TestSuite_Crud,)
+              TestSuite_Connection, TestSuite_Crud,
+              TestSuite_Pipeline, TestSuite_Future,
+              TestSuite_AsyncConnection, TestSuite_Prepared,
+              TestSuite_LazyResponse, TestSuite_RawResponse,
+              TestSuite_SelectStream, TestSuite_Scan, TestSuite_Columns,
+              TestSuite_DataFrame, TestSuite_NamedRows,
+              TestSuite_SchemaCache,)
 
 def load_tests(loader, tests, pattern):
     suite = unittest.TestSuite()
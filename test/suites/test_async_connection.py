@@ -0,0 +1,173 @@
+import sys
+import time
+import asyncio
+import unittest
+import tarantool
+from tarantool.error import DatabaseError, NetworkError, SchemaError
+
+from .lib.tarantool_server import TarantoolServer
+
+
+def run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+class TestSuite_AsyncConnection(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' ASYNC CONNECTION '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('async', {format = {
+                {name = 'id', type = 'unsigned'},
+                {name = 'name', type = 'string'},
+            }})
+            box.space['async']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+            box.space['async']:create_index('by_name', {
+                type = 'tree',
+                parts = {2, 'string'},
+                unique = true})
+
+            fiber = require('fiber')
+            function sleep_and_return(delay, value)
+                fiber.sleep(delay)
+                return value
+            end
+
+            function push_values(...)
+                for _, v in ipairs({...}) do
+                    box.session.push(v)
+                end
+                return select('#', ...)
+            end
+        """)
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+        self.con = run(tarantool.connect_async(self.srv.host,
+                                               self.srv.args['primary'],
+                                               user='test', password='test'))
+
+    def test_00_ping(self):
+        self.assertEqual(run(self.con.ping(notime=True)), "Success")
+
+    def test_01_dml(self):
+        async def dml():
+            self.assertSequenceEqual(await self.con.insert('async', (1, 'a')),
+                                     [[1, 'a']])
+            self.assertSequenceEqual(await self.con.replace('async', (2, 'b')),
+                                     [[2, 'b']])
+            self.assertSequenceEqual(
+                await self.con.update('async', 2, [('=', 'name', 'c')]),
+                [[2, 'c']])
+            self.assertSequenceEqual(
+                await self.con.upsert('async', (3, 'd'), [('=', 2, 'e')]), [])
+            self.assertSequenceEqual(
+                await self.con.select('async', 'c', index='by_name'), [[2, 'c']])
+            self.assertSequenceEqual(await self.con.delete('async', 3),
+                                     [[3, 'd']])
+            self.assertSequenceEqual(await self.con.eval('return ...', 1, 2),
+                                     [1, 2])
+
+        run(dml())
+
+    def test_02_multiplexing(self):
+        async def requests():
+            return await asyncio.gather(
+                self.con.call('sleep_and_return', 0.5, 'slow'),
+                self.con.call('sleep_and_return', 0.1, 'fast'),
+                *[self.con.select('async', 1) for _ in range(100)])
+
+        start = time.time()
+        responses = run(requests())
+        self.assertLess(time.time() - start, 1)
+        self.assertSequenceEqual(responses[0], ['slow'])
+        self.assertSequenceEqual(responses[1], ['fast'])
+        for response in responses[2:]:
+            self.assertSequenceEqual(response, [[1, 'a']])
+
+    def test_03_error(self):
+        with self.assertRaises(DatabaseError):
+            run(self.con.call('non_existing_function'))
+        with self.assertRaises(SchemaError):
+            run(self.con.select('non_existing_space'))
+        self.assertEqual(run(self.con.ping(notime=True)), "Success")
+
+    def test_04_push(self):
+        pushed = []
+        def on_push(data, ctx):
+            ctx.append(data)
+
+        response = run(self.con.call('push_values', 1, 2,
+                                     on_push=on_push, on_push_ctx=pushed))
+        self.assertSequenceEqual(response, [2])
+        self.assertEqual(pushed, [[1], [2]])
+
+    def test_05_schema_reload(self):
+        run(self.con.ping())
+        self.adm("box.schema.create_space('async_new'):create_index('pk')")
+
+        self.assertSequenceEqual(run(self.con.select('async', 1)), [[1, 'a']])
+        self.assertSequenceEqual(run(self.con.insert('async_new', (1,))), [[1]])
+
+    def test_06_execute(self):
+        response = run(self.con.execute('select 1 as "x"'))
+        self.assertSequenceEqual(response, [[1]])
+
+    def test_07_timeout(self):
+        self.con.socket_timeout = 0.1
+        with self.assertRaises(NetworkError):
+            run(self.con.call('sleep_and_return', 0.5, None))
+        self.con.socket_timeout = None
+        run(asyncio.sleep(0.5))
+        self.assertEqual(run(self.con.ping(notime=True)), "Success")
+
+    def test_08_close(self):
+        self.assertFalse(self.con.is_closed())
+        run(self.con.close())
+        self.assertTrue(self.con.is_closed())
+        # Reconnect on request.
+        self.assertEqual(run(self.con.ping(notime=True)), "Success")
+
+    def test_09_fetch_schema_false(self):
+        con = tarantool.AsyncConnection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test',
+                                        fetch_schema=False)
+        run(con.connect())
+        self.assertIsNone(con.schema)
+        with self.assertRaises(tarantool.error.NotSupportedError):
+            run(con.select('async', 1))
+        self.assertSequenceEqual(run(con.call('sleep_and_return', 0, 1)), [1])
+        run(con.close())
+
+    def test_10_columns_after_schema_change(self):
+        response = run(self.con.select('async', 1))
+        self.con.schema.invalidate()
+        with self.assertRaises(SchemaError):
+            response.to_columns()
+
+        # The stale space is fetched again for a new response.
+        columns = run(self.con.select_columns('async', 1))
+        self.assertEqual(list(columns), ['id', 'name'])
+        self.assertEqual(list(columns['id']), [1])
+
+    def tearDown(self):
+        run(self.con.close())
+
+    @classmethod
+    def tearDownClass(self):
+        self.srv.stop()
+        self.srv.clean()
@@ -0,0 +1,112 @@
+import sys
+import unittest
+import numpy
+import tarantool
+
+from .lib.skip import skip_or_run_sql_test, skip_or_run_datetime_test
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_Columns(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' COLUMNS '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('columns', {format = {
+                {name = 'id', type = 'unsigned'},
+                {name = 'delta', type = 'integer'},
+                {name = 'value', type = 'double', is_nullable = true},
+                {name = 'name', type = 'string'},
+                {name = 'flag', type = 'boolean', is_nullable = true},
+            }})
+            box.space['columns']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+            for i = 1, 100 do
+                box.space['columns']:insert({i, -i, i / 2, 'name_' .. i, i % 2 == 0})
+            end
+            box.space['columns']:insert({101, 0, nil, 'no_value'})
+        """)
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test')
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+    def test_00_types(self):
+        columns = self.con.select_columns('columns', limit=100)
+        self.assertEqual(list(columns), ['id', 'delta', 'value', 'name', 'flag'])
+        self.assertEqual(columns['id'].dtype, numpy.uint64)
+        self.assertEqual(columns['delta'].dtype, numpy.int64)
+        self.assertEqual(columns['value'].dtype, numpy.float64)
+        self.assertEqual(columns['name'].dtype, object)
+        self.assertEqual(columns['flag'].dtype, bool)
+        self.assertEqual(columns['id'].tolist(), list(range(1, 101)))
+        self.assertEqual(columns['delta'].tolist(), list(range(-1, -101, -1)))
+        self.assertEqual(columns['value'][9], 5.0)
+        self.assertEqual(columns['name'][0], 'name_1')
+
+    def test_01_missing_values(self):
+        columns = self.con.select_columns('columns', 101)
+        self.assertIsInstance(columns['value'], numpy.ma.MaskedArray)
+        self.assertTrue(columns['value'].mask[0])
+        self.assertTrue(columns['flag'].mask[0])
+        self.assertEqual(columns['name'].tolist(), ['no_value'])
+
+    def test_02_fields(self):
+        columns = self.con.select_columns('columns', 5, iterator=tarantool.const.ITERATOR_LE,
+                                          fields=['id', 3], string_dtype='U8')
+        self.assertEqual(list(columns), ['id', 'name'])
+        self.assertEqual(columns['id'].tolist(), [5, 4, 3, 2, 1])
+        self.assertEqual(columns['name'].dtype, numpy.dtype('U8'))
+
+        with self.assertRaises(ValueError):
+            self.con.select_columns('columns', fields=['not_exist'])
+
+    def test_03_empty(self):
+        columns = self.con.select_columns('columns', 1000)
+        self.assertEqual(len(columns['id']), 0)
+
+    @skip_or_run_datetime_test
+    def test_04_datetime(self):
+        self.adm(r"""
+            box.schema.create_space('columns_datetime', {format = {
+                {name = 'id', type = 'unsigned'},
+                {name = 'dt', type = 'datetime', is_nullable = true},
+            }})
+            box.space['columns_datetime']:create_index('primary')
+        """)
+        dt = tarantool.Datetime(year=2022, month=8, day=31, hour=18, minute=7,
+                                sec=54, nsec=308543321, tz='Europe/Moscow')
+        self.con.insert('columns_datetime', [1, dt])
+        self.con.insert('columns_datetime', [2, None])
+
+        columns = self.con.select_columns('columns_datetime')
+        self.assertEqual(columns['dt'].dtype, numpy.dtype('datetime64[ns]'))
+        self.assertEqual(columns['dt'][0], numpy.datetime64(dt.value, 'ns'))
+        self.assertTrue(columns['dt'].mask[1])
+
+    @skip_or_run_sql_test
+    def test_05_execute(self):
+        columns = self.con.execute_columns(
+            'SELECT "id", "name" FROM "columns" WHERE "id" <= ?', [3])
+        self.assertEqual(list(columns), ['id', 'name'])
+        self.assertEqual(columns['id'].dtype, numpy.uint64)
+        self.assertEqual(columns['name'].tolist(), ['name_1', 'name_2', 'name_3'])
+
+    @classmethod
+    def tearDownClass(self):
+        self.con.close()
+        self.srv.stop()
+        self.srv.clean()
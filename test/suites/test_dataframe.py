@@ -0,0 +1,97 @@
+import sys
+import unittest
+import pandas
+import tarantool
+
+from .lib.skip import skip_or_run_sql_test
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_DataFrame(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' DATAFRAME '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('frame', {format = {
+                {name = 'id', type = 'unsigned'},
+                {name = 'name', type = 'string'},
+                {name = 'value', type = 'integer', is_nullable = true},
+            }})
+            box.space['frame']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+            for i = 1, 50 do
+                box.space['frame']:insert({i, 'name_' .. i, i * 10})
+            end
+            box.space['frame']:insert({51, 'no_value'})
+        """)
+        args = [self.srv.host, self.srv.args['primary']]
+        kwargs = {'user': 'test', 'password': 'test'}
+        self.con = tarantool.Connection(*args, **kwargs)
+        self.con_lazy = tarantool.Connection(*args, lazy_responses=True, **kwargs)
+        self.conns = [self.con, self.con_lazy]
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+    def test_00_select(self):
+        for con in self.conns:
+            frame = con.select('frame', limit=50).to_dataframe()
+            self.assertEqual(list(frame.columns), ['id', 'name', 'value'])
+            self.assertEqual(len(frame), 50)
+            self.assertEqual(frame['id'].dtype, 'uint64')
+            self.assertEqual(frame['value'].sum(), sum(range(10, 510, 10)))
+            self.assertEqual(frame['name'][0], 'name_1')
+
+    def test_01_lazy_response_stays_encoded(self):
+        resp = self.con_lazy.select('frame')
+        resp.to_dataframe()
+        self.assertNotIn('_data', resp.__dict__)
+
+    def test_02_missing_values(self):
+        for con in self.conns:
+            frame = con.select('frame', 51).to_dataframe()
+            self.assertTrue(pandas.isna(frame['value'][0]))
+            self.assertEqual(frame['value'].dtype, 'Int64')
+
+    def test_03_fields(self):
+        frame = self.con.select('frame', 3).to_dataframe(['name'])
+        self.assertEqual(list(frame.columns), ['name'])
+
+    @skip_or_run_sql_test
+    def test_04_execute(self):
+        for con in self.conns:
+            frame = con.execute('SELECT "id" AS "x", "name" FROM "frame" '
+                                'WHERE "id" < ?', [4]).to_dataframe()
+            self.assertEqual(list(frame.columns), ['x', 'name'])
+            self.assertEqual(frame['x'].tolist(), [1, 2, 3])
+
+    def test_05_call(self):
+        frame = self.con.eval('return {1, "a"}, {2, "b"}').to_dataframe()
+        self.assertEqual(list(frame.columns), [0, 1])
+        self.assertEqual(frame[1].tolist(), ['a', 'b'])
+
+    def test_06_scan_chunks(self):
+        for con in self.conns:
+            frames = list(con.scan('frame', batch_size=20).dataframes())
+            self.assertEqual([len(frame) for frame in frames], [20, 20, 11])
+            self.assertEqual(pandas.concat(frames)['id'].tolist(),
+                             list(range(1, 52)))
+
+    @classmethod
+    def tearDownClass(self):
+        for con in self.conns:
+            con.close()
+        self.srv.stop()
+        self.srv.clean()
@@ -398,6 +398,16 @@ class TestSuite_Request(unittest.TestCase):
         else:
             self.fail('Expected error')
 
+    def test_17_large_response(self):
+        size = 8 * 1024 * 1024
+        resp = self.con.eval("return string.rep('x', ...), 1", size)
+        self.assertEqual(len(resp[0]), size)
+        self.assertEqual(resp[1], 1)
+
+        # Small responses are read correctly after a large one.
+        for i in range(100):
+            self.assertSequenceEqual(self.con.eval("return ...", i), [i])
+
     @classmethod
     def tearDownClass(self):
         self.con.close()
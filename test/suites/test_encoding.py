@@ -194,6 +194,33 @@ class TestSuite_Encoding(unittest.TestCase):
         else:
             self.fail('Expected error')
 
+    def test_03_01_encoding_change_on_existing_connection(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test',
+                                   encoding='utf-8')
+        self.assertSequenceEqual(con.eval("return 'hello'"), ['hello'])
+
+        con.encoding = None
+        self.assertSequenceEqual(con.eval("return 'hello'"), [b'hello'])
+
+        con.encoding = 'utf-8'
+        self.assertSequenceEqual(con.eval("return 'hello'"), ['hello'])
+        con.close()
+
+    def test_03_02_request_packer_reused(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test',
+                                   encoding='utf-8')
+        packer = con._request_packer()
+        con.eval("return 'hello'")
+        self.assertIs(con._request_packer(), packer)
+
+        # Packer is rebuilt: str and bytes are packed differently now.
+        con.encoding = None
+        self.assertIsNot(con._request_packer(), packer)
+        self.assertSequenceEqual(con.eval("return ...", b'hello'), [b'hello'])
+        con.close()
+
     @classmethod
     def tearDownClass(self):
         for con in self.conns:
@@ -0,0 +1,182 @@
+import sys
+import socket
+import time
+import threading
+import unittest
+import concurrent.futures
+import tarantool
+from tarantool.error import DatabaseError, NetworkError
+
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_Future(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' FUTURE '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('future')
+            box.space['future']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+
+            fiber = require('fiber')
+            function sleep_and_return(delay, value)
+                fiber.sleep(delay)
+                return value
+            end
+
+            function push_values(...)
+                for _, v in ipairs({...}) do
+                    box.session.push(v)
+                end
+                return select('#', ...)
+            end
+        """)
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test')
+
+    def test_00_returns_future(self):
+        future = self.con.call_async('sleep_and_return', 0, 'value')
+        self.assertIsInstance(future, concurrent.futures.Future)
+        self.assertSequenceEqual(future.result(), ['value'])
+
+    def test_01_dml(self):
+        self.assertSequenceEqual(
+            self.con.insert_async('future', (1, 'a')).result(), [[1, 'a']])
+        self.assertSequenceEqual(
+            self.con.replace_async('future', (1, 'b')).result(), [[1, 'b']])
+        self.assertSequenceEqual(
+            self.con.update_async('future', 1, [('=', 2, 'c')]).result(), [[1, 'c']])
+        self.assertSequenceEqual(
+            self.con.upsert_async('future', (1, 'd'), [('=', 2, 'e')]).result(), [])
+        self.assertSequenceEqual(
+            self.con.select_async('future', 1).result(), [[1, 'e']])
+        self.assertSequenceEqual(
+            self.con.delete_async('future', 1).result(), [[1, 'e']])
+        self.assertSequenceEqual(
+            self.con.eval_async('return ...', 1, 2).result(), [1, 2])
+
+    def test_02_overlapping_requests(self):
+        start = time.time()
+        slow = self.con.call_async('sleep_and_return', 0.5, 'slow')
+        fast = self.con.call_async('sleep_and_return', 0.1, 'fast')
+        self.assertSequenceEqual(fast.result(), ['fast'])
+        self.assertFalse(slow.done())
+        self.assertSequenceEqual(slow.result(), ['slow'])
+        self.assertLess(time.time() - start, 1)
+
+    def test_03_error(self):
+        future = self.con.call_async('non_existing_function')
+        self.assertIsInstance(future.exception(), DatabaseError)
+        self.assertSequenceEqual(self.con.call('sleep_and_return', 0, 1), [1])
+
+    def test_04_threads_share_connection(self):
+        results = []
+
+        def worker(i):
+            for j in range(100):
+                resp = self.con.call('sleep_and_return', 0, [i, j])
+                results.append(resp[0] == [i, j])
+
+        # Start the background reader.
+        self.con.call_async('sleep_and_return', 0, None).result()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 800)
+        self.assertTrue(all(results))
+
+    def test_05_push(self):
+        pushed = []
+        def on_push(data, ctx):
+            ctx.append(data)
+
+        future = self.con.call_async('push_values', 1, 2,
+                                     on_push=on_push, on_push_ctx=pushed)
+        self.assertSequenceEqual(future.result(), [2])
+        self.assertEqual(pushed, [[1], [2]])
+
+    def test_06_schema_reload(self):
+        self.con.call_async('sleep_and_return', 0, None).result()
+        self.adm("box.schema.create_space('future_new'):create_index('pk')")
+
+        self.assertSequenceEqual(self.con.select_async('future', 100).result(), [])
+        self.assertSequenceEqual(
+            self.con.insert_async('future_new', (1,)).result(), [[1]])
+
+    def test_07_close_fails_pending(self):
+        future = self.con.call_async('sleep_and_return', 1, None)
+        self.con.close()
+        self.assertIsInstance(future.exception(), NetworkError)
+
+    def test_08_timeout(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test',
+                                   socket_timeout=0.1)
+        con.call_async('sleep_and_return', 0, None).result()
+        with self.assertRaises(NetworkError):
+            con.call('sleep_and_return', 0.5, None)
+        time.sleep(0.5)
+        self.assertSequenceEqual(con.call('sleep_and_return', 0, 1), [1])
+        con.close()
+
+    def test_09_reconnect(self):
+        self.con.call_async('sleep_and_return', 0, None).result()
+        reader = self.con._reader
+        # Break the connection under the running reader.
+        self.con._socket.shutdown(socket.SHUT_RDWR)
+
+        self.assertSequenceEqual(self.con.select('future', 100), [])
+        self.assertFalse(reader.is_alive())
+        self.assertSequenceEqual(
+            self.con.call_async('sleep_and_return', 0, 1).result(), [1])
+
+    def test_10_reader_starts_during_requests(self):
+        errors = []
+
+        def direct(i):
+            try:
+                for j in range(100):
+                    self.assertSequenceEqual(
+                        self.con.call('sleep_and_return', 0, [i, j]), [[i, j]])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=direct, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        # Start the reader while the other threads read the socket.
+        self.assertSequenceEqual(
+            self.con.call_async('sleep_and_return', 0, 1).result(), [1])
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+    def tearDown(self):
+        self.con.close()
+
+    @classmethod
+    def tearDownClass(self):
+        self.srv.stop()
+        self.srv.clean()
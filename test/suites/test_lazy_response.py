@@ -0,0 +1,112 @@
+import sys
+import unittest
+import tarantool
+from tarantool.error import DatabaseError
+
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_LazyResponse(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' LAZY RESPONSE '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('lazy')
+            box.space['lazy']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+            for i = 1, 100 do
+                box.space['lazy']:insert({i, 'value_' .. i})
+            end
+
+            function push_values(...)
+                for _, v in ipairs({...}) do
+                    box.session.push(v)
+                end
+                return select('#', ...)
+            end
+        """)
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test',
+                                        lazy_responses=True)
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+    def test_00_rows_by_index(self):
+        resp = self.con.select('lazy')
+        self.assertEqual(len(resp), 100)
+        self.assertEqual(resp.rowcount, 100)
+        self.assertSequenceEqual(resp[0], [1, 'value_1'])
+        self.assertSequenceEqual(resp[-1], [100, 'value_100'])
+        with self.assertRaises(IndexError):
+            resp[100]
+        # Body is still not decoded.
+        self.assertIsNotNone(resp._raw_body)
+
+    def test_01_data(self):
+        resp = self.con.select('lazy', 5)
+        self.assertSequenceEqual(resp.data, [[5, 'value_5']])
+        self.assertSequenceEqual(resp, [[5, 'value_5']])
+        self.assertSequenceEqual(resp[1:], [])
+        self.assertIsNone(resp._raw_body)
+
+    def test_02_same_as_eager(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test')
+        for args in (('lazy',), ('lazy', 1), ('lazy', 1000)):
+            lazy = self.con.select(*args)
+            eager = con.select(*args)
+            self.assertEqual(len(lazy), len(eager))
+            self.assertEqual(lazy.body, eager.body)
+            self.assertEqual(str(lazy), str(eager))
+        self.assertEqual(self.con.eval('return 1, nil, {}').data,
+                         con.eval('return 1, nil, {}').data)
+        con.close()
+
+    def test_03_errors_and_pushes(self):
+        with self.assertRaises(DatabaseError):
+            self.con.insert('lazy', (1, 'duplicate'))
+
+        pushed = []
+        def on_push(data, ctx):
+            ctx.append(data)
+
+        resp = self.con.call('push_values', 1, 2,
+                             on_push=on_push, on_push_ctx=pushed)
+        self.assertSequenceEqual(resp, [2])
+        self.assertEqual(pushed, [[1], [2]])
+
+    def test_04_execute(self):
+        resp = self.con.execute('select 1 as "x"')
+        self.assertSequenceEqual(resp, [[1]])
+        self.assertIsNone(resp.affected_row_count)
+
+    def test_05_rows_decoded_once(self):
+        resp = self.con.select('lazy')
+        rows = [resp[i] for i in range(len(resp))]
+        self.assertSequenceEqual(rows, [[i, 'value_%d' % i]
+                                        for i in range(1, 101)])
+        self.assertIs(resp[10], rows[10])
+        self.assertIsNotNone(resp._raw_body)
+
+        resp = self.con.eval('return 1, nil, 3')
+        self.assertSequenceEqual([resp[i] for i in range(len(resp))],
+                                 [1, None, 3])
+
+    @classmethod
+    def tearDownClass(self):
+        self.con.close()
+        self.srv.stop()
+        self.srv.clean()
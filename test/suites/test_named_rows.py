@@ -0,0 +1,127 @@
+import sys
+import unittest
+import tarantool
+from tarantool.rows import Row
+
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_NamedRows(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' NAMED ROWS '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('users', {format = {
+                {name = 'id', type = 'unsigned'},
+                {name = 'name', type = 'string'},
+                {name = 'count', type = 'unsigned', is_nullable = true},
+                {name = 'age', type = 'unsigned', is_nullable = true},
+            }})
+            box.space['users']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+            box.space['users']:insert({1, 'Alice', 3, 30})
+            box.space['users']:insert({2, 'Bob'})
+        """)
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test',
+                                        named_rows=True)
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+    def test_00_select(self):
+        row = self.con.select('users', 1)[0]
+        self.assertIsInstance(row, Row)
+        self.assertEqual(type(row).__name__, 'users')
+        self.assertEqual(row.id, 1)
+        self.assertEqual(row.name, 'Alice')
+        self.assertEqual(row.age, 30)
+        self.assertEqual(row[1], 'Alice')
+        self.assertEqual(row, (1, 'Alice', 3, 30))
+        self.assertEqual(repr(row), "users(id=1, name='Alice', count=3, age=30)")
+
+    def test_01_missing_fields(self):
+        row = self.con.select('users', 2)[0]
+        self.assertEqual(len(row), 2)
+        self.assertIsNone(row.age)
+        self.assertEqual(row._asdict(),
+                         {'id': 2, 'name': 'Bob', 'count': None, 'age': None})
+
+    def test_02_clashing_name(self):
+        # 'count' is a tuple method, the field is reachable by number.
+        row = self.con.select('users', 1)[0]
+        self.assertEqual(row.count(3), 1)
+        self.assertEqual(row._asdict()['count'], 3)
+
+    def test_03_class_is_cached(self):
+        first = self.con.select('users', 1)[0]
+        second = self.con.select('users', 2)[0]
+        self.assertIs(type(first), type(second))
+
+    def test_04_modification_requests(self):
+        row = self.con.replace('users', (3, 'Carol', None, 25))[0]
+        self.assertEqual(row.name, 'Carol')
+        row = self.con.update('users', 3, [('=', 3, 26)])[0]
+        self.assertEqual(row.age, 26)
+        row = self.con.delete('users', 3)[0]
+        self.assertEqual(row.id, 3)
+
+    def test_05_lazy_and_stream(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test',
+                                   named_rows=True, lazy_responses=True)
+        try:
+            resp = con.select('users')
+            self.assertEqual(resp[0].name, 'Alice')
+            self.assertEqual([row.name for row in resp], ['Alice', 'Bob'])
+            self.assertEqual([row.id for row in con.select_stream('users')],
+                             [1, 2])
+        finally:
+            con.close()
+
+    def test_06_call_is_not_wrapped(self):
+        resp = self.con.call('box.space.users:select', [1])
+        self.assertNotIsInstance(resp[0][0], Row)
+
+    def test_07_raw_is_not_wrapped(self):
+        resp = self.con.select('users', 1, raw=True)
+        self.assertIsInstance(resp.data[0], bytes)
+
+    def test_08_schema_reload(self):
+        old_class = type(self.con.select('users', 1)[0])
+        self.adm("box.space.users:format({"
+                 "{name = 'id', type = 'unsigned'},"
+                 "{name = 'login', type = 'string'},"
+                 "{name = 'count', type = 'unsigned', is_nullable = true},"
+                 "{name = 'age', type = 'unsigned', is_nullable = true}})")
+        self.con.update_schema(self.con.schema_version + 1)
+        row = self.con.select('users', 1)[0]
+        self.assertIsNot(type(row), old_class)
+        self.assertEqual(row.login, 'Alice')
+        self.assertFalse(hasattr(row, 'name'))
+
+    def test_09_disabled_by_default(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test')
+        try:
+            self.assertNotIsInstance(con.select('users', 1)[0], Row)
+        finally:
+            con.close()
+
+    @classmethod
+    def tearDownClass(self):
+        self.con.close()
+        self.srv.stop()
+        self.srv.clean()
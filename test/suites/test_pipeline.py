@@ -0,0 +1,174 @@
+import sys
+import unittest
+import tarantool
+from tarantool.error import DatabaseError
+
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_Pipeline(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' PIPELINE '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('pipeline')
+            box.space['pipeline']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+
+            fiber = require('fiber')
+            function sleep_and_return(delay, value)
+                fiber.sleep(delay)
+                return value
+            end
+
+            function push_values(...)
+                for _, v in ipairs({...}) do
+                    box.session.push(v)
+                end
+                return select('#', ...)
+            end
+        """)
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test')
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+    def test_00_unique_sync(self):
+        syncs = [self.con.generate_sync() for _ in range(10)]
+        self.assertEqual(len(set(syncs)), len(syncs))
+
+    def test_01_batch(self):
+        pipe = self.con.pipeline()
+        for i in range(1, 101):
+            pipe.insert('pipeline', (i, 'value_%d' % i))
+        for i in range(1, 101):
+            pipe.select('pipeline', i)
+        self.assertEqual(len(pipe), 200)
+
+        responses = pipe.flush()
+        self.assertEqual(len(responses), 200)
+        self.assertEqual(len(pipe), 0)
+        for i in range(1, 101):
+            self.assertSequenceEqual(responses[i - 1], [[i, 'value_%d' % i]])
+            self.assertSequenceEqual(responses[i + 99], [[i, 'value_%d' % i]])
+
+    def test_02_chaining(self):
+        responses = self.con.pipeline() \
+            .replace('pipeline', (200, 'a')) \
+            .update('pipeline', 200, [('=', 2, 'b')]) \
+            .select('pipeline', 200) \
+            .delete('pipeline', 200) \
+            .ping() \
+            .flush()
+        self.assertSequenceEqual(responses[2], [[200, 'b']])
+        self.assertSequenceEqual(responses[3], [[200, 'b']])
+        self.assertEqual(responses[4].return_code, 0)
+
+    def test_03_out_of_order_responses(self):
+        responses = self.con.pipeline() \
+            .call('sleep_and_return', 0.2, 'slow') \
+            .call('sleep_and_return', 0, 'fast') \
+            .eval('return ...', 'eval') \
+            .flush()
+        self.assertSequenceEqual(responses[0], ['slow'])
+        self.assertSequenceEqual(responses[1], ['fast'])
+        self.assertSequenceEqual(responses[2], ['eval'])
+
+    def test_04_error_does_not_break_batch(self):
+        pipe = self.con.pipeline() \
+            .replace('pipeline', (300, 'x')) \
+            .insert('pipeline', (300, 'duplicate')) \
+            .select('pipeline', 300)
+
+        responses = pipe.flush(return_exceptions=True)
+        self.assertSequenceEqual(responses[0], [[300, 'x']])
+        self.assertIsInstance(responses[1], DatabaseError)
+        self.assertSequenceEqual(responses[2], [[300, 'x']])
+
+        with self.assertRaises(DatabaseError):
+            self.con.pipeline() \
+                .insert('pipeline', (300, 'duplicate')) \
+                .select('pipeline', 300) \
+                .flush()
+
+        # Connection is still usable after an error in the batch.
+        self.assertSequenceEqual(self.con.select('pipeline', 300), [[300, 'x']])
+
+    def test_05_schema_reload(self):
+        self.con.ping()
+        pipe = self.con.pipeline().select('pipeline', 1)
+
+        self.adm("box.schema.create_space('pipeline_new'):create_index('pk')")
+
+        pipe.select('pipeline', 2)
+        responses = pipe.flush()
+        self.assertSequenceEqual(responses[0], [[1, 'value_1']])
+        self.assertSequenceEqual(responses[1], [[2, 'value_2']])
+        self.assertEqual(self.con.pipeline().insert('pipeline_new', (1,)).flush()[0],
+                         [[1]])
+
+    def test_06_push(self):
+        pushed = []
+        def on_push(data, ctx):
+            ctx.append(data)
+
+        responses = self.con.pipeline() \
+            .call('push_values', 1, 2, on_push=on_push, on_push_ctx=pushed) \
+            .ping() \
+            .flush()
+        self.assertSequenceEqual(responses[0], [2])
+        self.assertEqual(pushed, [[1], [2]])
+
+    def test_07_sql(self):
+        self.con.execute('create table pipeline_sql (id int primary key, val varchar(10))')
+        responses = self.con.pipeline() \
+            .execute('insert into pipeline_sql values (?, ?)', [1, 'a']) \
+            .execute('select * from pipeline_sql where id = :id', {'id': 1}) \
+            .flush()
+        self.assertEqual(responses[0].affected_row_count, 1)
+        self.assertSequenceEqual(responses[1], [[1, 'a']])
+
+    def test_08_large_requests(self):
+        data = 'x' * 1024 * 1024
+        pipe = self.con.pipeline()
+        for i in range(400, 410):
+            pipe.replace('pipeline', (i, data))
+        for response in pipe.flush():
+            self.assertEqual(len(response[0][1]), len(data))
+
+        self.assertEqual(self.con.select('pipeline', 405)[0][1], data)
+
+    def test_09_push_callback_error(self):
+        def on_push(data, ctx):
+            raise ValueError('push failed')
+
+        responses = self.con.pipeline() \
+            .call('push_values', 1, 2, on_push=on_push) \
+            .call('sleep_and_return', 0, 3) \
+            .flush(return_exceptions=True)
+        self.assertIsInstance(responses[0], ValueError)
+        self.assertSequenceEqual(responses[1], [3])
+
+        with self.assertRaises(ValueError):
+            self.con.call('push_values', 1, 2, on_push=on_push)
+        # The rest of the responses has been read.
+        self.assertSequenceEqual(self.con.call('sleep_and_return', 0, 4), [4])
+
+    @classmethod
+    def tearDownClass(self):
+        self.con.close()
+        self.srv.stop()
+        self.srv.clean()
@@ -1,4 +1,6 @@
+import socket
 import sys
+import threading
 import time
 import unittest
 import warnings
@@ -6,6 +8,7 @@ import warnings
 import tarantool
 from tarantool.error import (
     ClusterConnectWarning,
+    ConfigurationError,
     DatabaseError,
     NetworkError,
     NetworkWarning,
@@ -13,6 +16,8 @@ from tarantool.error import (
     PoolTolopogyWarning,
 )
 
+from tarantool.connection_pool import LatencyAwareStrategy, Status
+
 from .lib.skip import skip_or_run_sql_test
 from .lib.tarantool_server import TarantoolServer
 
@@ -563,6 +568,378 @@ class TestSuite_Pool(unittest.TestCase):
 
         self.assertEqual(self.pool.is_closed(), True)
 
+    def test_17_scan(self):
+        self.set_cluster_ro([False, False, False, False, False])
+
+        for addr in self.addrs:
+            conn = tarantool.connect(
+                host=addr['host'],
+                port=addr['port'],
+                user='test',
+                password='test')
+
+            try:
+                for i in range(10):
+                    conn.insert('test', ['test_17_scan_%d' % i, i])
+            finally:
+                conn.close()
+
+        self.set_cluster_ro([False, True, False, True, True])
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test')
+
+        self.assertSequenceEqual(
+            list(self.pool.scan('test', index='id', batch_size=3,
+                                mode=tarantool.Mode.RO)),
+            [['test_17_scan_%d' % i, i] for i in range(10)])
+        self.assertSequenceEqual(
+            list(self.pool.scan('test', 4, index='id', iterator='LT',
+                                batch_size=2, mode=tarantool.Mode.RO)),
+            [['test_17_scan_%d' % i, i] for i in range(3, -1, -1)])
+        self.pool.close()
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            raw_responses=True)
+
+        self.assertSequenceEqual(
+            list(self.pool.scan('test', index='id', batch_size=3,
+                                mode=tarantool.Mode.RO)),
+            [['test_17_scan_%d' % i, i] for i in range(10)])
+
+    def test_18_idle_pool_does_not_spin(self):
+        self.set_cluster_ro([False, True, True, True, True])
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            refresh_delay=0.2)
+
+        start = time.process_time()
+        time.sleep(1)
+        self.assertLess(time.process_time() - start, 0.5)
+
+        # Server states are still refreshed.
+        self.set_ro(self.servers[0], True)
+        self.set_ro(self.servers[1], False)
+
+        def expect_RW_request_execute_on_new_master():
+            self.assertSequenceEqual(
+                self.pool.eval('return box.cfg.listen', mode=tarantool.Mode.RW),
+                [ str(self.addrs[1]['port']) ])
+
+        self.retry(func=expect_RW_request_execute_on_new_master)
+
+    def test_19_concurrent_requests(self):
+        self.set_cluster_ro([False, True, True, True, True])
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            connections_per_instance=4)
+
+        results = {}
+
+        def request(i):
+            results[i] = self.pool.eval(
+                "require('fiber').sleep(0.2) return ...", i,
+                mode=tarantool.Mode.RW).data
+
+        threads = [threading.Thread(target=request, args=(i,))
+                   for i in range(8)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 8 requests on 4 connections to the single rw server.
+        self.assertLess(time.time() - start, 1.2)
+        self.assertEqual(results, {i: [i] for i in range(8)})
+
+    def test_20_connections_per_instance_bad_value(self):
+        with self.assertRaises(ConfigurationError):
+            tarantool.ConnectionPool(
+                addrs=self.addrs,
+                user='test',
+                password='test',
+                connections_per_instance=0)
+
+    def test_21_latency_aware_strategy(self):
+        self.set_cluster_ro([False, True, True, True, True])
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            strategy_class=LatencyAwareStrategy)
+
+        slow_port = str(self.addrs[1]['port'])
+        listens = []
+        for _ in range(30):
+            listens.append(self.pool.eval(
+                "if box.cfg.listen == ... then "
+                "    require('fiber').sleep(0.2) "
+                "end "
+                "return box.cfg.listen", slow_port,
+                mode=tarantool.Mode.RO).data[0])
+
+        # The slow server is not chosen after its first response.
+        self.assertLessEqual(listens.count(slow_port), 1)
+
+    def test_22_connect_quorum(self):
+        warnings.simplefilter('ignore', category=ClusterConnectWarning)
+
+        self.set_cluster_ro([False, True, True, True, True])
+        self.servers[3].stop()
+        self.servers[4].stop()
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            connect_quorum={tarantool.Mode.RW: 1, tarantool.Mode.RO: 1})
+
+        def healthy_count():
+            return sum(unit.state.status == Status.HEALTHY
+                       for unit in self.pool.pool.values())
+
+        self.assertGreaterEqual(healthy_count(), 2)
+        self.pool.ping(mode=tarantool.Mode.RW)
+        self.pool.ping(mode=tarantool.Mode.RO)
+
+        def expect_all_alive_servers_healthy():
+            self.assertEqual(healthy_count(), 3)
+
+        self.retry(func=expect_all_alive_servers_healthy)
+
+    def test_23_connect_quorum_bad_mode(self):
+        with self.assertRaises(ConfigurationError):
+            tarantool.ConnectionPool(
+                addrs=self.addrs,
+                user='test',
+                password='test',
+                connect_quorum={tarantool.Mode.PREFER_RO: 1})
+
+    def test_24_map_call(self):
+        self.set_cluster_ro([False, True, False, True, True])
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test')
+
+        keys = ['%s:%s' % (addr['host'], addr['port']) for addr in self.addrs]
+        results = self.pool.map_call('srv_id')
+        self.assertEqual({key: resp.data for key, resp in results.items()},
+                         {key: [i] for i, key in enumerate(keys)})
+
+        results = self.pool.map_call('srv_id', mode=tarantool.Mode.RW)
+        self.assertEqual(sorted(results), [keys[0], keys[2]])
+
+        total = self.pool.map_eval(
+            'return srv_id() + ...', 10, mode=tarantool.Mode.RO,
+            reduce=lambda results: sum(resp.data[0]
+                                       for resp in results.values()))
+        self.assertEqual(total, 1 + 3 + 4 + 30)
+
+        results = self.pool.map_select('test', mode=tarantool.Mode.RW)
+        self.assertEqual([resp.data for resp in results.values()], [[], []])
+
+        results = self.pool.map_call('box.error', 42)
+        self.assertEqual(sorted(results), sorted(keys))
+        for error in results.values():
+            self.assertIsInstance(error, DatabaseError)
+
+    def test_25_map_call_no_instances(self):
+        self.set_cluster_ro([True, True, True, True, True])
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test')
+
+        with self.assertRaisesRegex(PoolTolopogyError,
+                                    "Can't find healthy instance in pool"):
+            self.pool.map_call('srv_id', mode=tarantool.Mode.RW)
+
+    def test_26_refresh_during_long_request(self):
+        self.set_cluster_ro([False, True, True, True, True])
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            refresh_delay=0.1)
+
+        request = threading.Thread(
+            target=self.pool.eval,
+            args=("require('fiber').sleep(1.5)",),
+            kwargs={'mode': tarantool.Mode.RW})
+        request.start()
+        try:
+            self.set_ro(self.servers[0], True)
+            unit = self.pool.pool[self.pool._make_key(self.addrs[0])]
+            start = time.time()
+            # The state is refreshed while the request is in progress.
+            while unit.state.ro != True:
+                self.assertLess(time.time() - start, 1)
+                time.sleep(0.02)
+        finally:
+            request.join()
+
+    def test_27_latency_aware_strategy_hung_server(self):
+        self.set_cluster_ro([False, True, True, True, True])
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            strategy_class=LatencyAwareStrategy)
+        strategy = self.pool.strategy
+        strategy.decay_time = 0.1
+
+        # Send a request which hangs to the server.
+        hung = self.pool._make_key(self.addrs[1])
+        getnext = strategy.getnext
+        strategy.getnext = lambda mode: hung
+        request = threading.Thread(
+            target=self.pool.eval,
+            args=("require('fiber').sleep(3)",),
+            kwargs={'mode': tarantool.Mode.RO})
+        request.start()
+        try:
+            while strategy.stats.get(hung) is None:
+                time.sleep(0.01)
+            strategy.getnext = getnext
+
+            # The latency average decays, but the server stays expensive
+            # while its request is in flight.
+            hung_port = str(self.addrs[1]['port'])
+            start = time.time()
+            while time.time() - start < 1:
+                self.assertNotEqual(
+                    self.pool.eval('return box.cfg.listen',
+                                   mode=tarantool.Mode.RO).data[0],
+                    hung_port)
+                time.sleep(0.01)
+        finally:
+            strategy.getnext = getnext
+            request.join()
+
+    def test_28_scan_space_ids_differ(self):
+        self.set_cluster_ro([False, False, False, False, False])
+
+        for i, srv in enumerate(self.servers):
+            # Shift space ids on each server.
+            for j in range(i):
+                srv.admin("box.schema.space.create('test_28_%d')" % j)
+            srv.admin("box.schema.space.create('test_28')")
+            srv.admin("box.space.test_28:create_index('pk')")
+            srv.admin("box.schema.user.grant('test', 'read', 'space', 'test_28')")
+            srv.admin("for i = 1, 10 do box.space.test_28:insert({i}) end")
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test')
+
+        self.assertSequenceEqual(
+            list(self.pool.scan('test_28', batch_size=2,
+                                mode=tarantool.Mode.ANY)),
+            [[i] for i in range(1, 11)])
+
+    def test_29_latency_aware_strategy_request_tokens(self):
+        strategy = LatencyAwareStrategy({})
+        first = strategy.request_started('server')
+        second = strategy.request_started('server')
+
+        # A long request finished later forgets its own start.
+        strategy.request_finished('server', 10.0, None, second)
+        self.assertEqual(list(strategy.stats['server'].started), [first])
+        strategy.request_finished('server', 0.1, None, first)
+        self.assertEqual(strategy.stats['server'].in_flight, 0)
+
+    def test_30_requests_during_close(self):
+        self.set_cluster_ro([False, True, True, True, True])
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test')
+
+        futures = []
+        stop = threading.Event()
+
+        def submit():
+            key = self.pool._make_key(self.addrs[0])
+            while not stop.is_set():
+                try:
+                    futures.append(self.pool._submit(key, 'ping'))
+                except NetworkError:
+                    break
+
+        thread = threading.Thread(target=submit)
+        thread.start()
+        time.sleep(0.1)
+        self.pool.close()
+        stop.set()
+        thread.join()
+
+        # Each request taken by the pool is resolved.
+        for future in futures:
+            future.exception(timeout=1)
+
+    def test_31_connect_refresh_errors(self):
+        warnings.simplefilter('ignore', category=PoolTolopogyWarning)
+
+        self.pool = tarantool.ConnectionPool(
+            addrs=self.addrs,
+            user='test',
+            password='test',
+            connect_now=False)
+        get_new_state = self.pool._get_new_state
+
+        def fail(unit):
+            raise DatabaseError(1, 'box.info failed')
+
+        # An unexpected error marks the server unhealthy.
+        self.pool._get_new_state = fail
+        self.pool.connect()
+        self.assertTrue(all(unit.state.status == Status.UNHEALTHY
+                            for unit in self.pool.pool.values()))
+        self.pool.close()
+
+        def ssl_fail(unit):
+            raise tarantool.error.SslError('bad key file')
+
+        # A configuration error is raised by connect().
+        self.pool._get_new_state = ssl_fail
+        with self.assertRaises(tarantool.error.SslError):
+            self.pool.connect()
+        self.pool._get_new_state = get_new_state
+
+    def test_32_connect_timeout(self):
+        warnings.simplefilter('ignore', category=ClusterConnectWarning)
+        warnings.simplefilter('ignore', category=PoolTolopogyWarning)
+
+        # A server which accepts connections and never responds.
+        silent = socket.socket()
+        silent.bind(('127.0.0.1', 0))
+        silent.listen(1)
+        addrs = self.addrs + [{'host': '127.0.0.1',
+                               'port': silent.getsockname()[1]}]
+        try:
+            start = time.time()
+            self.pool = tarantool.ConnectionPool(
+                addrs=addrs,
+                user='test',
+                password='test',
+                connection_timeout=0.5)
+            self.assertLess(time.time() - start, 2)
+            self.pool.ping(mode=tarantool.Mode.ANY)
+            self.pool.close()
+        finally:
+            silent.close()
+
     def tearDown(self):
         if hasattr(self, 'pool'):
             self.pool.close()
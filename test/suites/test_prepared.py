@@ -0,0 +1,109 @@
+import sys
+import unittest
+import tarantool
+from tarantool.error import DatabaseError, SchemaError
+
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_Prepared(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' PREPARED '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('prepared')
+            box.space['prepared']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+            box.space['prepared']:create_index('secondary', {
+                type = 'tree',
+                parts = {2, 'string'},
+                unique = false})
+        """)
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test')
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+    def test_00_insert_replace(self):
+        insert = self.con.prepare_insert('prepared')
+        for i in range(1, 11):
+            self.assertSequenceEqual(insert((i, 'tag_%d' % (i % 2))),
+                                     [[i, 'tag_%d' % (i % 2)]])
+        with self.assertRaises(DatabaseError):
+            insert((1, 'duplicate'))
+
+        replace = self.con.prepare_replace('prepared')
+        self.assertSequenceEqual(replace((10, 'tag_0')), [[10, 'tag_0']])
+
+    def test_01_select(self):
+        select = self.con.prepare_select('prepared')
+        self.assertSequenceEqual(select(1), [[1, 'tag_1']])
+        self.assertSequenceEqual(select(100), [])
+        self.assertEqual(len(select()), 10)
+
+        select = self.con.prepare_select('prepared', 'secondary', limit=2)
+        self.assertSequenceEqual(select('tag_1'), [[1, 'tag_1'], [3, 'tag_1']])
+
+        select = self.con.prepare_select('prepared', iterator=tarantool.const.ITERATOR_GE,
+                                         offset=1,
+                                         limit=2)
+        self.assertSequenceEqual(select(5), [[6, 'tag_0'], [7, 'tag_1']])
+
+        select = self.con.prepare_select('prepared', iterator='GE', offset=1,
+                                         limit=2)
+        self.assertSequenceEqual(select(5), [[6, 'tag_0'], [7, 'tag_1']])
+
+        with self.assertRaises(ValueError):
+            self.con.prepare_select('prepared', iterator='BAD')
+
+    def test_02_delete(self):
+        delete = self.con.prepare_delete('prepared')
+        self.assertSequenceEqual(delete(10), [[10, 'tag_0']])
+        self.assertSequenceEqual(delete(10), [])
+
+    def test_03_unknown_space(self):
+        with self.assertRaises(SchemaError):
+            self.con.prepare_select('non_existing_space')
+        with self.assertRaises(SchemaError):
+            self.con.prepare_select('prepared', 'non_existing_index')
+
+    def test_04_schema_change(self):
+        self.adm("box.schema.create_space('prepared_new'):create_index('pk')")
+        select = self.con.prepare_select('prepared_new')
+        self.assertSequenceEqual(select(1), [])
+
+        # Recreate the space: its id changes.
+        self.adm("""
+            box.space['prepared_new']:drop()
+            box.schema.create_space('prepared_new'):create_index('pk')
+            box.space['prepared_new']:insert({1})
+        """)
+        self.con.update_schema(self.con.schema_version + 1)
+        self.assertSequenceEqual(select(1), [[1]])
+
+    def test_05_fetch_schema_false(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test',
+                                   fetch_schema=False)
+        with self.assertRaises(tarantool.error.NotSupportedError):
+            con.prepare_select('prepared')
+        con.close()
+
+    @classmethod
+    def tearDownClass(self):
+        self.con.close()
+        self.srv.stop()
+        self.srv.clean()
@@ -0,0 +1,114 @@
+import sys
+import unittest
+import msgpack
+import tarantool
+from tarantool.error import DatabaseError
+
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_RawResponse(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' RAW RESPONSE '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('raw')
+            box.space['raw']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+            for i = 1, 10 do
+                box.space['raw']:insert({i, 'value_' .. i})
+            end
+        """)
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test')
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+    def test_00_select(self):
+        resp = self.con.select('raw', raw=True)
+        self.assertEqual(len(resp), 10)
+        self.assertEqual(resp[0], msgpack.packb([1, 'value_1']))
+        self.assertEqual([msgpack.unpackb(row) for row in resp],
+                         self.con.select('raw').data)
+        self.assertEqual(msgpack.unpackb(resp.raw_data),
+                         self.con.select('raw').data)
+
+    def test_01_call_and_eval(self):
+        resp = self.con.eval('return 1, "two", {3}', raw=True)
+        self.assertEqual(resp.data, [b'\x01', b'\xa3two', b'\x91\x03'])
+        self.assertEqual(resp.raw_data, b'\x93\x01\xa3two\x91\x03')
+
+        resp = self.con.call('box.space.raw:get', 2, raw=True)
+        self.assertEqual([msgpack.unpackb(row) for row in resp],
+                         [[2, 'value_2']])
+
+    def test_02_execute(self):
+        resp = self.con.execute('select 1 as "x"', raw=True)
+        self.assertEqual(resp.data, [b'\x91\x01'])
+        # Metadata is decoded as usual.
+        self.assertIsNotNone(resp.body)
+
+    def test_03_not_raw_by_default(self):
+        resp = self.con.select('raw', 1)
+        self.assertSequenceEqual(resp, [[1, 'value_1']])
+        self.assertIsNone(resp.raw_data)
+        self.assertEqual(self.con._raw_syncs, set())
+
+    def test_04_connection_default(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test',
+                                   raw_responses=True)
+        # Schema is loaded with decoded responses.
+        resp = con.select('raw', 3)
+        self.assertEqual(resp.data, [msgpack.packb([3, 'value_3'])])
+        self.assertSequenceEqual(con.select('raw', 3, raw=False),
+                                 [[3, 'value_3']])
+        with self.assertRaises(DatabaseError):
+            con.insert('raw', (1, 'duplicate'))
+        con.close()
+
+    def test_05_async(self):
+        resp = self.con.select_async('raw', 4, raw=True).result()
+        self.assertEqual(resp.data, [msgpack.packb([4, 'value_4'])])
+
+    def test_06_abandoned_requests(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test',
+                                   socket_timeout=0.1)
+        con.eval_async('return 1').result()
+        with self.assertRaises(tarantool.error.NetworkError):
+            con.eval("require('fiber').sleep(0.5)", raw=True)
+        self.assertEqual(con._raw_syncs, set())
+
+        self.assertEqual(con.select('raw', 1, raw=True).data,
+                         [msgpack.packb([1, 'value_1'])])
+        self.assertEqual(con._raw_syncs, set())
+        con.close()
+
+    def test_07_encoded_not_sent(self):
+        request = self.con._request_eval('return 1', raw=True)
+        bytes(request)
+        bytes(request)
+        self.assertEqual(self.con._raw_syncs, set())
+
+        self.assertEqual(self.con._send_request(request).data, [b'\x01'])
+        self.assertEqual(self.con._raw_syncs, set())
+
+    @classmethod
+    def tearDownClass(self):
+        self.con.close()
+        self.srv.stop()
+        self.srv.clean()
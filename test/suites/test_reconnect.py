@@ -79,6 +79,33 @@ class TestSuite_Reconnect(unittest.TestCase):
         con.close()
         self.srv.stop()
 
+    def test_04_reconnect_on_lost_connection(self):
+        # Start a server and connect to it.
+        self.srv.start()
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'])
+        con.ping()
+
+        # Restart the server: the connection is lost.
+        self.srv.stop()
+        self.srv.start()
+
+        # Idempotent requests are sent again after reconnect.
+        self.assertIs(con.ping(notime=True), "Success")
+
+        # Restart the server again.
+        self.srv.stop()
+        self.srv.start()
+
+        # Other requests fail on a lost connection, the next request
+        # reconnects.
+        with self.assertRaises(tarantool.error.NetworkError):
+            con.eval('return 1')
+        self.assertSequenceEqual(con.eval('return 1'), [1])
+
+        # Close the connection and stop the server.
+        con.close()
+        self.srv.stop()
+
     @classmethod
     def tearDownClass(self):
         self.srv.clean()
@@ -0,0 +1,131 @@
+import sys
+import unittest
+import tarantool
+
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_Scan(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' SCAN '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('scan')
+            box.space['scan']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+            box.space['scan']:create_index('composite', {
+                type = 'tree',
+                parts = {2, 'string', 3, 'unsigned'},
+                unique = true})
+            box.space['scan']:create_index('group', {
+                type = 'tree',
+                parts = {2, 'string'},
+                unique = false})
+            box.space['scan']:create_index('hash', {
+                type = 'hash',
+                parts = {1, 'unsigned'},
+                unique = true})
+            for i = 1, 100 do
+                box.space['scan']:insert({i, 'group_' .. (i % 3), i})
+            end
+        """)
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test')
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+    def test_00_whole_space(self):
+        rows = list(self.con.scan('scan', batch_size=7))
+        self.assertEqual([row[0] for row in rows], list(range(1, 101)))
+
+    def test_01_exact_batches(self):
+        rows = list(self.con.scan('scan', batch_size=10))
+        self.assertEqual(len(rows), 100)
+
+    def test_02_composite_key(self):
+        rows = list(self.con.scan('scan', index='composite', batch_size=5))
+        self.assertEqual(rows, self.con.select('scan', index='composite').data)
+
+        rows = list(self.con.scan('scan', 'group_1', index='composite',
+                                  batch_size=4))
+        self.assertEqual(rows, self.con.select('scan', 'group_1',
+                                               index='composite').data)
+        self.assertTrue(all(row[1] == 'group_1' for row in rows))
+
+    def test_03_reverse(self):
+        rows = list(self.con.scan('scan', 50, iterator='LE', batch_size=8))
+        self.assertEqual([row[0] for row in rows], list(range(50, 0, -1)))
+
+        rows = list(self.con.scan('scan', 'group_2', index='composite',
+                                  iterator='REQ', batch_size=3))
+        self.assertEqual(rows, self.con.select('scan', 'group_2',
+                                               index='composite',
+                                               iterator=tarantool.const.ITERATOR_REQ).data)
+
+    def test_04_hash(self):
+        rows = list(self.con.scan('scan', index='hash', batch_size=9))
+        self.assertEqual(sorted(row[0] for row in rows), list(range(1, 101)))
+
+        with self.assertRaises(ValueError):
+            self.con.scan('scan', index='hash', iterator='LT')
+
+    def test_05_unsupported(self):
+        with self.assertRaises(ValueError):
+            self.con.scan('scan', index='group')
+        with self.assertRaises(ValueError):
+            self.con.scan('scan', iterator='OVERLAPS')
+        with self.assertRaises(tarantool.error.SchemaError):
+            self.con.scan('not_exist')
+
+    def test_06_lazy(self):
+        rows = iter(self.con.scan('scan', batch_size=10))
+        self.assertEqual(next(rows)[0], 1)
+        self.assertEqual(next(rows)[0], 2)
+
+    def test_07_raw_responses(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test',
+                                   raw_responses=True)
+        try:
+            rows = list(con.scan('scan', index='composite', batch_size=7))
+            self.assertEqual(rows,
+                             self.con.select('scan', index='composite').data)
+        finally:
+            con.close()
+
+    def test_08_nullable_index(self):
+        self.adm(r"""
+            box.schema.create_space('scan_nullable')
+            box.space['scan_nullable']:create_index('primary', {
+                parts = {1, 'unsigned'}})
+            box.space['scan_nullable']:create_index('nullable', {
+                parts = {{2, 'unsigned', is_nullable = true}},
+                unique = true})
+            for i = 1, 20 do
+                box.space['scan_nullable']:insert({i, i > 10 and i or nil})
+            end
+        """)
+        rows = list(self.con.scan('scan_nullable', index='nullable',
+                                  batch_size=3))
+        self.assertEqual(sorted(row[0] for row in rows), list(range(1, 21)))
+        self.assertEqual(rows, self.con.select('scan_nullable',
+                                               index='nullable').data)
+
+    @classmethod
+    def tearDownClass(self):
+        self.con.close()
+        self.srv.stop()
+        self.srv.clean()
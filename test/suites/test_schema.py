@@ -375,6 +375,39 @@ class TestSuite_Schema_Abstract(unittest.TestCase):
         self.srv.admin("box.schema.create_space('ttt22')")
         self.assertEqual(len(self.con.select('_space')), _space_len + 1)
 
+    def test_07_01_schema_reload_is_incremental(self):
+        self.con.flush_schema()
+        self.srv.admin("box.schema.create_space('reload_new')")
+        self.con.update_schema(self.con.schema_version + 1)
+
+        # Nothing is fetched until a space is used.
+        self.assertEqual(self.fetch_count, 0)
+        self.assertTrue(self.sch.schema['tester'].stale)
+
+        space = self.sch.get_space('tester')
+        self.assertFalse(space.stale)
+        self.assertEqual(self.fetch_count, 1)
+        self.assertIs(self.sch.get_space(space.sid), space)
+        # Indexes are fetched together with the space.
+        self.assertEqual(self.sch.get_index('tester', 'primary_index').iid, 0)
+        self.assertEqual(self.fetch_count, 1)
+        # Untouched spaces stay stale.
+        self.assertTrue(self.sch.schema['_space'].stale)
+
+        self.assertEqual(self.sch.get_space('reload_new').name, 'reload_new')
+
+    def test_07_02_schema_reload_dropped_space(self):
+        self.srv.admin("box.schema.create_space('reload_dropped')")
+        sid = self.sch.get_space('reload_dropped').sid
+        self.srv.admin("box.space.reload_dropped:drop()")
+        self.con.update_schema(self.con.schema_version + 1)
+
+        with self.assertRaisesRegex(tarantool.SchemaError,
+                'There\'s no space.*'):
+            self.sch.get_space('reload_dropped')
+        self.assertNotIn('reload_dropped', self.sch.schema)
+        self.assertNotIn(sid, self.sch.schema)
+
     # For schema fetch disable testing purposes.
     testing_methods = {
         'unavailable': {
@@ -541,6 +574,36 @@ class TestSuite_Schema_Abstract(unittest.TestCase):
         self._run_test_schema_fetch_disable(self.pool_con_schema_disable,
                                             mode=tarantool.Mode.ANY)
 
+    def test_09_lazy_schema(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   encoding=self.encoding, fetch_schema='lazy',
+                                   user='test', password='test')
+        try:
+            # Nothing is fetched on connect.
+            self.assertEqual(con.schema.schema, {})
+
+            self.assertEqual(con.select('tester', 1).data, [[1, None]])
+            self.assertIn('tester', con.schema.schema)
+            self.assertNotIn('_space', con.schema.schema)
+            self.assertEqual(
+                con.schema.get_index('tester', 'primary_index').iid, 0)
+
+            counter = MethodCallCounter(con.schema, 'fetch_space')
+            for _ in range(2):
+                with self.assertRaisesRegex(tarantool.SchemaError,
+                        'There\'s no space.*'):
+                    con.select('not_exist')
+            # Missing names are cached.
+            self.assertEqual(counter.call_count(), 1)
+            counter.unbind()
+        finally:
+            con.close()
+
+    def test_10_fetch_schema_bad_value(self):
+        with self.assertRaises(tarantool.error.ConfigurationError):
+            tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                 fetch_schema='eager', connect_now=False)
+
     @classmethod
     def tearDownClass(self):
         self.con.close()
@@ -0,0 +1,175 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import tarantool
+from tarantool.schema_cache import SchemaCache, SchemaRegistry
+
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_SchemaCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' SCHEMA CACHE '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('cached', {format = {
+                {name = 'id', type = 'unsigned'},
+                {name = 'name', type = 'string'},
+            }})
+            box.space['cached']:create_index('primary')
+            box.space['cached']:create_index('name', {parts = {2, 'string'}})
+            box.space['cached']:insert({1, 'one'})
+        """)
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def connect(self):
+        return tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                    user='test', password='test',
+                                    schema_cache_dir=self.cache_dir)
+
+    def test_00_write_and_read(self):
+        con = self.connect()
+        try:
+            self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+            self.assertNotEqual(con.schema_version, 0)
+        finally:
+            con.close()
+
+        con = self.connect()
+        try:
+            cache = SchemaCache(self.cache_dir)
+            self.assertIsNotNone(cache.read(con.uuid, 'test', con.schema_version))
+            space = con.schema.get_space('cached')
+            self.assertEqual(space.format['name']['id'], 1)
+            self.assertEqual(con.schema.get_index('cached', 'name').iid, 1)
+            self.assertEqual(con.select('cached', 'one', index='name').data,
+                             [[1, 'one']])
+        finally:
+            con.close()
+
+    def test_01_version_mismatch(self):
+        con = self.connect()
+        version = con.schema_version
+        con.close()
+
+        self.adm("box.schema.create_space('cached_new')")
+
+        con = self.connect()
+        try:
+            self.assertGreater(con.schema_version, version)
+            self.assertEqual(con.schema.get_space('cached_new').name,
+                             'cached_new')
+            cache = SchemaCache(self.cache_dir)
+            self.assertIsNone(cache.read(con.uuid, 'test', version))
+            self.assertIsNotNone(cache.read(con.uuid, 'test',
+                                            con.schema_version))
+        finally:
+            con.close()
+
+    def test_02_broken_file(self):
+        con = self.connect()
+        con.close()
+        path = SchemaCache(self.cache_dir).path(con.uuid, 'test')
+        with open(path, 'wb') as cache_file:
+            cache_file.write(b'\xc1 broken')
+
+        con = self.connect()
+        try:
+            self.assertEqual(con.schema.get_space('cached').name, 'cached')
+        finally:
+            con.close()
+
+    def test_03_no_cache_dir(self):
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test')
+        try:
+            self.assertEqual(os.listdir(self.cache_dir), [])
+            self.assertEqual(con.schema.get_space('cached').name, 'cached')
+        finally:
+            con.close()
+
+    def connect_shared(self, registry):
+        return tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                    user='test', password='test',
+                                    schema_registry=registry)
+
+    def test_04_registry(self):
+        registry = SchemaRegistry()
+        con1 = self.connect_shared(registry)
+        con2 = self.connect_shared(registry)
+        try:
+            self.assertTrue(con2.schema.shared)
+            self.assertIs(con1.schema.schema, con2.schema.schema)
+            self.assertEqual(con2.schema_version, con1.schema_version)
+            self.assertEqual(con2.select('cached', 'one', index='name').data,
+                             [[1, 'one']])
+        finally:
+            con1.close()
+            con2.close()
+
+    def test_05_registry_schema_change(self):
+        registry = SchemaRegistry()
+        con1 = self.connect_shared(registry)
+        con2 = self.connect_shared(registry)
+        try:
+            shared = con1.schema.schema
+            self.adm("box.schema.create_space('cached_shared')")
+
+            self.assertEqual(con1.select('cached', 1).data, [[1, 'one']])
+            self.assertIsNot(con1.schema.schema, shared)
+            self.assertNotIn('cached_shared', shared)
+
+            self.assertEqual(con2.select('cached', 1).data, [[1, 'one']])
+            self.assertIs(con1.schema.schema, con2.schema.schema)
+            self.assertEqual(con2.schema.get_space('cached_shared').name,
+                             'cached_shared')
+        finally:
+            con1.close()
+            con2.close()
+
+    def test_06_pool_registry(self):
+        pool = tarantool.ConnectionPool(
+            addrs=[{'host': self.srv.host, 'port': self.srv.args['primary']}],
+            user='test', password='test')
+        con = self.connect_shared(pool.schema_registry)
+        try:
+            unit = next(iter(pool.pool.values()))
+            self.assertIs(con.schema.schema, unit.conn.schema.schema)
+        finally:
+            con.close()
+            pool.close()
+
+    def test_07_registry_raw_responses(self):
+        registry = SchemaRegistry()
+        con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                   user='test', password='test',
+                                   schema_registry=registry,
+                                   raw_responses=True)
+        try:
+            self.assertTrue(con.schema.shared)
+            self.assertEqual(con.schema.get_space('cached').name, 'cached')
+        finally:
+            con.close()
+
+    @classmethod
+    def tearDownClass(self):
+        self.srv.stop()
+        self.srv.clean()
@@ -0,0 +1,69 @@
+import sys
+import unittest
+import tarantool
+from tarantool.response import StreamResponse
+
+from .lib.tarantool_server import TarantoolServer
+
+
+class TestSuite_SelectStream(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        print(' SELECT STREAM '.center(70, '='), file=sys.stderr)
+        print('-' * 70, file=sys.stderr)
+        self.srv = TarantoolServer()
+        self.srv.script = 'test/suites/box.lua'
+        self.srv.start()
+        self.adm = self.srv.admin
+        self.adm(r"""
+            box.schema.user.create('test', {password = 'test', if_not_exists = true})
+            box.schema.user.grant('test', 'read,write,execute,create', 'universe')
+
+            box.schema.create_space('stream')
+            box.space['stream']:create_index('primary', {
+                type = 'tree',
+                parts = {1, 'unsigned'},
+                unique = true})
+            for i = 1, 1000 do
+                box.space['stream']:insert({i, 'value_' .. i})
+            end
+        """)
+        self.con = tarantool.Connection(self.srv.host, self.srv.args['primary'],
+                                        user='test', password='test')
+
+    def setUp(self):
+        # prevent a remote tarantool from clean our session
+        if self.srv.is_started():
+            self.srv.touch_lock()
+
+    def test_00_iterate(self):
+        resp = self.con.select_stream('stream')
+        self.assertIsInstance(resp, StreamResponse)
+        rows = iter(resp)
+        self.assertSequenceEqual(next(rows), [1, 'value_1'])
+        self.assertSequenceEqual(list(rows)[-1], [1000, 'value_1000'])
+        # Iteration does not decode the whole body.
+        self.assertNotIn('_data', resp.__dict__)
+        self.assertEqual(len(resp), 1000)
+
+    def test_01_same_as_select(self):
+        for args, kwargs in ((('stream', 5), {}),
+                             (('stream', 500), {'iterator': 'GE', 'limit': 10}),
+                             (('stream', 10000), {})):
+            self.assertEqual(list(self.con.select_stream(*args, **kwargs)),
+                             self.con.select(*args, **kwargs).data)
+
+    def test_02_data(self):
+        resp = self.con.select_stream('stream', 7)
+        self.assertSequenceEqual(resp.data, [[7, 'value_7']])
+        self.assertSequenceEqual(list(resp), [[7, 'value_7']])
+
+    def test_03_unknown_space(self):
+        with self.assertRaises(tarantool.error.SchemaError):
+            self.con.select_stream('not_exist')
+
+    @classmethod
+    def tearDownClass(self):
+        self.con.close()
+        self.srv.stop()
+        self.srv.clean()
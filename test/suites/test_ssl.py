@@ -562,6 +562,15 @@ class TestSuite_Ssl(unittest.TestCase):
                 server_key_file=self.key_file,
                 server_cert_file=self.cert_file,
                 server_auth_type=AUTH_TYPE_PAP_SHA256),
+            SslTestCase(
+                name="key_crt_ca_server_and_client_invalid_key",
+                ok=False,
+                server_key_file=self.key_file,
+                server_cert_file=self.cert_file,
+                server_ca_file=self.ca_file,
+                client_key_file=self.invalid_file,
+                client_cert_file=self.cert_file,
+                client_ca_file=self.ca_file),
         ]
         for t in testcases:
             cnt = 5